@@ -1 +1 @@
-SELECT * FROM users WHERE email = 'lazar@test.com';
+SELECT * FROM users WHERE lower(email) = lower('lazar@test.com');
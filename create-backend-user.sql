@@ -5,4 +5,4 @@ VALUES (
   '$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5GyYjQQBvPse2',
   NOW(),
   NOW()
-) ON CONFLICT (email) DO NOTHING;
+) ON CONFLICT ((lower(email))) DO NOTHING;
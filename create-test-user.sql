@@ -1,6 +1,6 @@
 -- Create test user in backend users table
 -- Password: password123
--- Bcrypt hash generated with: python -c "from passlib.hash import bcrypt; print(bcrypt.hash('password123'))"
+-- Bcrypt hash generated with: python -c "import bcrypt; print(bcrypt.hashpw(b'password123', bcrypt.gensalt(12)).decode())"
 
 INSERT INTO users (id, email, password_hash, created_at, updated_at) 
 VALUES (
@@ -9,4 +9,4 @@ VALUES (
   '$2b$12$KIXxLQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5GyYjQQBv',
   NOW(),
   NOW()
-) ON CONFLICT (email) DO NOTHING;
+) ON CONFLICT ((lower(email))) DO NOTHING;
@@ -0,0 +1,133 @@
+"""
+Load test for mixed login + task CRUD traffic.
+[Task]: T-021 (Password Hashing Pool)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §6.2.5
+
+Login workers POST /api/auth/login in a loop (bcrypt-bound) while CRUD
+workers GET /api/{user_id}/tasks with a token obtained up front. The
+interesting number is CRUD latency under a login burst: with
+PASSWORD_HASH_WORKERS > 0 it should stay close to the CRUD-only run.
+
+Start the API, create the test user, then run:
+    uv run uvicorn src.main:app --port 8000
+    uv run python benchmarks/login_crud_load.py --email bench@example.com --password <pw> \\
+        --login-workers 16 --crud-workers 8 --seconds 30
+
+Run once with --login-workers 0 for the CRUD-only baseline. Turn rate
+limiting off (RATE_LIMIT_ENABLED=false) or every login past the burst
+is a 429.
+"""
+
+import argparse
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlparse
+
+
+def _connect(target):
+    return http.client.HTTPConnection(target.hostname, target.port or 80, timeout=30)
+
+
+def _login(target, email, password):
+    connection = _connect(target)
+    body = json.dumps({"email": email, "password": password}).encode()
+    connection.request("POST", "/api/auth/login", body=body, headers={"Content-Type": "application/json"})
+    response = connection.getresponse()
+    payload = json.loads(response.read())
+    connection.close()
+    if response.status != 200:
+        raise SystemExit(f"❌ Login failed ({response.status}): {payload}")
+    return payload["access_token"], payload["user"]["id"]
+
+
+def _worker(target, method, path, body, headers, deadline, results, lock):
+    connection = _connect(target)
+    latencies = []
+    statuses = {}
+
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except Exception:
+            statuses["error"] = statuses.get("error", 0) + 1
+            connection.close()
+            connection = _connect(target)
+            continue
+        latencies.append(time.perf_counter() - started)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+
+    connection.close()
+    with lock:
+        results["latencies"].extend(latencies)
+        for code, count in statuses.items():
+            results["statuses"][code] = results["statuses"].get(code, 0) + count
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+
+def _report(name, workers, results, elapsed):
+    latencies = sorted(results["latencies"])
+    print(f"📊 {name} x {workers} workers")
+    print(f"   requests:    {len(latencies)} {dict(sorted(results['statuses'].items(), key=str))}")
+    print(f"   req/sec:     {len(latencies) / elapsed:.1f}")
+    print(f"   latency p50: {_percentile(latencies, 0.50) * 1000:.2f} ms")
+    print(f"   latency p95: {_percentile(latencies, 0.95) * 1000:.2f} ms")
+    print(f"   latency p99: {_percentile(latencies, 0.99) * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mixed login + CRUD load test")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--email", required=True, help="Existing test user")
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--login-workers", type=int, default=16)
+    parser.add_argument("--crud-workers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    target = urlparse(args.url)
+    token, user_id = _login(target, args.email, args.password)
+
+    login_body = json.dumps({"email": args.email, "password": args.password}).encode()
+    login = {"latencies": [], "statuses": {}}
+    crud = {"latencies": [], "statuses": {}}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.seconds
+
+    threads = [
+        threading.Thread(target=_worker, args=(
+            target, "POST", "/api/auth/login", login_body,
+            {"Content-Type": "application/json"}, deadline, login, lock
+        ))
+        for _ in range(args.login_workers)
+    ] + [
+        threading.Thread(target=_worker, args=(
+            target, "GET", f"/api/{user_id}/tasks", None,
+            {"Authorization": f"Bearer {token}"}, deadline, crud, lock
+        ))
+        for _ in range(args.crud_workers)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    print(f"⏱️  {elapsed:.1f}s")
+    if args.login_workers:
+        _report("POST /api/auth/login", args.login_workers, login, elapsed)
+    _report("GET /api/{user_id}/tasks", args.crud_workers, crud, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Load test for the standalone MCP server: tool calls per second.
+[Task]: T-019 (Standalone MCP Server)
+[From]: specs/003-phase-iii-chatbot/plan.md §2.1.2
+
+Each worker keeps one HTTP/1.1 connection open and sends tools/call
+requests back to back for the test duration.
+
+Start the server, then run:
+    uv run python -m src.mcp.standalone --transport http --port 8765
+    uv run python benchmarks/mcp_load_test.py --token <JWT> --workers 16 --seconds 30
+
+Defaults to list_tasks; pass --tool/--arguments for another tool (note
+that mutating tools change the test user's data).
+"""
+
+import argparse
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlparse
+
+
+def _worker(url, token, tool, arguments, deadline, latencies, errors, lock):
+    target = urlparse(url)
+    connection = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=30)
+    headers = {"Content-Type": "application/json", "Authorization": f"Bearer {token}"}
+    local_latencies = []
+    local_errors = 0
+    request_id = 0
+
+    while time.perf_counter() < deadline:
+        request_id += 1
+        body = json.dumps({
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {"name": tool, "arguments": arguments}
+        }).encode()
+        started = time.perf_counter()
+        try:
+            connection.request("POST", target.path or "/mcp", body=body, headers=headers)
+            response = connection.getresponse()
+            payload = json.loads(response.read())
+            if response.status != 200 or "error" in payload or payload["result"]["isError"]:
+                local_errors += 1
+        except Exception:
+            local_errors += 1
+            connection.close()
+            connection = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=30)
+            continue
+        local_latencies.append(time.perf_counter() - started)
+
+    connection.close()
+    with lock:
+        latencies.extend(local_latencies)
+        errors.append(local_errors)
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP server load test")
+    parser.add_argument("--url", default="http://127.0.0.1:8765/mcp")
+    parser.add_argument("--token", required=True, help="JWT of the test user")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--tool", default="list_tasks")
+    parser.add_argument("--arguments", default='{"status": "pending"}', help="Tool arguments (JSON)")
+    args = parser.parse_args()
+
+    latencies, errors, lock = [], [], threading.Lock()
+    deadline = time.perf_counter() + args.seconds
+    threads = [
+        threading.Thread(
+            target=_worker,
+            args=(args.url, args.token, args.tool, json.loads(args.arguments), deadline, latencies, errors, lock)
+        )
+        for _ in range(args.workers)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"📊 {args.tool} x {args.workers} workers, {elapsed:.1f}s")
+    print(f"   calls:       {len(latencies)} ({sum(errors)} errors)")
+    print(f"   calls/sec:   {len(latencies) / elapsed:.1f}")
+    print(f"   latency p50: {_percentile(latencies, 0.50) * 1000:.2f} ms")
+    print(f"   latency p95: {_percentile(latencies, 0.95) * 1000:.2f} ms")
+    print(f"   latency p99: {_percentile(latencies, 0.99) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Database migration script: Rolling conversation summaries.
+[Task]: T-015 (History Window)
+[From]: specs/003-phase-iii-chatbot/spec.md §5.1, plan.md §2.1.4
+
+Chat turns used to resend the last 50 messages in full. The agent now
+sends a stored summary plus a token-budgeted window of recent messages.
+This script:
+- adds conversations.summary and conversations.summary_through_id
+- creates ix_messages_conversation_created ON messages(conversation_id, created_at DESC)
+  so the window is one index range scan
+- drops ix_messages_conversation_id (a prefix of the new index)
+
+Run with: uv run python migrations/add_conversation_summary.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlmodel import create_engine, text
+from src.config import settings
+
+
+def upgrade():
+    """Add summary columns and the history index."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    with engine.begin() as conn:
+        print("\n📋 Adding summary columns...")
+        conn.execute(text("""
+            ALTER TABLE conversations
+            ADD COLUMN IF NOT EXISTS summary TEXT NULL,
+            ADD COLUMN IF NOT EXISTS summary_through_id INTEGER NULL
+        """))
+        print("✓ Columns added: summary, summary_through_id")
+
+        print("\n📊 Creating history index...")
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_messages_conversation_created
+            ON messages(conversation_id, created_at DESC)
+        """))
+        print("✓ Index created: ix_messages_conversation_created")
+
+        conn.execute(text("DROP INDEX IF EXISTS ix_messages_conversation_id"))
+        print("✓ Dropped redundant index: ix_messages_conversation_id")
+
+    print("\n✅ Migration completed successfully!")
+    print("Chat history is now loaded as summary + recent window.")
+
+
+def downgrade():
+    """Drop summary columns and restore the old index (rollback)."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    print("\n⚠️  Rolling back migration...")
+    print("This will drop conversations.summary, conversations.summary_through_id")
+    print("and ix_messages_conversation_created.")
+
+    confirm = input("\nAre you sure you want to continue? (yes/no): ")
+    if confirm.lower() != "yes":
+        print("❌ Rollback cancelled.")
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_messages_conversation_id
+            ON messages(conversation_id)
+        """))
+        print("✓ Restored index: ix_messages_conversation_id")
+        conn.execute(text("DROP INDEX IF EXISTS ix_messages_conversation_created"))
+        print("✓ Dropped index: ix_messages_conversation_created")
+        conn.execute(text("""
+            ALTER TABLE conversations
+            DROP COLUMN IF EXISTS summary_through_id,
+            DROP COLUMN IF EXISTS summary
+        """))
+        print("✓ Dropped columns: summary, summary_through_id")
+
+    print("\n✅ Rollback completed successfully!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        try:
+            downgrade()
+        except Exception as e:
+            print(f"\n❌ Rollback error: {e}")
+            sys.exit(1)
+    else:
+        try:
+            upgrade()
+        except Exception as e:
+            print(f"\n❌ Migration error: {e}")
+            sys.exit(1)
@@ -0,0 +1,109 @@
+"""
+Database migration script: Partial indexes for reminder/overdue scans.
+[Task]: T-C-011
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §3.2,
+        specs/005-phase-v-cloud/phase5-cloud.plan.md §5.3
+
+get_due_reminders and get_overdue_tasks run on every cron tick across all
+users. reminder_time had no index at all, so each tick scanned the whole
+tasks table. This script creates partial indexes that only cover pending
+tasks with a timestamp set:
+- ix_tasks_pending_reminder ON tasks(reminder_time)
+  WHERE completed = false AND reminder_time IS NOT NULL
+- ix_tasks_pending_due ON tasks(due_date)
+  WHERE completed = false AND due_date IS NOT NULL
+
+The old global due_date indexes are dropped; per-user due_date lookups are
+served by ix_tasks_user_due.
+
+Run with: uv run python migrations/add_pending_reminder_indexes.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlmodel import create_engine, text
+from src.config import settings
+
+
+def upgrade():
+    """Create partial indexes for the reminder scheduler."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    with engine.begin() as conn:
+        print("\n📊 Creating partial indexes...")
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_tasks_pending_reminder
+            ON tasks(reminder_time)
+            WHERE completed = false AND reminder_time IS NOT NULL
+        """))
+        print("✓ Index created: ix_tasks_pending_reminder")
+
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_tasks_pending_due
+            ON tasks(due_date)
+            WHERE completed = false AND due_date IS NOT NULL
+        """))
+        print("✓ Index created: ix_tasks_pending_due")
+
+        print("\n🗑️  Dropping superseded due_date indexes...")
+        conn.execute(text("DROP INDEX IF EXISTS ix_tasks_due_date"))
+        conn.execute(text("DROP INDEX IF EXISTS idx_tasks_due_date"))
+        print("✓ Dropped: ix_tasks_due_date, idx_tasks_due_date")
+
+        conn.execute(text("ANALYZE tasks"))
+
+    print("\n✅ Migration completed successfully!")
+    print("Indexes created:")
+    print("  - ix_tasks_pending_reminder (reminder_time, pending only)")
+    print("  - ix_tasks_pending_due (due_date, pending only)")
+
+
+def downgrade():
+    """Drop partial scheduler indexes (rollback)."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    print("\n⚠️  Rolling back migration...")
+    print("This will drop ix_tasks_pending_reminder and ix_tasks_pending_due.")
+
+    confirm = input("\nAre you sure you want to continue? (yes/no): ")
+    if confirm.lower() != "yes":
+        print("❌ Rollback cancelled.")
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_due_date
+            ON tasks(due_date)
+            WHERE due_date IS NOT NULL
+        """))
+        print("✓ Index restored: idx_tasks_due_date")
+        conn.execute(text("DROP INDEX IF EXISTS ix_tasks_pending_reminder"))
+        conn.execute(text("DROP INDEX IF EXISTS ix_tasks_pending_due"))
+        print("✓ Dropped: ix_tasks_pending_reminder, ix_tasks_pending_due")
+
+    print("\n✅ Rollback completed successfully!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        try:
+            downgrade()
+        except Exception as e:
+            print(f"\n❌ Rollback error: {e}")
+            sys.exit(1)
+    else:
+        try:
+            upgrade()
+        except Exception as e:
+            print(f"\n❌ Migration error: {e}")
+            sys.exit(1)
@@ -0,0 +1,123 @@
+"""
+Database migration script: Precomputed next occurrence for recurring tasks.
+[Task]: T-C-013
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §2.1
+        specs/005-phase-v-cloud/phase5-cloud.plan.md §2.3
+
+Recurring tasks stored a RecurrencePattern but nothing ever produced the
+next instance. This script:
+- adds tasks.next_occurrence_at
+- creates the partial index ix_tasks_next_occurrence ON tasks(next_occurrence_at)
+  WHERE next_occurrence_at IS NOT NULL
+- backfills next_occurrence_at for pending recurring tasks, in batches
+
+Run with: uv run python migrations/add_recurrence_next_occurrence.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlmodel import Session, create_engine, select, text
+from src.config import settings
+from src.models.task import Task
+from src.services.recurrence import compute_next_occurrence
+
+
+BATCH_SIZE = 1000
+
+
+def upgrade():
+    """Add next_occurrence_at, its index, and backfill it."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    with engine.begin() as conn:
+        print("\n📋 Adding next_occurrence_at column...")
+        conn.execute(text("""
+            ALTER TABLE tasks
+            ADD COLUMN IF NOT EXISTS next_occurrence_at TIMESTAMP NULL
+        """))
+        print("✓ Column added: next_occurrence_at")
+
+        print("\n📊 Creating partial index...")
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_tasks_next_occurrence
+            ON tasks(next_occurrence_at)
+            WHERE next_occurrence_at IS NOT NULL
+        """))
+        print("✓ Index created: ix_tasks_next_occurrence")
+
+    print("\n🔁 Backfilling pending recurring tasks...")
+    engine.echo = False
+    backfilled = 0
+    last_id = 0
+    with Session(engine) as session:
+        while True:
+            tasks = session.exec(
+                select(Task)
+                .where(
+                    Task.id > last_id,
+                    Task.is_recurring == True,
+                    Task.completed == False
+                )
+                .order_by(Task.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not tasks:
+                break
+
+            for task in tasks:
+                task.next_occurrence_at = compute_next_occurrence(task)
+                session.add(task)
+            session.commit()
+
+            backfilled += len(tasks)
+            last_id = tasks[-1].id
+            print(f"✓ Backfilled: {backfilled}")
+
+    print("\n✅ Migration completed successfully!")
+    print("Recurring tasks now carry a precomputed next_occurrence_at.")
+
+
+def downgrade():
+    """Drop next_occurrence_at (rollback)."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    print("\n⚠️  Rolling back migration...")
+    print("This will drop tasks.next_occurrence_at and ix_tasks_next_occurrence.")
+
+    confirm = input("\nAre you sure you want to continue? (yes/no): ")
+    if confirm.lower() != "yes":
+        print("❌ Rollback cancelled.")
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS ix_tasks_next_occurrence"))
+        print("✓ Dropped index: ix_tasks_next_occurrence")
+        conn.execute(text("ALTER TABLE tasks DROP COLUMN IF EXISTS next_occurrence_at"))
+        print("✓ Dropped column: next_occurrence_at")
+
+    print("\n✅ Rollback completed successfully!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        try:
+            downgrade()
+        except Exception as e:
+            print(f"\n❌ Rollback error: {e}")
+            sys.exit(1)
+    else:
+        try:
+            upgrade()
+        except Exception as e:
+            print(f"\n❌ Migration error: {e}")
+            sys.exit(1)
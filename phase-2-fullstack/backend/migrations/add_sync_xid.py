@@ -0,0 +1,94 @@
+"""
+Database migration script: commit-ordered delta sync.
+[Task]: T-028 (Delta Sync)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+
+Delta sync compares the writing transaction's id against the xmin of the
+previous read's snapshot instead of updated_at (see services/task_sync.py).
+This script:
+- adds tasks.sync_xid and task_tombstones.sync_xid BIGINT NOT NULL
+  (existing rows get 0; new rows default to txid_current())
+- adds indexes (user_id, sync_xid) on both tables
+
+Clients holding an old (updated_at based) token get 410 and resync once.
+
+Run with: uv run python migrations/add_sync_xid.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlmodel import create_engine, text
+from src.config import settings
+
+TABLES = ("tasks", "task_tombstones")
+
+
+def upgrade():
+    """Add the sync_xid columns and indexes."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    with engine.begin() as conn:
+        for table in TABLES:
+            print(f"\n📋 Adding {table}.sync_xid...")
+            conn.execute(text(f"""
+                ALTER TABLE {table}
+                ADD COLUMN IF NOT EXISTS sync_xid BIGINT NOT NULL DEFAULT 0
+            """))
+            conn.execute(text(f"""
+                ALTER TABLE {table}
+                ALTER COLUMN sync_xid SET DEFAULT txid_current()
+            """))
+            conn.execute(text(f"""
+                CREATE INDEX IF NOT EXISTS ix_{table}_user_sync_xid
+                ON {table} (user_id, sync_xid)
+            """))
+            print(f"✓ Column and index added: {table}.sync_xid")
+
+    print("\n✅ Migration completed successfully!")
+    print("Delta sync is now ordered by transaction, not by updated_at.")
+
+
+def downgrade():
+    """Drop the sync_xid columns (rollback)."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    print("\n⚠️  Rolling back migration...")
+    print("This will drop sync_xid; deploy code with updated_at based sync first.")
+
+    confirm = input("\nAre you sure you want to continue? (yes/no): ")
+    if confirm.lower() != "yes":
+        print("❌ Rollback cancelled.")
+        return
+
+    with engine.begin() as conn:
+        for table in TABLES:
+            conn.execute(text(f"DROP INDEX IF EXISTS ix_{table}_user_sync_xid"))
+            conn.execute(text(f"ALTER TABLE {table} DROP COLUMN IF EXISTS sync_xid"))
+            print(f"✓ Dropped column: {table}.sync_xid")
+
+    print("\n✅ Rollback completed successfully!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        try:
+            downgrade()
+        except Exception as e:
+            print(f"\n❌ Rollback error: {e}")
+            sys.exit(1)
+    else:
+        try:
+            upgrade()
+        except Exception as e:
+            print(f"\n❌ Migration error: {e}")
+            sys.exit(1)
@@ -0,0 +1,120 @@
+"""
+Database migration script: Composite indexes for list_tasks.
+[Task]: T-B-013
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1.2-5.1.4
+        specs/005-phase-v-cloud/phase5-cloud.plan.md §4.1
+
+list_tasks always filters by user_id and then sorts by one column, so
+single-column indexes force Postgres to either sort in memory or scan
+another index and filter. This script replaces them with a set of
+composite indexes led by user_id, one per supported sort path:
+- ix_tasks_user_created (user_id, created_at DESC)
+- ix_tasks_user_completed_created (user_id, completed, created_at DESC)
+- ix_tasks_user_updated (user_id, updated_at DESC)
+- ix_tasks_user_due (user_id, due_date)
+- ix_tasks_user_priority (user_id, priority)
+- ix_tasks_user_title (user_id, title)
+
+Run with: uv run python migrations/add_task_composite_indexes.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlmodel import create_engine, text
+from src.config import settings
+
+
+COMPOSITE_INDEXES = {
+    "ix_tasks_user_created": "tasks(user_id, created_at DESC)",
+    "ix_tasks_user_completed_created": "tasks(user_id, completed, created_at DESC)",
+    "ix_tasks_user_updated": "tasks(user_id, updated_at DESC)",
+    "ix_tasks_user_due": "tasks(user_id, due_date)",
+    "ix_tasks_user_priority": "tasks(user_id, priority)",
+    "ix_tasks_user_title": "tasks(user_id, title)",
+}
+
+# Superseded single-column indexes (created by SQLModel or earlier migrations).
+# user_id is covered by the leading column of every composite index.
+REDUNDANT_INDEXES = [
+    "ix_tasks_user_id",
+    "ix_tasks_priority",
+    "ix_tasks_is_recurring",
+    "ix_tasks_created_at",
+    "idx_tasks_priority",
+    "idx_tasks_is_recurring",
+]
+
+
+def upgrade():
+    """Create composite list_tasks indexes and drop redundant ones."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    with engine.begin() as conn:
+        print("\n📊 Creating composite indexes...")
+        for name, definition in COMPOSITE_INDEXES.items():
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}"))
+            print(f"✓ Index created: {name}")
+
+        print("\n🗑️  Dropping redundant single-column indexes...")
+        for name in REDUNDANT_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            print(f"✓ Dropped index: {name}")
+
+        conn.execute(text("ANALYZE tasks"))
+
+    print("\n✅ Migration completed successfully!")
+    print("Indexes created:")
+    for name, definition in COMPOSITE_INDEXES.items():
+        print(f"  - {name} ON {definition}")
+
+
+def downgrade():
+    """Restore single-column indexes (rollback)."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    print("\n⚠️  Rolling back migration...")
+    print("This will drop the composite list_tasks indexes.")
+
+    confirm = input("\nAre you sure you want to continue? (yes/no): ")
+    if confirm.lower() != "yes":
+        print("❌ Rollback cancelled.")
+        return
+
+    with engine.begin() as conn:
+        print("\n📊 Restoring single-column indexes...")
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_user_id ON tasks(user_id)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_priority ON tasks(priority)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_is_recurring ON tasks(is_recurring)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_created_at ON tasks(created_at)"))
+
+        print("🗑️  Dropping composite indexes...")
+        for name in COMPOSITE_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            print(f"✓ Dropped index: {name}")
+
+    print("\n✅ Rollback completed successfully!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        try:
+            downgrade()
+        except Exception as e:
+            print(f"\n❌ Rollback error: {e}")
+            sys.exit(1)
+    else:
+        try:
+            upgrade()
+        except Exception as e:
+            print(f"\n❌ Migration error: {e}")
+            sys.exit(1)
@@ -0,0 +1,76 @@
+"""
+Database migration script: Task row versions for optimistic concurrency.
+[Task]: T-029 (Optimistic Concurrency)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1
+
+Task writes are UPDATE ... WHERE id = ? AND version = ?, and PUT/PATCH/
+DELETE take If-Match with the task's ETag. This script:
+- adds tasks.version INTEGER NOT NULL DEFAULT 1
+
+Run with: uv run python migrations/add_task_version.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlmodel import create_engine, text
+from src.config import settings
+
+
+def upgrade():
+    """Add the version column."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    with engine.begin() as conn:
+        print("\n📋 Adding version column...")
+        conn.execute(text("""
+            ALTER TABLE tasks
+            ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1
+        """))
+        print("✓ Column added: version")
+
+    print("\n✅ Migration completed successfully!")
+    print("Task updates now support If-Match and answer 412 on conflicts.")
+
+
+def downgrade():
+    """Drop the version column (rollback)."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    print("\n⚠️  Rolling back migration...")
+    print("This will drop tasks.version; deploy code without optimistic concurrency first.")
+
+    confirm = input("\nAre you sure you want to continue? (yes/no): ")
+    if confirm.lower() != "yes":
+        print("❌ Rollback cancelled.")
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE tasks DROP COLUMN IF EXISTS version"))
+        print("✓ Dropped column: version")
+
+    print("\n✅ Rollback completed successfully!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        try:
+            downgrade()
+        except Exception as e:
+            print(f"\n❌ Rollback error: {e}")
+            sys.exit(1)
+    else:
+        try:
+            upgrade()
+        except Exception as e:
+            print(f"\n❌ Migration error: {e}")
+            sys.exit(1)
@@ -0,0 +1,76 @@
+"""
+Database migration script: Per-user data version for conditional GET.
+[Task]: T-025 (Conditional GET)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+
+Task, tag and stats reads answer If-None-Match from a per-user version
+stamp that every task/tag write bumps. This script:
+- adds users.data_version BIGINT NOT NULL DEFAULT 0
+
+Run with: uv run python migrations/add_user_data_version.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlmodel import create_engine, text
+from src.config import settings
+
+
+def upgrade():
+    """Add the data_version column."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    with engine.begin() as conn:
+        print("\n📋 Adding data version column...")
+        conn.execute(text("""
+            ALTER TABLE users
+            ADD COLUMN IF NOT EXISTS data_version BIGINT NOT NULL DEFAULT 0
+        """))
+        print("✓ Column added: data_version")
+
+    print("\n✅ Migration completed successfully!")
+    print("Task, tag and stats reads now support If-None-Match.")
+
+
+def downgrade():
+    """Drop the data_version column (rollback)."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    print("\n⚠️  Rolling back migration...")
+    print("This will drop users.data_version.")
+
+    confirm = input("\nAre you sure you want to continue? (yes/no): ")
+    if confirm.lower() != "yes":
+        print("❌ Rollback cancelled.")
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE users DROP COLUMN IF EXISTS data_version"))
+        print("✓ Dropped column: data_version")
+
+    print("\n✅ Rollback completed successfully!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        try:
+            downgrade()
+        except Exception as e:
+            print(f"\n❌ Rollback error: {e}")
+            sys.exit(1)
+    else:
+        try:
+            upgrade()
+        except Exception as e:
+            print(f"\n❌ Migration error: {e}")
+            sys.exit(1)
@@ -0,0 +1,101 @@
+"""
+Database migration script: Case-insensitive unique emails.
+[Task]: T-024 (Case-Insensitive Email)
+[From]: spec.md §6.1, §7.1
+
+Register and login look users up by lower(email). This script:
+- stops if existing accounts differ only by email case (they must be
+  merged or renamed by hand first; each owns its own tasks)
+- creates the unique index ux_users_lower_email on lower(email)
+- drops the case-sensitive users_email_key constraint and ix_users_email
+  index, which the new index supersedes
+
+Run with: uv run python migrations/add_users_lower_email_index.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlmodel import create_engine, text
+from src.config import settings
+
+
+def upgrade():
+    """Replace exact-match email uniqueness with lower(email)."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    with engine.begin() as conn:
+        print("\n🔍 Checking for emails that differ only by case...")
+        duplicates = conn.execute(text("""
+            SELECT lower(email) AS email, COUNT(*) AS accounts
+            FROM users
+            GROUP BY lower(email)
+            HAVING COUNT(*) > 1
+        """)).all()
+        if duplicates:
+            for row in duplicates:
+                print(f"  - {row.email}: {row.accounts} accounts")
+            raise RuntimeError(
+                f"{len(duplicates)} email(s) have case-only duplicates; resolve them and re-run"
+            )
+        print("✓ No duplicates")
+
+        print("\n📊 Creating indexes...")
+        conn.execute(text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS ux_users_lower_email
+            ON users(lower(email))
+        """))
+        print("✓ Index created: ux_users_lower_email")
+
+        print("\n🗑️  Dropping case-sensitive email uniqueness...")
+        conn.execute(text("ALTER TABLE users DROP CONSTRAINT IF EXISTS users_email_key"))
+        conn.execute(text("DROP INDEX IF EXISTS ix_users_email"))
+        print("✓ Dropped: users_email_key, ix_users_email")
+
+    print("\n✅ Migration completed successfully!")
+    print("Emails are now unique case-insensitively.")
+
+
+def downgrade():
+    """Restore exact-match email uniqueness (rollback)."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    print("\n⚠️  Rolling back migration...")
+    print("This will drop ux_users_lower_email and restore ix_users_email (unique).")
+
+    confirm = input("\nAre you sure you want to continue? (yes/no): ")
+    if confirm.lower() != "yes":
+        print("❌ Rollback cancelled.")
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users(email)"))
+        print("✓ Index created: ix_users_email")
+        conn.execute(text("DROP INDEX IF EXISTS ux_users_lower_email"))
+        print("✓ Dropped index: ux_users_lower_email")
+
+    print("\n✅ Rollback completed successfully!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        try:
+            downgrade()
+        except Exception as e:
+            print(f"\n❌ Rollback error: {e}")
+            sys.exit(1)
+    else:
+        try:
+            upgrade()
+        except Exception as e:
+            print(f"\n❌ Migration error: {e}")
+            sys.exit(1)
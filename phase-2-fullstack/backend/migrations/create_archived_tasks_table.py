@@ -0,0 +1,126 @@
+"""
+Database migration script: Archive tier for completed tasks.
+[Task]: T-030 (Task Archive)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+
+POST /api/jobs/archive-completed moves long-completed tasks out of the
+hot tasks table. This script:
+- creates archived_tasks with the same columns as tasks (CREATE TABLE
+  ... LIKE tasks, so column types match exactly for INSERT ... SELECT and
+  UNION ALL), plus tag_ids JSONB and archived_at
+- ix_archived_tasks_user_created ON archived_tasks(user_id, created_at DESC)
+- ix_tasks_completed_updated ON tasks(updated_at) WHERE completed = true,
+  which the archiver scans
+
+Run with: uv run python migrations/create_archived_tasks_table.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlmodel import create_engine, text
+from src.config import settings
+
+
+def upgrade():
+    """Create archived_tasks and the archiver's index."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    with engine.begin() as conn:
+        table_exists = conn.execute(text("""
+            SELECT EXISTS (
+                SELECT FROM information_schema.tables
+                WHERE table_name = 'archived_tasks'
+            )
+        """)).scalar()
+
+        if not table_exists:
+            print("\n📋 Creating archived_tasks table...")
+            # No INCLUDING DEFAULTS: ids are copied, never drawn from tasks' sequence
+            conn.execute(text("CREATE TABLE archived_tasks (LIKE tasks)"))
+            conn.execute(text("""
+                ALTER TABLE archived_tasks
+                ADD COLUMN tag_ids JSONB NOT NULL DEFAULT '[]'::jsonb,
+                ADD COLUMN archived_at TIMESTAMP NOT NULL DEFAULT (NOW() AT TIME ZONE 'utc'),
+                ADD PRIMARY KEY (id),
+                ADD FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+            """))
+            print("✓ Table created: archived_tasks")
+        else:
+            print("⚠️  Table 'archived_tasks' already exists, skipping...")
+
+        print("\n📊 Creating indexes...")
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_archived_tasks_user_created
+            ON archived_tasks(user_id, created_at DESC)
+        """))
+        print("✓ Index created: ix_archived_tasks_user_created")
+
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_tasks_completed_updated
+            ON tasks(updated_at)
+            WHERE completed = true
+        """))
+        print("✓ Index created: ix_tasks_completed_updated")
+
+    print("\n✅ Migration completed successfully!")
+    print("Schedule POST /api/jobs/archive-completed daily to start archiving.")
+
+
+def downgrade():
+    """Move archived tasks back and drop archived_tasks (rollback)."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    print("\n⚠️  Rolling back migration...")
+    print("This will move every archived task back to tasks (tag links are not restored)")
+    print("and drop archived_tasks and ix_tasks_completed_updated.")
+
+    confirm = input("\nAre you sure you want to continue? (yes/no): ")
+    if confirm.lower() != "yes":
+        print("❌ Rollback cancelled.")
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO tasks (
+                id, user_id, title, description, completed, priority, due_date,
+                reminder_time, is_recurring, recurrence_pattern, next_occurrence_at,
+                created_at, updated_at, version
+            )
+            SELECT
+                id, user_id, title, description, completed, priority, due_date,
+                reminder_time, is_recurring, recurrence_pattern, next_occurrence_at,
+                created_at, updated_at, version
+            FROM archived_tasks
+            ON CONFLICT (id) DO NOTHING
+        """))
+        print("✓ Archived tasks restored")
+        conn.execute(text("DROP TABLE IF EXISTS archived_tasks"))
+        conn.execute(text("DROP INDEX IF EXISTS ix_tasks_completed_updated"))
+        print("✓ Dropped: archived_tasks, ix_tasks_completed_updated")
+
+    print("\n✅ Rollback completed successfully!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        try:
+            downgrade()
+        except Exception as e:
+            print(f"\n❌ Rollback error: {e}")
+            sys.exit(1)
+    else:
+        try:
+            upgrade()
+        except Exception as e:
+            print(f"\n❌ Migration error: {e}")
+            sys.exit(1)
@@ -0,0 +1,93 @@
+"""
+Database migration script: Task tombstones for delta sync.
+[Task]: T-028 (Delta Sync)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+
+GET /api/{user_id}/tasks/changes reports deletions from tombstones
+written by every delete path. This script:
+- creates task_tombstones (task_id, user_id, deleted_at)
+- indexes it by (user_id, deleted_at) for sync and deleted_at for pruning
+
+Run with: uv run python migrations/create_task_tombstones_table.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlmodel import create_engine, text
+from src.config import settings
+
+
+def upgrade():
+    """Create the task_tombstones table and its indexes."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    with engine.begin() as conn:
+        print("\n📋 Creating task_tombstones table...")
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS task_tombstones (
+                id SERIAL PRIMARY KEY,
+                task_id INTEGER NOT NULL,
+                user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+                deleted_at TIMESTAMP NOT NULL DEFAULT (NOW() AT TIME ZONE 'utc')
+            )
+        """))
+        print("✓ Table created: task_tombstones")
+
+        print("\n📊 Creating indexes...")
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_task_tombstones_user_deleted
+            ON task_tombstones (user_id, deleted_at)
+        """))
+        print("✓ Index created: ix_task_tombstones_user_deleted")
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_task_tombstones_deleted_at
+            ON task_tombstones (deleted_at)
+        """))
+        print("✓ Index created: ix_task_tombstones_deleted_at")
+
+    print("\n✅ Migration completed successfully!")
+    print("GET /api/{user_id}/tasks/changes now reports deleted tasks.")
+
+
+def downgrade():
+    """Drop the task_tombstones table (rollback)."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    print("\n⚠️  Rolling back migration...")
+    print("This will drop task_tombstones; sync clients will miss deletions until they refetch.")
+
+    confirm = input("\nAre you sure you want to continue? (yes/no): ")
+    if confirm.lower() != "yes":
+        print("❌ Rollback cancelled.")
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS task_tombstones"))
+        print("✓ Dropped table: task_tombstones")
+
+    print("\n✅ Rollback completed successfully!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        try:
+            downgrade()
+        except Exception as e:
+            print(f"\n❌ Rollback error: {e}")
+            sys.exit(1)
+    else:
+        try:
+            upgrade()
+        except Exception as e:
+            print(f"\n❌ Migration error: {e}")
+            sys.exit(1)
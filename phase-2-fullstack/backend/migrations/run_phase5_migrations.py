@@ -7,6 +7,17 @@ Runs all Phase V migrations in the correct order:
 1. Add advanced task fields
 2. Create tags tables
 3. Create event_log table
+4. Scope tag names per user
+5. Composite indexes for list_tasks
+6. Partial indexes for reminder/overdue scans
+7. Precomputed next occurrence for recurring tasks
+8. Rolling conversation summaries and history index
+9. Case-insensitive unique emails
+10. Per-user data version (ETags)
+11. Task tombstones (delta sync)
+12. Task row versions (optimistic concurrency)
+13. Archive tier for completed tasks
+14. Commit-ordered delta sync (sync_xid)
 
 Run with: uv run python migrations/run_phase5_migrations.py
 """
@@ -46,7 +57,18 @@ def main():
     migrations = [
         "add_advanced_task_fields.py",
         "create_tags_tables.py",
-        "create_event_log_table.py"
+        "create_event_log_table.py",
+        "scope_tags_per_user.py",
+        "add_task_composite_indexes.py",
+        "add_pending_reminder_indexes.py",
+        "add_recurrence_next_occurrence.py",
+        "add_conversation_summary.py",
+        "add_users_lower_email_index.py",
+        "add_user_data_version.py",
+        "create_task_tombstones_table.py",
+        "add_task_version.py",
+        "create_archived_tasks_table.py",
+        "add_sync_xid.py"
     ]
     
     failed_migrations = []
@@ -76,11 +98,18 @@ def main():
         print("    - reminder_time")
         print("    - is_recurring")
         print("    - recurrence_pattern (JSONB)")
+        print("    - version (optimistic concurrency, If-Match)")
         print("\n  Tags tables:")
         print("    - tags (id, name, color, created_at, created_by)")
+        print("      unique per user on (created_by, lower(name))")
         print("    - task_tags (task_id, tag_id)")
         print("\n  Event log:")
         print("    - event_log (audit trail for all events)")
+        print("\n  Delta sync:")
+        print("    - task_tombstones (deleted tasks, pruned after retention)")
+        print("    - sync_xid on tasks and task_tombstones (writing transaction)")
+        print("\n  Archive:")
+        print("    - archived_tasks (tasks completed long ago, same columns as tasks)")
         print("\n🎉 Database is ready for Phase V features!")
 
 
@@ -0,0 +1,166 @@
+"""
+Database migration script: Scope tag names per user.
+[Task]: T-A-011
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §2.4
+        specs/005-phase-v-cloud/phase5-cloud.plan.md §2.2
+
+Tag names used to be globally unique, so users shared (and collided on)
+each other's tags. This script:
+- drops the global unique constraint/index on tags.name
+- gives every user their own copy of any tag they use but do not own,
+  and re-points their task_tags rows to it
+- merges tags that differ only by case within a single user
+- creates the composite unique index ux_tags_created_by_lower_name
+  on (created_by, lower(name))
+- makes tags.created_by ON DELETE CASCADE (as create_tags_tables.py and
+  the Tag model declare; tables made with SQLModel create_all before the
+  model said so lack it), so a deleted user's tags go with them
+
+Run with: uv run python migrations/scope_tags_per_user.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlmodel import create_engine, text
+from src.config import settings
+
+
+def upgrade():
+    """Move tags into per-user namespaces."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    with engine.begin() as conn:
+        print("\n🗑️  Dropping global tag name uniqueness...")
+        conn.execute(text("ALTER TABLE tags DROP CONSTRAINT IF EXISTS tags_name_key"))
+        conn.execute(text("DROP INDEX IF EXISTS ix_tags_name"))
+        conn.execute(text("DROP INDEX IF EXISTS idx_tags_name"))
+        print("✓ Dropped: tags_name_key, ix_tags_name, idx_tags_name")
+
+        print("\n📋 Copying shared tags into each user's namespace...")
+        result = conn.execute(text("""
+            INSERT INTO tags (name, color, created_at, created_by)
+            SELECT DISTINCT ON (t.user_id, lower(g.name))
+                   g.name, g.color, NOW(), t.user_id
+            FROM task_tags tt
+            JOIN tasks t ON t.id = tt.task_id
+            JOIN tags g ON g.id = tt.tag_id
+            WHERE t.user_id <> g.created_by
+              AND NOT EXISTS (
+                  SELECT 1 FROM tags o
+                  WHERE o.created_by = t.user_id
+                    AND lower(o.name) = lower(g.name)
+              )
+            ORDER BY t.user_id, lower(g.name), g.id
+        """))
+        print(f"✓ Tags copied: {result.rowcount}")
+
+        result = conn.execute(text("""
+            INSERT INTO task_tags (task_id, tag_id)
+            SELECT tt.task_id, MIN(o.id)
+            FROM task_tags tt
+            JOIN tasks t ON t.id = tt.task_id
+            JOIN tags g ON g.id = tt.tag_id
+            JOIN tags o ON o.created_by = t.user_id AND lower(o.name) = lower(g.name)
+            WHERE t.user_id <> g.created_by
+            GROUP BY tt.task_id, lower(g.name)
+            ON CONFLICT DO NOTHING
+        """))
+        conn.execute(text("""
+            DELETE FROM task_tags tt
+            USING tasks t, tags g
+            WHERE t.id = tt.task_id
+              AND g.id = tt.tag_id
+              AND t.user_id <> g.created_by
+        """))
+        print(f"✓ Task associations re-pointed: {result.rowcount}")
+
+        print("\n🔀 Merging case-insensitive duplicates per user...")
+        conn.execute(text("""
+            INSERT INTO task_tags (task_id, tag_id)
+            SELECT tt.task_id, r.keep_id
+            FROM task_tags tt
+            JOIN (
+                SELECT id, MIN(id) OVER (PARTITION BY created_by, lower(name)) AS keep_id
+                FROM tags
+            ) r ON r.id = tt.tag_id
+            WHERE r.id <> r.keep_id
+            ON CONFLICT DO NOTHING
+        """))
+        result = conn.execute(text("""
+            DELETE FROM tags
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, MIN(id) OVER (PARTITION BY created_by, lower(name)) AS keep_id
+                    FROM tags
+                ) r
+                WHERE r.id <> r.keep_id
+            )
+        """))
+        print(f"✓ Duplicate tags merged: {result.rowcount}")
+
+        print("\n📊 Creating indexes...")
+        conn.execute(text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS ux_tags_created_by_lower_name
+            ON tags(created_by, lower(name))
+        """))
+        print("✓ Index created: ux_tags_created_by_lower_name")
+
+        print("\n🔗 Cascading tag ownership to users...")
+        conn.execute(text("ALTER TABLE tags DROP CONSTRAINT IF EXISTS tags_created_by_fkey"))
+        conn.execute(text("""
+            ALTER TABLE tags
+            ADD CONSTRAINT tags_created_by_fkey
+            FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE CASCADE
+        """))
+        print("✓ Constraint replaced: tags_created_by_fkey (ON DELETE CASCADE)")
+
+    print("\n✅ Migration completed successfully!")
+    print("Tag names are now unique per user (case-insensitive).")
+
+
+def downgrade():
+    """Drop the per-user tag index (rollback)."""
+
+    print("🔗 Connecting to database...")
+    engine = create_engine(settings.DATABASE_URL, echo=True)
+
+    print("\n⚠️  Rolling back migration...")
+    print("This will drop ux_tags_created_by_lower_name.")
+    print("Global tag name uniqueness is NOT restored, since names may now")
+    print("legitimately repeat across users.")
+
+    confirm = input("\nAre you sure you want to continue? (yes/no): ")
+    if confirm.lower() != "yes":
+        print("❌ Rollback cancelled.")
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS ux_tags_created_by_lower_name"))
+        print("✓ Dropped index: ux_tags_created_by_lower_name")
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_tags_name ON tags(name)"))
+        print("✓ Index created: idx_tags_name")
+
+    print("\n✅ Rollback completed successfully!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        try:
+            downgrade()
+        except Exception as e:
+            print(f"\n❌ Rollback error: {e}")
+            sys.exit(1)
+    else:
+        try:
+            upgrade()
+        except Exception as e:
+            print(f"\n❌ Migration error: {e}")
+            sys.exit(1)
@@ -8,6 +8,7 @@ Seed database with sample data for Phase V testing.
 import asyncio
 from datetime import datetime, timedelta
 from uuid import UUID
+from sqlalchemy import func
 from sqlmodel import Session, select
 from src.database import engine
 from src.models import User, Task, Tag, TaskTag, Priority, RecurrenceFrequency, RecurrencePattern
@@ -26,7 +27,7 @@ async def seed_data():
         
         # Create test user (use existing user if available)
         test_user = session.exec(
-            select(User).where(User.email == "test@example.com")
+            select(User).where(func.lower(User.email) == "test@example.com")
         ).first()
         
         if not test_user:
@@ -0,0 +1,142 @@
+"""
+Shared OpenAI clients for the agent runner.
+[Task]: T-013 (Agent Instrumentation)
+[From]: specs/003-phase-iii-chatbot/plan.md §2.1.3,
+        specs/005-phase-v-cloud/phase5-cloud.specify.md §6.2.5
+
+One sync and one async client per process, each with a keep-alive
+connection pool, so chat turns after the first skip the TCP/TLS
+handshake. The clients are created on first use (under a lock, so
+concurrent first requests share one pool) and closed on application
+shutdown.
+
+Every request is traced through httpcore's trace extension and split
+into:
+- openai_connect_seconds: TCP connect + TLS handshake (new connections only)
+- openai_model_wait_seconds: request sent -> response headers (model time)
+- openai_connections_total{reused="true|false"}: pool hits vs new connections
+"""
+
+import asyncio
+import threading
+import time
+import openai
+import httpx
+from typing import Callable, Dict
+from src.config import settings
+from src.utils import metrics
+
+
+# Idle keep-alive connections are closed after this long
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+
+def _record(event_name: str, marks: Dict[str, float]) -> None:
+    """Update timing marks for one trace event; emit metrics at headers."""
+    # "connection.connect_tcp.started" -> "connect_tcp.started"
+    step = event_name.split(".", 1)[-1]
+    now = time.perf_counter()
+    marks[step] = now
+
+    if step != "receive_response_headers.complete":
+        return
+
+    connect_started = marks.get("connect_tcp.started")
+    if connect_started is not None:
+        connected = marks.get("start_tls.complete", marks.get("connect_tcp.complete", now))
+        metrics.observe("openai_connect_seconds", connected - connect_started)
+        metrics.inc("openai_connections_total", reused="false")
+    else:
+        metrics.inc("openai_connections_total", reused="true")
+
+    sent = marks.get("send_request_body.complete", marks.get("send_request_headers.complete", now))
+    metrics.observe("openai_model_wait_seconds", now - sent)
+
+
+def _trace_hook() -> Callable[[httpx.Request], None]:
+    def on_request(request: httpx.Request) -> None:
+        marks: Dict[str, float] = {}
+        request.extensions["trace"] = lambda event_name, info: _record(event_name, marks)
+    return on_request
+
+
+def _async_trace_hook():
+    async def on_request(request: httpx.Request) -> None:
+        marks: Dict[str, float] = {}
+
+        async def trace(event_name, info):
+            _record(event_name, marks)
+
+        request.extensions["trace"] = trace
+    return on_request
+
+
+def _client_options() -> dict:
+    options = {"api_key": settings.OPENAI_API_KEY}
+    if settings.OPENAI_BASE_URL:
+        options["base_url"] = settings.OPENAI_BASE_URL
+    return options
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.OPENAI_MAX_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+    )
+
+
+# Global client instances
+_client = None
+_async_client = None
+_clients_lock = threading.Lock()
+
+
+def get_client() -> openai.OpenAI:
+    """Get singleton sync OpenAI client."""
+    global _client
+    if _client is None:
+        with _clients_lock:
+            if _client is None:
+                _client = openai.OpenAI(
+                    **_client_options(),
+                    http_client=openai.DefaultHttpxClient(
+                        limits=_limits(),
+                        event_hooks={"request": [_trace_hook()]}
+                    )
+                )
+    return _client
+
+
+def get_async_client() -> openai.AsyncOpenAI:
+    """Get singleton async OpenAI client."""
+    global _async_client
+    if _async_client is None:
+        with _clients_lock:
+            if _async_client is None:
+                _async_client = openai.AsyncOpenAI(
+                    **_client_options(),
+                    http_client=openai.DefaultAsyncHttpxClient(
+                        limits=_limits(),
+                        event_hooks={"request": [_async_trace_hook()]}
+                    )
+                )
+    return _async_client
+
+
+async def close_clients() -> None:
+    """Close and drop the shared clients (application shutdown)."""
+    global _client, _async_client
+    with _clients_lock:
+        sync_client, async_client = _client, _async_client
+        _client = None
+        _async_client = None
+    if sync_client is not None:
+        sync_client.close()
+    if async_client is not None:
+        await async_client.close()
+
+
+def reset_clients() -> None:
+    """Close and drop the shared clients (settings changes, tests); not for use inside an event loop."""
+    asyncio.run(close_clients())
@@ -0,0 +1,80 @@
+"""
+Fast path for plain task-list requests.
+[Task]: T-016 (Tool Result Cache)
+[From]: specs/003-phase-iii-chatbot/spec.md §7, plan.md §2.1.3
+
+Messages like "show my tasks" or "what's pending?" always end in a single
+list_tasks call whose result is formatted verbatim, so the model adds
+latency and cost but nothing else. These are matched against a small set
+of whole-message patterns and answered directly from list_tasks (served
+from the tool cache).
+
+Matching is deliberately strict: anything with extra qualifiers ("show
+my tasks due tomorrow", "list high priority tasks") goes to the model.
+"""
+
+import re
+from typing import Optional
+from src.config import settings
+
+
+_TASKS = r"(?:tasks?|todos?|to-?dos?|to-?do list|task list|list)"
+_POLITE = r"(?:please|pls|thanks)"
+
+# (pattern, list_tasks status); None = taken from the pattern's status group
+_LIST_INTENTS = [
+    (
+        rf"(?:{_POLITE} )?(?:can you |could you )?(?:show|list|display|view|see|get|give)(?: me)?"
+        rf"(?: all)?(?: of)? my (?:(?P<status>pending|open|incomplete|remaining|unfinished|"
+        rf"completed|done|finished) )?{_TASKS}(?: {_POLITE})?",
+        None
+    ),
+    (r"(?:my |all my )?(?:tasks|todos|to-?dos|to-?do list|task list)", "all"),
+    (r"what(?:'s| is) (?:pending|left|remaining|left to do|on my (?:list|plate))", "pending"),
+    (r"what do i (?:have|still have|need) to do", "pending"),
+    (rf"what(?:'s| is| are)? my (?:(?P<status>pending|open|remaining) )?{_TASKS}", None),
+    (r"what(?: have i| did i) (?:completed|finished|done)", "completed"),
+]
+_COMPILED = [(re.compile(pattern), status) for pattern, status in _LIST_INTENTS]
+
+_STATUS_ALIASES = {
+    "pending": "pending",
+    "open": "pending",
+    "incomplete": "pending",
+    "remaining": "pending",
+    "unfinished": "pending",
+    "completed": "completed",
+    "done": "completed",
+    "finished": "completed",
+}
+
+
+def fast_path_enabled() -> bool:
+    """Whether plain list requests skip the model (CHAT_FAST_PATH_ENABLED)."""
+    return settings.CHAT_FAST_PATH_ENABLED.lower() == "true"
+
+
+def _normalize(message: str) -> str:
+    text = message.strip().lower().replace("’", "'")
+    text = re.sub(r"[.!?]+$", "", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def match_list_intent(message: str) -> Optional[str]:
+    """
+    Recognize a plain request to list tasks.
+
+    Returns:
+        list_tasks status ('all', 'pending', 'completed'), or None
+    """
+    if not message or len(message) > 100:
+        return None
+    text = _normalize(message)
+    for pattern, status in _COMPILED:
+        match = pattern.fullmatch(text)
+        if match is None:
+            continue
+        if status is not None:
+            return status
+        return _STATUS_ALIASES.get(match.group("status") or "", "all")
+    return None
@@ -0,0 +1,166 @@
+"""
+Conversation history windowing with rolling summaries.
+[Task]: T-015 (History Window)
+[From]: specs/003-phase-iii-chatbot/spec.md §5.1, plan.md §2.1.4
+
+The prompt gets the most recent messages that fit a token budget plus a
+stored summary of everything older, so prompt size stays bounded no
+matter how long a conversation grows.
+
+- load_history(): one query over ix_messages_conversation_created
+  (newest first, only messages not yet summarized), trimmed to the
+  budget. The summary, if any, is prepended as a system message.
+- fold_history(): run after the reply has been sent. Once enough
+  unsummarized messages have fallen out of the window, they are folded
+  into Conversation.summary with one short model call.
+
+Token counts use the ~4 characters per token heuristic; no tokenizer
+dependency is needed for a budget.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+from sqlmodel import Session, select, col
+from src.config import settings
+from src.models.conversation import Conversation
+from src.models.message import Message
+from src.agent.client import get_client
+from src.utils import metrics
+
+
+# Upper bound on rows read per turn (the budget normally trims well before)
+HISTORY_FETCH_LIMIT = 100
+
+# Per-message overhead (role, separators) in the token estimate
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Fold only once this many tokens have fallen out of the window, so the
+# summary model call happens every few turns rather than on every turn
+FOLD_MIN_TOKENS = 500
+
+SUMMARY_MAX_TOKENS = 300
+
+SUMMARY_PROMPT = """Summarize this conversation between a user and their task management assistant.
+Keep facts that matter for later turns: tasks mentioned (with their #IDs), decisions, preferences and open questions.
+Be brief. If a previous summary is given, merge it with the new messages into one updated summary."""
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Rough token count of a message (~4 characters per token)."""
+    return len(text or "") // 4 + MESSAGE_OVERHEAD_TOKENS
+
+
+def split_window(
+    newest_first: List[Message],
+    token_budget: int
+) -> Tuple[List[Message], List[Message]]:
+    """
+    Split messages (newest first) into the prompt window and the overflow.
+
+    The newest message is always kept, even if it alone exceeds the budget.
+
+    Returns:
+        (window oldest-first, overflow oldest-first)
+    """
+    used = 0
+    cut = len(newest_first)
+    for index, message in enumerate(newest_first):
+        used += estimate_tokens(message.content)
+        if used > token_budget and index > 0:
+            cut = index
+            break
+    window = list(reversed(newest_first[:cut]))
+    overflow = list(reversed(newest_first[cut:]))
+    return window, overflow
+
+
+def _unsummarized_newest_first(session: Session, conversation: Conversation) -> List[Message]:
+    """Messages not yet folded into the summary, newest first (one indexed query)."""
+    query = select(Message).where(Message.conversation_id == conversation.id)
+    if conversation.summary_through_id:
+        query = query.where(Message.id > conversation.summary_through_id)
+    return list(session.exec(
+        query.order_by(col(Message.created_at).desc()).limit(HISTORY_FETCH_LIMIT)
+    ).all())
+
+
+def load_history(
+    session: Session,
+    conversation: Conversation,
+    token_budget: Optional[int] = None
+) -> List[Dict[str, str]]:
+    """
+    Build the agent's messages array for a conversation.
+
+    Returns:
+        [{"role": ..., "content": ...}] oldest first, led by the summary
+    """
+    budget = token_budget or settings.CHAT_HISTORY_TOKEN_BUDGET
+    window, _ = split_window(_unsummarized_newest_first(session, conversation), budget)
+
+    messages = []
+    if conversation.summary:
+        messages.append({
+            "role": "system",
+            "content": f"Summary of the earlier conversation:\n{conversation.summary}"
+        })
+    messages.extend({"role": msg.role, "content": msg.content} for msg in window)
+    return messages
+
+
+def summarize(previous_summary: Optional[str], messages: List[Message]) -> str:
+    """Fold messages into the previous summary with one model call."""
+    transcript = "\n".join(f"{msg.role}: {msg.content}" for msg in messages)
+    if previous_summary:
+        transcript = f"Previous summary:\n{previous_summary}\n\nNew messages:\n{transcript}"
+
+    started = time.perf_counter()
+    try:
+        response = get_client().chat.completions.create(
+            model=settings.CHAT_SUMMARY_MODEL,
+            messages=[
+                {"role": "system", "content": SUMMARY_PROMPT},
+                {"role": "user", "content": transcript}
+            ],
+            max_tokens=SUMMARY_MAX_TOKENS,
+            temperature=0
+        )
+    finally:
+        metrics.observe("chat_summary_seconds", time.perf_counter() - started)
+    return (response.choices[0].message.content or "").strip()
+
+
+def fold_history(session: Session, conversation_id: int, token_budget: Optional[int] = None) -> bool:
+    """
+    Fold messages that fell out of the window into the rolling summary.
+
+    Safe to call after every turn: it does nothing until FOLD_MIN_TOKENS
+    of history have overflowed the window. Messages older than
+    HISTORY_FETCH_LIMIT unsummarized rows are skipped, not summarized.
+
+    Returns:
+        True if the summary was updated
+    """
+    conversation = session.get(Conversation, conversation_id)
+    if conversation is None:
+        return False
+
+    budget = token_budget or settings.CHAT_HISTORY_TOKEN_BUDGET
+    _, overflow = split_window(_unsummarized_newest_first(session, conversation), budget)
+    if sum(estimate_tokens(msg.content) for msg in overflow) < FOLD_MIN_TOKENS:
+        return False
+
+    try:
+        summary = summarize(conversation.summary, overflow)
+    except Exception as e:
+        print(f"⚠️  Conversation summary failed for {conversation_id}: {e}")
+        return False
+    if not summary:
+        return False
+
+    conversation.summary = summary
+    conversation.summary_through_id = max(msg.id for msg in overflow)
+    session.add(conversation)
+    session.commit()
+    metrics.inc("chat_summary_folds_total")
+    return True
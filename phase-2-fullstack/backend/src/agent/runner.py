@@ -1,46 +1,27 @@
 """
 OpenAI Agent runner with MCP tool integration.
-[Task]: T-006
+[Task]: T-006, T-012 (Streaming Chat), T-013 (Agent Instrumentation),
+        T-014 (Agent Tool Loop), T-016 (Tool Result Cache)
 [From]: specs/003-phase-iii-chatbot/spec.md §7, plan.md §2.1.3
 """
 
 import openai
 import json
-from typing import List, Dict, Any, cast
+import time
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple, cast
 from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
 from uuid import UUID
+from src.database import engine
 from src.mcp.server import get_mcp_tools
-from src.mcp import tools as mcp_tools
+from src.mcp.registry import run_tool_calls, call_tool
 from src.config import settings
+from src.agent.client import get_client, get_async_client
+from src.agent.fast_path import fast_path_enabled, match_list_intent
+from src.utils import metrics
 
 
-def run_agent(
-    session: Session,
-    user_id: UUID,
-    messages: List[Dict[str, str]]
-) -> Dict[str, Any]:
-    """
-    Run OpenAI agent with conversation history and MCP tools.
-    
-    Args:
-        session: Database session for tool execution
-        user_id: User UUID for tool calls (from JWT token)
-        messages: Conversation history [{"role": "user/assistant", "content": "..."}]
-    
-    Returns:
-        {
-            "response": "Agent's text response",
-            "tool_calls": [{"tool": "name", "arguments": {...}, "result": {...}}]
-        }
-    """
-    
-    # Configure OpenAI client
-    client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-    
-    # System prompt
-    system_message = {
-        "role": "system",
-        "content": """You are a helpful task management assistant. You help users manage their todo list through natural conversation.
+SYSTEM_PROMPT = """You are a helpful task management assistant. You help users manage their todo list through natural conversation.
 
 Available actions:
 - Create tasks when user mentions adding, creating, or remembering something
@@ -58,124 +39,304 @@ Always:
 - When listing tasks, show the actual task ID (e.g., "Task #5: Buy groceries")
 - Ask for clarification if ambiguous
 - Handle errors gracefully with helpful messages"""
+
+CHAT_MODEL = "gpt-4o"  # Updated to current stable model (was gpt-4-turbo-preview)
+MAX_TOKENS = 1000
+TEMPERATURE = 0.7
+
+# Built once per process and reused for every request
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+_TOOLS = get_mcp_tools()
+
+
+def _parse_arguments(raw: str) -> Dict[str, Any]:
+    """Decode tool call arguments; user_id is never taken from the model."""
+    try:
+        args = json.loads(raw or "{}")
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(args, dict):
+        return {}
+    # CRITICAL: user_id comes from the JWT token only (NEVER trust model output)
+    args.pop("user_id", None)
+    return args
+
+
+def _assistant_tool_message(content: Optional[str], calls: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Assistant turn requesting tools, in Chat Completions message format."""
+    return {
+        "role": "assistant",
+        "content": content,
+        "tool_calls": [
+            {
+                "id": call["id"],
+                "type": "function",
+                "function": {"name": call["name"], "arguments": call["arguments"]}
+            }
+            for call in calls
+        ]
     }
+
+
+def _apply_tool_results(
+    conversation: List[Dict[str, Any]],
+    calls: List[Dict[str, str]],
+    results: List[Dict[str, Any]],
+    tool_calls_metadata: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Feed tool results back to the model and record them; returns this step's metadata."""
+    step_metadata = []
+    for call, result in zip(calls, results):
+        conversation.append({
+            "role": "tool",
+            "tool_call_id": call["id"],
+            "content": json.dumps(result, default=str)
+        })
+        step_metadata.append({
+            "tool": call["name"],
+            "arguments": _parse_arguments(call["arguments"]),
+            "result": result
+        })
+    tool_calls_metadata.extend(step_metadata)
+    return step_metadata
+
+
+def _final_text(response_text: str, tool_calls_metadata: List[Dict[str, Any]]) -> str:
+    if response_text:
+        return response_text
+    if tool_calls_metadata:
+        # Generate confirmation based on tool results
+        return _generate_confirmation(tool_calls_metadata)
+    return "I'm here to help! What would you like to do?"
+
+
+def _fast_path_call(messages: List[Dict[str, str]]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """The list_tasks call answering the latest message, if it is a plain list request."""
+    if not fast_path_enabled() or not messages or messages[-1]["role"] != "user":
+        return None
+    status = match_list_intent(messages[-1]["content"])
+    if status is None:
+        return None
+    metrics.inc("chat_fast_path_total", status=status)
+    return "list_tasks", {"status": status}
+
+
+def run_agent(
+    session: Session,
+    user_id: UUID,
+    messages: List[Dict[str, str]],
+    max_steps: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Run OpenAI agent with conversation history and MCP tools.
     
-    # Build full message history
-    full_messages = [system_message] + messages
+    Loops model -> tools -> model until the model answers without tool
+    calls (at most max_steps model calls; the last one may not call
+    tools). Each step's tool calls go through the MCP registry: mutations
+    are committed together, read-only tools run concurrently.
     
-    # Get MCP tool definitions
-    tools = get_mcp_tools()
+    Plain list requests ("show my tasks") are answered from list_tasks
+    without calling the model (see agent/fast_path.py).
     
-    # Call OpenAI Chat Completions API
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o",  # Updated to current stable model (was gpt-4-turbo-preview)
-            messages=cast(Any, full_messages),
-            tools=cast(Any, tools),
-            tool_choice="auto",
-            max_tokens=1000,
-            temperature=0.7
-        )
-    except openai.AuthenticationError as e:
-        return {
-            "response": "⚠️ OpenAI API authentication failed. Please check your API key configuration.",
-            "tool_calls": []
-        }
-    except openai.RateLimitError as e:
-        return {
-            "response": "⚠️ OpenAI API rate limit exceeded. Please try again in a moment.",
-            "tool_calls": []
-        }
-    except openai.APIConnectionError as e:
-        return {
-            "response": "⚠️ Could not connect to OpenAI API. Please check your internet connection.",
-            "tool_calls": []
+    [Task]: T-006, T-014, T-016
+    
+    Args:
+        session: Database session for tool execution
+        user_id: User UUID for tool calls (from JWT token)
+        messages: Conversation history [{"role": "user/assistant", "content": "..."}]
+        max_steps: Model call budget (default: settings.AGENT_MAX_STEPS)
+    
+    Returns:
+        {
+            "response": "Agent's text response",
+            "tool_calls": [{"tool": "name", "arguments": {...}, "result": {...}}]
         }
-    except Exception as e:
-        return {
-            "response": f"⚠️ AI service error: {str(e)}",
-            "tool_calls": []
+    """
+    fast_call = _fast_path_call(messages)
+    if fast_call:
+        tool_name, tool_args = fast_call
+        metadata = {
+            "tool": tool_name,
+            "arguments": tool_args,
+            "result": call_tool(session, user_id, tool_name, tool_args)
         }
+        return {"response": _generate_confirmation([metadata]), "tool_calls": [metadata]}
     
-    # Extract response
-    assistant_message = response.choices[0].message
-    tool_calls_metadata = []
-    
-    # Handle tool calls if any
-    if assistant_message.tool_calls:
-        for tool_call in assistant_message.tool_calls:
-            tool_name = tool_call.function.name
-            tool_args = json.loads(tool_call.function.arguments)
-            
-            # CRITICAL: Inject user_id from token (NEVER trust user input)
-            tool_args["user_id"] = str(user_id)
-            
-            # Execute tool
-            try:
-                if tool_name == "add_task":
-                    result = mcp_tools.add_task(
-                        session, 
-                        UUID(tool_args["user_id"]), 
-                        tool_args["title"],
-                        tool_args.get("description"),
-                        tool_args.get("priority", "medium"),
-                        tool_args.get("due_date"),
-                        tool_args.get("is_recurring", False),
-                        tool_args.get("recurrence_frequency", "daily")
-                    )
-                elif tool_name == "list_tasks":
-                    result = mcp_tools.list_tasks(
-                        session, 
-                        UUID(tool_args["user_id"]), 
-                        tool_args.get("status", "all")
-                    )
-                elif tool_name == "complete_task":
-                    result = mcp_tools.complete_task(
-                        session, 
-                        UUID(tool_args["user_id"]), 
-                        tool_args["task_id"]
-                    )
-                elif tool_name == "update_task":
-                    result = mcp_tools.update_task(
-                        session, 
-                        UUID(tool_args["user_id"]), 
-                        tool_args["task_id"],
-                        tool_args.get("title"),
-                        tool_args.get("description")
-                    )
-                elif tool_name == "delete_task":
-                    result = mcp_tools.delete_task(
-                        session, 
-                        UUID(tool_args["user_id"]), 
-                        tool_args["task_id"]
-                    )
-                else:
-                    result = {"error": f"Unknown tool: {tool_name}"}
-            except Exception as e:
-                result = {"error": f"Tool execution failed: {str(e)}"}
-            
-            # Record tool call
-            tool_calls_metadata.append({
-                "tool": tool_name,
-                "arguments": {k: v for k, v in tool_args.items() if k != "user_id"},  # Don't expose user_id
-                "result": result
-            })
+    max_steps = max(max_steps or settings.AGENT_MAX_STEPS, 1)
+    conversation: List[Dict[str, Any]] = [_SYSTEM_MESSAGE] + messages
+    tool_calls_metadata: List[Dict[str, Any]] = []
+    response_text = ""
+    
+    for step in range(max_steps):
+        # Call OpenAI Chat Completions API (pooled client, see agent/client.py)
+        started = time.perf_counter()
+        try:
+            response = get_client().chat.completions.create(
+                model=CHAT_MODEL,
+                messages=cast(Any, conversation),
+                tools=cast(Any, _TOOLS),
+                tool_choice="none" if step == max_steps - 1 else "auto",
+                max_tokens=MAX_TOKENS,
+                temperature=TEMPERATURE
+            )
+        except Exception as e:
+            metrics.inc("openai_errors_total", error=type(e).__name__)
+            return {
+                "response": _api_error_message(e),
+                "tool_calls": tool_calls_metadata
+            }
+        finally:
+            metrics.observe("openai_request_seconds", time.perf_counter() - started, mode="sync")
+        
+        assistant_message = response.choices[0].message
+        if not assistant_message.tool_calls:
+            response_text = assistant_message.content or ""
+            break
         
-        # Get final response from assistant
-        if assistant_message.content:
-            response_text = assistant_message.content
-        else:
-            # Generate confirmation based on tool results
-            response_text = _generate_confirmation(tool_calls_metadata)
-    else:
-        response_text = assistant_message.content if assistant_message.content else "I'm here to help! What would you like to do?"
+        calls = [
+            {"id": call.id, "name": call.function.name, "arguments": call.function.arguments}
+            for call in assistant_message.tool_calls
+        ]
+        conversation.append(_assistant_tool_message(assistant_message.content, calls))
+        results = run_tool_calls(
+            session,
+            user_id,
+            [(call["name"], _parse_arguments(call["arguments"])) for call in calls]
+        )
+        _apply_tool_results(conversation, calls, results, tool_calls_metadata)
+    
+    metrics.inc("agent_runs_total", steps=str(step + 1))
     
     return {
-        "response": response_text,
+        "response": _final_text(response_text, tool_calls_metadata),
         "tool_calls": tool_calls_metadata
     }
 
 
+def _run_tool_calls_in_session(user_id: UUID, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Run one step's tool calls with a short-lived session (called in a worker thread)."""
+    with Session(engine) as session:
+        return run_tool_calls(session, user_id, calls)
+
+
+async def stream_agent(
+    user_id: UUID,
+    messages: List[Dict[str, str]],
+    max_steps: Optional[int] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run the agent loop with token streaming.
+    
+    Same loop (and fast path) as run_agent. No database connection is
+    held while waiting on the model; each step's tools run in the
+    threadpool with their own session.
+    
+    [Task]: T-012, T-014, T-016
+    
+    Yields:
+        {"type": "token", "content": str} for each text delta
+        {"type": "tool_call", "tool": str, "arguments": {...}, "result": {...}}
+        {"type": "done", "response": str, "tool_calls": [...]} once, last
+    """
+    fast_call = _fast_path_call(messages)
+    if fast_call:
+        tool_name, tool_args = fast_call
+        results = await run_in_threadpool(_run_tool_calls_in_session, user_id, [fast_call])
+        metadata = {"tool": tool_name, "arguments": tool_args, "result": results[0]}
+        yield {"type": "tool_call", **metadata}
+        response_text = _generate_confirmation([metadata])
+        yield {"type": "token", "content": response_text}
+        yield {"type": "done", "response": response_text, "tool_calls": [metadata]}
+        return
+    
+    max_steps = max(max_steps or settings.AGENT_MAX_STEPS, 1)
+    conversation: List[Dict[str, Any]] = [_SYSTEM_MESSAGE] + messages
+    tool_calls_metadata: List[Dict[str, Any]] = []
+    text_parts: List[str] = []
+    
+    for step in range(max_steps):
+        content_parts: List[str] = []
+        pending_calls: Dict[int, Dict[str, str]] = {}
+        
+        started = time.perf_counter()
+        first_chunk = True
+        try:
+            stream = await get_async_client().chat.completions.create(
+                model=CHAT_MODEL,
+                messages=cast(Any, conversation),
+                tools=cast(Any, _TOOLS),
+                tool_choice="none" if step == max_steps - 1 else "auto",
+                max_tokens=MAX_TOKENS,
+                temperature=TEMPERATURE,
+                stream=True
+            )
+            async for chunk in stream:
+                if first_chunk:
+                    metrics.observe("openai_first_token_seconds", time.perf_counter() - started)
+                    first_chunk = False
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    if not content_parts and text_parts:
+                        # Separate text from an earlier step
+                        content_parts.append("\n\n")
+                        yield {"type": "token", "content": "\n\n"}
+                    content_parts.append(delta.content)
+                    yield {"type": "token", "content": delta.content}
+                # Tool calls arrive as fragments keyed by index
+                for call in delta.tool_calls or []:
+                    entry = pending_calls.setdefault(call.index, {"id": "", "name": "", "arguments": ""})
+                    if call.id:
+                        entry["id"] = call.id
+                    if call.function and call.function.name:
+                        entry["name"] += call.function.name
+                    if call.function and call.function.arguments:
+                        entry["arguments"] += call.function.arguments
+        except Exception as e:
+            metrics.inc("openai_errors_total", error=type(e).__name__)
+            message = _api_error_message(e)
+            yield {"type": "token", "content": message}
+            yield {"type": "done", "response": message, "tool_calls": tool_calls_metadata}
+            return
+        finally:
+            metrics.observe("openai_request_seconds", time.perf_counter() - started, mode="stream")
+        
+        text_parts.extend(content_parts)
+        if not pending_calls:
+            break
+        
+        calls = [pending_calls[index] for index in sorted(pending_calls)]
+        conversation.append(_assistant_tool_message("".join(content_parts) or None, calls))
+        results = await run_in_threadpool(
+            _run_tool_calls_in_session,
+            user_id,
+            [(call["name"], _parse_arguments(call["arguments"])) for call in calls]
+        )
+        for metadata in _apply_tool_results(conversation, calls, results, tool_calls_metadata):
+            yield {"type": "tool_call", **metadata}
+    
+    metrics.inc("agent_runs_total", steps=str(step + 1))
+    
+    response_text = "".join(text_parts)
+    if not response_text:
+        response_text = _final_text(response_text, tool_calls_metadata)
+        yield {"type": "token", "content": response_text}
+    
+    yield {"type": "done", "response": response_text, "tool_calls": tool_calls_metadata}
+
+
+def _api_error_message(e: Exception) -> str:
+    """User-facing message for an OpenAI API failure."""
+    if isinstance(e, openai.AuthenticationError):
+        return "⚠️ OpenAI API authentication failed. Please check your API key configuration."
+    if isinstance(e, openai.RateLimitError):
+        return "⚠️ OpenAI API rate limit exceeded. Please try again in a moment."
+    if isinstance(e, openai.APIConnectionError):
+        return "⚠️ Could not connect to OpenAI API. Please check your internet connection."
+    return f"⚠️ AI service error: {str(e)}"
+
+
 def _generate_confirmation(tool_calls: List[Dict]) -> str:
     """Generate friendly confirmation message from tool results."""
     if not tool_calls:
@@ -192,14 +353,23 @@ def _generate_confirmation(tool_calls: List[Dict]) -> str:
         return f"✅ Added '{result['title']}' to your task list."
     elif tool == "list_tasks":
         count = result["count"]
+        status = last_call.get("arguments", {}).get("status", "all")
+        label = "" if status == "all" else f"{status} "
         if count == 0:
+            if status == "pending":
+                return "You have no pending tasks. 🎉"
+            if status == "completed":
+                return "You haven't completed any tasks yet."
             return "You don't have any tasks yet. Would you like to add one?"
         tasks = result["tasks"]
         tasks_text = "\n".join([
             f"Task #{t['id']}: {t['title']} {'✅' if t['completed'] else '⏳'}"
             for t in tasks
         ])
-        return f"Here are your {count} task(s):\n\n{tasks_text}\n\n💡 Use the task number (e.g., 'complete task #{tasks[0]['id']}') to manage them."
+        heading = f"Here are your {count} {label}task(s):"
+        if result.get("truncated"):
+            heading = f"Here are {count} of your {label}tasks (ask for more to see the rest):"
+        return f"{heading}\n\n{tasks_text}\n\n💡 Use the task number (e.g., 'complete task #{tasks[0]['id']}') to manage them."
     elif tool == "complete_task":
         return f"✅ Marked '{result['title']}' as complete!"
     elif tool == "update_task":
@@ -30,6 +30,61 @@ class Settings(BaseSettings):
     
     # Phase III: OpenAI
     OPENAI_API_KEY: str
+    OPENAI_BASE_URL: str = ""  # Empty = api.openai.com; set for compatible gateways
+    OPENAI_MAX_CONNECTIONS: int = 100
+    AGENT_MAX_STEPS: int = 5  # Model calls per chat turn (model -> tools -> model ...)
+    CHAT_HISTORY_TOKEN_BUDGET: int = 3000  # Recent history sent per turn; older turns are summarized
+    CHAT_SUMMARY_MODEL: str = "gpt-4o-mini"
+    CHAT_FAST_PATH_ENABLED: str = "true"  # Answer plain "show my tasks" turns without the model
+    TOOL_CACHE_ENABLED: str = "true"  # Per-user cache of read-only tool results
+    TOOL_CACHE_TTL_SECONDS: float = 30.0
+    TOOL_CACHE_MAX_USERS: int = 10000
+    
+    # Maintenance jobs under /api/jobs (roll, archive, prune); off unless a token is set
+    JOBS_TOKEN: str = ""  # Callers send it as "Authorization: Bearer <token>"
+    
+    # GET /metrics (Prometheus); off unless a scrape token is set
+    METRICS_TOKEN: str = ""  # Scrapers send it as "Authorization: Bearer <token>"
+    
+    # Rate limiting (token bucket per user for chat, per IP for login/register)
+    RATE_LIMIT_ENABLED: str = "true"
+    RATE_LIMIT_BACKEND: str = "memory"  # memory | redis
+    RATE_LIMIT_REDIS_URL: str = "redis://localhost:6379/0"
+    RATE_LIMIT_TRUST_FORWARDED: str = "false"  # Use X-Forwarded-For (only behind a trusted proxy)
+    RATE_LIMIT_CHAT_BURST: int = 10
+    RATE_LIMIT_CHAT_PER_MINUTE: float = 20
+    RATE_LIMIT_LOGIN_BURST: int = 5
+    RATE_LIMIT_LOGIN_PER_MINUTE: float = 10
+    
+    # Response compression (gzip, or brotli with the optional brotli-asgi package)
+    RESPONSE_COMPRESSION_ENABLED: str = "true"
+    RESPONSE_COMPRESSION_MIN_SIZE: int = 1024  # Bytes; smaller bodies are sent as-is
+    
+    # Delta sync (GET /api/{user_id}/tasks/changes)
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30  # Older sync tokens get 410 (full refetch)
+    SYNC_MAX_CHANGES: int = 1000  # More changes than this: 410, a full list is cheaper
+    
+    # Archive tier: completed tasks move to archived_tasks (POST /api/jobs/archive-completed)
+    ARCHIVE_COMPLETED_AFTER_DAYS: int = 90
+    
+    # Verified-token cache (repeat requests skip JWT decode and user lookup)
+    TOKEN_CACHE_ENABLED: str = "true"
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    
+    # Password hashing (runs in worker processes; 0 = inline)
+    PASSWORD_HASH_SCHEME: str = "bcrypt"  # bcrypt | argon2 (needs argon2-cffi); old hashes upgrade on login
+    BCRYPT_ROUNDS: int = 12
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536  # KiB per hash
+    ARGON2_PARALLELISM: int = 4
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32  # Queued + running calls before login/register answer 503
+    
+    # Standalone MCP server (python -m src.mcp.standalone)
+    MCP_HTTP_HOST: str = "127.0.0.1"
+    MCP_HTTP_PORT: int = 8765
+    MCP_DB_POOL_SIZE: int = 10
+    MCP_DB_MAX_OVERFLOW: int = 10
     
     # Phase V: Dapr Integration
     DAPR_HTTP_ENDPOINT: str = "http://localhost:3500"
@@ -37,6 +92,11 @@ class Settings(BaseSettings):
     KAFKA_ENABLED: str = "false"
     KAFKA_BOOTSTRAP_SERVERS: str = "localhost:9092"
     
+    # In-process reminder timer (replaces cron polling of /api/jobs/check-reminders)
+    REMINDER_TIMER_ENABLED: str = "false"
+    REMINDER_TIMER_LEADER_RETRY_SECONDS: int = 15
+    REMINDER_TIMER_GRACE_SECONDS: int = 300  # A new leader still fires reminders missed this long ago
+    
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
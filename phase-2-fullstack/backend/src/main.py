@@ -6,11 +6,20 @@ FastAPI main application.
 [Updated]: T-008 (Phase III - Add chat router), T-B-005 (Phase V - Add tags router)
 """
 
-from fastapi import FastAPI
+from typing import Optional
+from fastapi import FastAPI, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from src.config import settings
 from src.database import create_db_and_tables
-from src.routers import auth, tasks, chat, tags, stats, jobs
+from src.routers import auth, tasks, chat, tags, stats, jobs, agenda
+from src.services.reminder_timer import reminder_timer_enabled, get_reminder_timer
+from src.utils import metrics
+from src.utils.rate_limit import RateLimitMiddleware
+from src.utils.responses import CompressionMiddleware
+from src.agent.client import close_clients
+from src.utils.password_pool import shutdown_password_pool
+from src.utils.security import bearer_token_matches
 
 # Create FastAPI app
 app = FastAPI(
@@ -21,6 +30,12 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+# gzip/brotli for large bodies (innermost, so it sees the final response)
+app.add_middleware(CompressionMiddleware)
+
+# Rate limits for chat and login (inside CORS so 429s carry CORS headers)
+app.add_middleware(RateLimitMiddleware)
+
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
@@ -35,6 +50,7 @@ app.include_router(auth.router)
 app.include_router(tasks.router)
 app.include_router(tags.router)  # Phase V: Tag management
 app.include_router(stats.router)  # Phase V: Task statistics
+app.include_router(agenda.router)  # Phase V: Calendar/agenda view
 app.include_router(jobs.router)  # Phase V: Job triggers for reminders
 app.include_router(chat.router)  # Phase III: AI chat endpoint
 
@@ -43,6 +59,24 @@ app.include_router(chat.router)  # Phase III: AI chat endpoint
 def on_startup():
     """Create database tables on application startup."""
     create_db_and_tables()
+    
+    # Optional in-process reminder timer (leader-elected across pods)
+    if reminder_timer_enabled():
+        get_reminder_timer().start()
+
+
+@app.on_event("shutdown")
+def on_shutdown():
+    """Release background services on application shutdown."""
+    if reminder_timer_enabled():
+        get_reminder_timer().stop()
+    shutdown_password_pool()
+
+
+@app.on_event("shutdown")
+async def close_openai_clients():
+    """Close the shared OpenAI connection pools."""
+    await close_clients()
 
 
 @app.get("/health")
@@ -54,6 +88,27 @@ def health_check():
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics_endpoint(authorization: Optional[str] = Header(default=None)):
+    """
+    Process metrics in Prometheus text format.
+    
+    Disabled (404) unless METRICS_TOKEN is set; scrapers must send it as
+    a bearer token.
+    """
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    
+    if not bearer_token_matches(authorization, settings.METRICS_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    
+    return metrics.render_prometheus()
+
+
 @app.get("/")
 def root():
     """Root endpoint with API information."""
@@ -0,0 +1,144 @@
+"""
+MCP (Model Context Protocol) JSON-RPC message handling.
+[Task]: T-019 (Standalone MCP Server)
+[From]: specs/003-phase-iii-chatbot/spec.md §6, plan.md §2.1.2
+
+Implements the server side of the MCP methods needed to expose the task
+tools: initialize, ping, tools/list and tools/call. Transports (stdio,
+HTTP) live in mcp/standalone.py and only move JSON objects in and out of
+MCPProtocol.handle().
+
+Tool schemas are derived from get_mcp_tools() and calls go through the
+MCP registry, so the in-process agent and external MCP clients share one
+tool surface.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+from sqlmodel import Session
+from src.mcp.server import get_mcp_tools
+from src.mcp.registry import TOOL_REGISTRY, call_tool
+from src.config import settings
+from src.utils import metrics
+
+
+PROTOCOL_VERSION = "2025-03-26"
+SUPPORTED_PROTOCOL_VERSIONS = ("2024-11-05", "2025-03-26", "2025-06-18")
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+
+
+class ProtocolError(Exception):
+    """A JSON-RPC error to return to the client."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _mcp_tools() -> List[Dict[str, Any]]:
+    """OpenAI function schemas converted to MCP tool descriptors."""
+    return [
+        {
+            "name": tool["function"]["name"],
+            "description": tool["function"]["description"],
+            "inputSchema": tool["function"]["parameters"],
+            "annotations": {"readOnlyHint": TOOL_REGISTRY[tool["function"]["name"]].read_only}
+        }
+        for tool in get_mcp_tools()
+    ]
+
+
+def error_response(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+class MCPProtocol:
+    """
+    Stateless MCP request handler.
+
+    Args:
+        session_factory: Returns a new database session (one per tool call)
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]):
+        self.session_factory = session_factory
+        self.tools = _mcp_tools()
+
+    def handle(self, message: Any, user_id: Optional[UUID]) -> Optional[Any]:
+        """
+        Handle one JSON-RPC message or batch.
+
+        Returns:
+            The response object (list for batches), or None for notifications
+        """
+        if isinstance(message, list):
+            if not message:
+                return error_response(None, INVALID_REQUEST, "Empty batch")
+            responses = [r for r in (self._handle_one(m, user_id) for m in message) if r is not None]
+            return responses or None
+        return self._handle_one(message, user_id)
+
+    def _handle_one(self, message: Any, user_id: Optional[UUID]) -> Optional[Dict[str, Any]]:
+        if not isinstance(message, dict) or message.get("jsonrpc") != "2.0" or "method" not in message:
+            return error_response(
+                message.get("id") if isinstance(message, dict) else None,
+                INVALID_REQUEST,
+                "Invalid JSON-RPC request"
+            )
+
+        is_notification = "id" not in message
+        request_id = message.get("id")
+        try:
+            result = self._dispatch(message["method"], message.get("params") or {}, user_id)
+        except ProtocolError as e:
+            return None if is_notification else error_response(request_id, e.code, e.message)
+
+        if is_notification:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def _dispatch(self, method: str, params: Dict[str, Any], user_id: Optional[UUID]) -> Dict[str, Any]:
+        if method == "initialize":
+            requested = params.get("protocolVersion")
+            return {
+                "protocolVersion": requested if requested in SUPPORTED_PROTOCOL_VERSIONS else PROTOCOL_VERSION,
+                "capabilities": {"tools": {"listChanged": False}},
+                "serverInfo": {"name": "todo-tasks", "version": settings.APP_VERSION}
+            }
+        if method == "ping" or method.startswith("notifications/"):
+            return {}
+        if method == "tools/list":
+            return {"tools": self.tools}
+        if method == "tools/call":
+            return self._call_tool(params, user_id)
+        raise ProtocolError(METHOD_NOT_FOUND, f"Method not found: {method}")
+
+    def _call_tool(self, params: Dict[str, Any], user_id: Optional[UUID]) -> Dict[str, Any]:
+        name = params.get("name")
+        arguments = params.get("arguments") or {}
+        if name not in TOOL_REGISTRY:
+            raise ProtocolError(INVALID_PARAMS, f"Unknown tool: {name}")
+        if not isinstance(arguments, dict):
+            raise ProtocolError(INVALID_PARAMS, "Tool arguments must be an object")
+        if user_id is None:
+            raise ProtocolError(INVALID_PARAMS, "Not authenticated")
+
+        # CRITICAL: user_id comes from the verified token, never from arguments
+        arguments = {key: value for key, value in arguments.items() if key != "user_id"}
+        with self.session_factory() as session:
+            result = call_tool(session, user_id, name, arguments)
+
+        is_error = "error" in result
+        metrics.inc("mcp_tool_calls_total", tool=name, error=str(is_error).lower())
+        return {
+            "content": [{"type": "text", "text": json.dumps(result, default=str)}],
+            "structuredContent": result,
+            "isError": is_error
+        }
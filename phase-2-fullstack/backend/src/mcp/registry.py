@@ -0,0 +1,160 @@
+"""
+MCP tool registry and batched tool dispatch.
+[Task]: T-014 (Agent Tool Loop)
+[From]: specs/003-phase-iii-chatbot/spec.md §6-7, plan.md §2.1.2-2.1.3
+
+Maps tool names to their implementations and tells read-only tools apart
+from mutations, so one model turn's tool calls can be executed as:
+1. all mutations, in call order, in a single transaction (each inside a
+   savepoint, so one failing call does not undo the others)
+2. then all read-only calls, concurrently, each with its own session
+
+Running reads after the commit means a turn like "complete 1, 2 and 3
+and show my list" lists the tasks with the changes already applied.
+
+Read-only results are served from the per-user tool cache
+(services/tool_cache.py), keyed on the user's data_version; committed
+mutations also invalidate it.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import UUID
+from sqlmodel import Session
+from src.database import engine
+from src.mcp import tools
+from src.services import tool_cache
+from src.services.data_version import get_data_version
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """A registered tool: implementation, accepted arguments, side effects."""
+    handler: Callable[..., Dict[str, Any]]
+    params: Tuple[str, ...]
+    read_only: bool
+
+
+TOOL_REGISTRY: Dict[str, ToolSpec] = {
+    "add_task": ToolSpec(
+        tools.add_task,
+        ("title", "description", "priority", "due_date", "is_recurring", "recurrence_frequency"),
+        read_only=False
+    ),
+    "list_tasks": ToolSpec(
+        tools.list_tasks,
+        ("status", "priority", "due_after", "due_before", "tags", "search", "limit", "offset", "fields"),
+        read_only=True
+    ),
+    "complete_task": ToolSpec(tools.complete_task, ("task_id",), read_only=False),
+    "update_task": ToolSpec(tools.update_task, ("task_id", "title", "description"), read_only=False),
+    "delete_task": ToolSpec(tools.delete_task, ("task_id",), read_only=False),
+}
+
+# Worker threads for concurrent read-only tools (each uses its own connection)
+MAX_PARALLEL_READS = 4
+_read_pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_READS, thread_name_prefix="mcp-read")
+
+ToolCall = Tuple[str, Dict[str, Any]]
+
+
+def is_read_only(tool_name: str) -> bool:
+    """Whether a tool has no side effects (unknown tools are treated as such)."""
+    spec = TOOL_REGISTRY.get(tool_name)
+    return spec is None or spec.read_only
+
+
+def call_tool(
+    session: Session,
+    user_id: UUID,
+    tool_name: str,
+    tool_args: Dict[str, Any],
+    commit: bool = True
+) -> Dict[str, Any]:
+    """
+    Run one tool.
+
+    user_id always comes from the verified token; unknown arguments
+    (including a model-supplied user_id) are dropped. With commit=False a
+    mutation runs inside a savepoint and the caller commits (and
+    invalidates the tool cache).
+    """
+    spec = TOOL_REGISTRY.get(tool_name)
+    if spec is None:
+        return {"error": f"Unknown tool: {tool_name}"}
+
+    kwargs = {name: tool_args[name] for name in spec.params if name in tool_args}
+    try:
+        if spec.read_only:
+            compute = lambda: spec.handler(session, user_id, **kwargs)
+            if not tool_cache.cache_enabled():
+                return compute()
+            return tool_cache.cached_call(
+                user_id, tool_name, kwargs, compute,
+                data_version=get_data_version(session, user_id)
+            )
+        if commit:
+            try:
+                return spec.handler(session, user_id, **kwargs)
+            finally:
+                tool_cache.invalidate_user(user_id)
+
+        savepoint = session.begin_nested()
+        try:
+            result = spec.handler(session, user_id, commit=False, **kwargs)
+            savepoint.commit()
+            return result
+        except Exception:
+            savepoint.rollback()
+            raise
+    except Exception as e:
+        return {"error": f"Tool execution failed: {str(e)}"}
+
+
+def _call_in_new_session(user_id: UUID, tool_name: str, tool_args: Dict[str, Any]) -> Dict[str, Any]:
+    with Session(engine) as session:
+        return call_tool(session, user_id, tool_name, tool_args)
+
+
+def run_tool_calls(
+    session: Session,
+    user_id: UUID,
+    calls: List[ToolCall]
+) -> List[Dict[str, Any]]:
+    """
+    Execute one model turn's tool calls.
+
+    Mutations are applied in order and committed once; read-only tools run
+    afterwards, concurrently when there is more than one.
+
+    Returns:
+        Results in the same order as calls
+    """
+    results: List[Dict[str, Any]] = [{} for _ in calls]
+    mutations = [i for i, (name, _) in enumerate(calls) if not is_read_only(name)]
+    reads = [i for i, (name, _) in enumerate(calls) if is_read_only(name)]
+
+    if mutations:
+        for i in mutations:
+            results[i] = call_tool(session, user_id, *calls[i], commit=False)
+        try:
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            for i in mutations:
+                results[i] = {"error": f"Failed to save changes: {str(e)}"}
+        finally:
+            tool_cache.invalidate_user(user_id)
+
+    if len(reads) == 1:
+        results[reads[0]] = call_tool(session, user_id, *calls[reads[0]])
+    elif reads:
+        futures = {
+            i: _read_pool.submit(_call_in_new_session, user_id, *calls[i])
+            for i in reads
+        }
+        for i, future in futures.items():
+            results[i] = future.result()
+
+    return results
@@ -1,6 +1,6 @@
 """
 MCP server registration and tool definitions.
-[Task]: T-005
+[Task]: T-005, T-017 (Paginated list_tasks)
 [From]: specs/003-phase-iii-chatbot/spec.md §6, plan.md §2.1.2
 
 Provides OpenAI function calling format tool definitions for the agent.
@@ -60,7 +60,7 @@ def get_mcp_tools() -> List[Dict[str, Any]]:
             "type": "function",
             "function": {
                 "name": "list_tasks",
-                "description": "Get all tasks for the user, optionally filtered by completion status",
+                "description": "List the user's tasks one page at a time (newest first), with optional filters. If the result says truncated, more tasks match: narrow the filters or request the next page with offset=next_offset.",
                 "parameters": {
                     "type": "object",
                     "properties": {
@@ -68,6 +68,47 @@ def get_mcp_tools() -> List[Dict[str, Any]]:
                             "type": "string",
                             "enum": ["all", "pending", "completed"],
                             "description": "Filter tasks by completion status (default: all)"
+                        },
+                        "priority": {
+                            "type": "array",
+                            "items": {"type": "string", "enum": ["low", "medium", "high", "urgent"]},
+                            "description": "Only tasks with one of these priorities"
+                        },
+                        "due_after": {
+                            "type": "string",
+                            "description": "Only tasks due on or after this ISO datetime, e.g., '2026-01-25T00:00:00'"
+                        },
+                        "due_before": {
+                            "type": "string",
+                            "description": "Only tasks due on or before this ISO datetime"
+                        },
+                        "tags": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Only tasks that have all of these tag names"
+                        },
+                        "search": {
+                            "type": "string",
+                            "description": "Text to find in task title or description"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "minimum": 1,
+                            "maximum": 50,
+                            "description": "Tasks per page (default: 20)"
+                        },
+                        "offset": {
+                            "type": "integer",
+                            "minimum": 0,
+                            "description": "Tasks to skip; use next_offset from the previous result (default: 0)"
+                        },
+                        "fields": {
+                            "type": "array",
+                            "items": {
+                                "type": "string",
+                                "enum": ["description", "completed", "priority", "due_date", "is_recurring", "created_at"]
+                            },
+                            "description": "Columns to return besides id and title (default: completed, priority, due_date)"
                         }
                     },
                     "required": []
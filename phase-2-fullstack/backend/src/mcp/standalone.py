@@ -0,0 +1,195 @@
+"""
+Standalone MCP server process (stdio and HTTP transports).
+[Task]: T-019 (Standalone MCP Server)
+[From]: specs/003-phase-iii-chatbot/spec.md §6, plan.md §2.1.2
+
+Exposes the task tools to external MCP clients without the FastAPI
+stack. The process keeps its own pooled engine (MCP_DB_POOL_SIZE +
+MCP_DB_MAX_OVERFLOW connections), and every tool call borrows a
+connection only for the duration of the call.
+
+Authentication uses the same JWTs as the API:
+- stdio: one token for the whole session (--token or MCP_ACCESS_TOKEN)
+- HTTP:  Authorization: Bearer <token> on every request
+
+Run with:
+    uv run python -m src.mcp.standalone --transport stdio
+    uv run python -m src.mcp.standalone --transport http --port 8765
+
+HTTP clients POST JSON-RPC messages to /mcp and get JSON back
+(GET /health for probes). Connections are kept alive (HTTP/1.1).
+"""
+
+import argparse
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional, TextIO
+from uuid import UUID
+from sqlmodel import Session, create_engine
+from src.config import settings
+from src.models.user import User
+from src.mcp.protocol import MCPProtocol, error_response, PARSE_ERROR
+from src.utils.security import verify_token
+
+
+Authenticator = Callable[[Optional[str]], Optional[UUID]]
+
+
+def create_mcp_engine():
+    """Pooled engine owned by the MCP server process."""
+    return create_engine(
+        settings.DATABASE_URL,
+        pool_pre_ping=True,
+        pool_size=settings.MCP_DB_POOL_SIZE,
+        max_overflow=settings.MCP_DB_MAX_OVERFLOW
+    )
+
+
+def make_authenticator(session_factory: Callable[[], Session]) -> Authenticator:
+    """Token -> user id (None if the token is invalid or the user is gone)."""
+    def authenticate(token: Optional[str]) -> Optional[UUID]:
+        if not token:
+            return None
+        payload = verify_token(token, settings.BETTER_AUTH_SECRET)
+        if payload is None:
+            return None
+        try:
+            user_id = UUID(payload["user_id"])
+        except ValueError:
+            return None
+        with session_factory() as session:
+            user = session.get(User, user_id)
+        return user.id if user else None
+    return authenticate
+
+
+# ===== stdio transport =====
+
+def serve_stdio(
+    protocol: MCPProtocol,
+    user_id: Optional[UUID],
+    stdin: TextIO = sys.stdin,
+    stdout: TextIO = sys.stdout
+) -> None:
+    """Serve newline-delimited JSON-RPC messages until stdin closes."""
+    for line in stdin:
+        if not line.strip():
+            continue
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            response = error_response(None, PARSE_ERROR, "Parse error")
+        else:
+            response = protocol.handle(message, user_id)
+        if response is not None:
+            stdout.write(json.dumps(response, default=str) + "\n")
+            stdout.flush()
+
+
+# ===== HTTP transport =====
+
+class MCPRequestHandler(BaseHTTPRequestHandler):
+    """POST /mcp (JSON-RPC) and GET /health; state lives on the server."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def _send_json(self, status_code: int, body) -> None:
+        payload = json.dumps(body, default=str).encode()
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_empty(self, status_code: int) -> None:
+        self.send_response(status_code)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "healthy", "service": "mcp"})
+        else:
+            self._send_empty(405 if self.path == "/mcp" else 404)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path != "/mcp":
+            self._send_empty(404)
+            return
+
+        authorization = self.headers.get("Authorization", "")
+        token = authorization[7:] if authorization.lower().startswith("bearer ") else None
+        user_id = self.server.authenticate(token)
+        if user_id is None:
+            self._send_json(401, {"detail": "Invalid or expired token"})
+            return
+
+        try:
+            message = json.loads(body)
+        except json.JSONDecodeError:
+            self._send_json(400, error_response(None, PARSE_ERROR, "Parse error"))
+            return
+
+        response = self.server.protocol.handle(message, user_id)
+        if response is None:
+            self._send_empty(202)  # notifications only
+        else:
+            self._send_json(200, response)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_http_server(
+    protocol: MCPProtocol,
+    authenticate: Authenticator,
+    host: str,
+    port: int
+) -> ThreadingHTTPServer:
+    """HTTP server handling each connection on its own thread."""
+    server = ThreadingHTTPServer((host, port), MCPRequestHandler)
+    server.daemon_threads = True
+    server.protocol = protocol
+    server.authenticate = authenticate
+    return server
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Todo tasks MCP server")
+    parser.add_argument("--transport", choices=["stdio", "http"], default="stdio")
+    parser.add_argument("--host", default=settings.MCP_HTTP_HOST)
+    parser.add_argument("--port", type=int, default=settings.MCP_HTTP_PORT)
+    parser.add_argument("--token", default=os.environ.get("MCP_ACCESS_TOKEN"),
+                        help="JWT for the stdio session (default: $MCP_ACCESS_TOKEN)")
+    args = parser.parse_args(argv)
+
+    engine = create_mcp_engine()
+    session_factory = lambda: Session(engine)
+    protocol = MCPProtocol(session_factory)
+    authenticate = make_authenticator(session_factory)
+
+    if args.transport == "stdio":
+        user_id = authenticate(args.token)
+        if user_id is None:
+            print("❌ A valid --token (or MCP_ACCESS_TOKEN) is required", file=sys.stderr)
+            sys.exit(1)
+        serve_stdio(protocol, user_id)
+        return
+
+    server = make_http_server(protocol, authenticate, args.host, args.port)
+    print(f"✅ MCP server listening on http://{args.host}:{args.port}/mcp", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
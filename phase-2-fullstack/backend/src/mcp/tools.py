@@ -1,17 +1,31 @@
 """
 MCP tool implementations for task operations.
-[Task]: T-004
+[Task]: T-004, T-017 (Paginated list_tasks), T-025 (Conditional GET), T-028 (Delta Sync)
 [From]: specs/003-phase-iii-chatbot/spec.md §6, plan.md §2.1.2
 
 These tools provide stateless, database-backed operations for task management.
 All tools enforce user isolation through user_id filtering.
 """
 
-from sqlmodel import Session, select, col
+from sqlmodel import Session, select, col, or_, func
 from src.models.task import Task, Priority, RecurrenceFrequency
+from src.models.tag import Tag, TaskTag
+from src.services.reminder_timer import notify_reminder_changed
+from src.services.data_version import bump_data_version
+from src.services.recurrence import compute_next_occurrence, roll_completed_tasks
+from src.services.task_sync import record_deletions
 from uuid import UUID
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional
+from datetime import datetime, timezone
+from enum import Enum
+
+
+def _finish(session: Session, commit: bool) -> None:
+    """Commit the tool's changes, or only flush them when part of a batch."""
+    if commit:
+        session.commit()
+    else:
+        session.flush()
 
 
 def add_task(
@@ -22,7 +36,8 @@ def add_task(
     priority: Optional[str] = "medium",
     due_date: Optional[str] = None,
     is_recurring: Optional[bool] = False,
-    recurrence_frequency: Optional[str] = "daily"
+    recurrence_frequency: Optional[str] = "daily",
+    commit: bool = True
 ) -> Dict[str, Any]:
     """
     Create a new task for the user with Phase 5 advanced features.
@@ -36,6 +51,7 @@ def add_task(
         due_date: Due date in ISO format (YYYY-MM-DDTHH:MM:SS)
         is_recurring: Whether task repeats
         recurrence_frequency: How often it repeats (daily, weekly, monthly, yearly)
+        commit: Commit immediately (False: flush only, caller commits the batch)
         
     Returns:
         {"task_id": int, "status": "created", "title": str, "priority": str, "due_date": str, "is_recurring": bool}
@@ -67,8 +83,10 @@ def add_task(
             is_recurring=is_recurring,
             recurrence_pattern=recurrence_pattern
         )
+        task.next_occurrence_at = compute_next_occurrence(task)
         session.add(task)
-        session.commit()
+        bump_data_version(session, user_id)
+        _finish(session, commit)
         session.refresh(task)
         
         return {
@@ -81,48 +99,141 @@ def add_task(
             "is_recurring": task.is_recurring
         }
     except Exception as e:
+        if not commit:
+            raise
         session.rollback()
         return {"error": f"Failed to create task: {str(e)}"}
 
 
+# Columns list_tasks can return. Only the requested ones are selected, so
+# the tool result (which is sent back to the model) stays small.
+LIST_FIELDS = {
+    "id": Task.id,
+    "title": Task.title,
+    "description": Task.description,
+    "completed": Task.completed,
+    "priority": Task.priority,
+    "due_date": Task.due_date,
+    "is_recurring": Task.is_recurring,
+    "created_at": Task.created_at,
+}
+DEFAULT_LIST_FIELDS = ("id", "title", "completed", "priority", "due_date")
+DEFAULT_LIST_LIMIT = 20
+MAX_LIST_LIMIT = 50
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
 def list_tasks(
     session: Session,
     user_id: UUID,
-    status: str = "all"
+    status: str = "all",
+    priority: Optional[List[str]] = None,
+    due_after: Optional[str] = None,
+    due_before: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    search: Optional[str] = None,
+    limit: int = DEFAULT_LIST_LIMIT,
+    offset: int = 0,
+    fields: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
-    List all tasks for the user, optionally filtered by completion status.
+    List one page of the user's tasks, filtered and projected.
+    
+    Only the requested columns are selected. One extra row is fetched to
+    tell whether more tasks match, instead of counting them all.
     
     Args:
         session: Database session
         user_id: User UUID from JWT token
         status: Filter by status ('all', 'pending', 'completed')
+        priority: Only these priorities (low, medium, high, urgent)
+        due_after: Due on or after this ISO datetime
+        due_before: Due on or before this ISO datetime
+        tags: Tag names the task must all have
+        search: Case-insensitive text in title or description
+        limit: Page size (default 20, at most 50)
+        offset: Tasks to skip (use next_offset from the previous page)
+        fields: Columns to return (id and title are always included)
         
     Returns:
-        {"tasks": [...], "count": int}
+        {"tasks": [...], "count": int, "truncated": bool, "next_offset": int | None}
     """
     try:
-        query = select(Task).where(Task.user_id == user_id)
+        columns = ["id", "title"] + [
+            name for name in (fields or DEFAULT_LIST_FIELDS)
+            if name in LIST_FIELDS and name not in ("id", "title")
+        ]
+        limit = min(max(int(limit or DEFAULT_LIST_LIMIT), 1), MAX_LIST_LIMIT)
+        offset = max(int(offset or 0), 0)
+        
+        query = select(*[LIST_FIELDS[name] for name in columns]).where(Task.user_id == user_id)
         
         if status == "pending":
             query = query.where(Task.completed == False)
         elif status == "completed":
             query = query.where(Task.completed == True)
         
-        tasks = session.exec(query.order_by(col(Task.created_at).desc())).all()
+        if priority:
+            if isinstance(priority, str):
+                priority = [priority]
+            query = query.where(Task.priority.in_([Priority(p) for p in priority]))
+        
+        parsed_after = _parse_datetime(due_after)
+        parsed_before = _parse_datetime(due_before)
+        if parsed_after:
+            query = query.where(Task.due_date >= parsed_after)
+        if parsed_before:
+            query = query.where(Task.due_date <= parsed_before)
+        
+        if search:
+            pattern = f"%{search}%"
+            query = query.where(or_(Task.title.ilike(pattern), Task.description.ilike(pattern)))
+        
+        # Task must have every tag (names are per user, case-insensitive)
+        if isinstance(tags, str):
+            tags = [tags]
+        for tag_name in {name.strip().lower() for name in tags or [] if name and name.strip()}:
+            query = query.where(
+                Task.id.in_(
+                    select(TaskTag.task_id)
+                    .join(Tag, Tag.id == TaskTag.tag_id)
+                    .where(Tag.created_by == user_id, func.lower(Tag.name) == tag_name)
+                )
+            )
+        
+        rows = session.exec(
+            query.order_by(col(Task.created_at).desc(), col(Task.id).desc())
+            .offset(offset)
+            .limit(limit + 1)
+        ).all()
+        
+        truncated = len(rows) > limit
+        rows = rows[:limit]
         
         return {
             "tasks": [
-                {
-                    "id": task.id,
-                    "title": task.title,
-                    "description": task.description,
-                    "completed": task.completed,
-                    "created_at": task.created_at.isoformat() if task.created_at else None
-                }
-                for task in tasks
+                {name: _json_value(value) for name, value in zip(columns, row)}
+                for row in rows
             ],
-            "count": len(tasks)
+            "count": len(rows),
+            "truncated": truncated,
+            "next_offset": offset + limit if truncated else None
         }
     except Exception as e:
         return {"error": f"Failed to list tasks: {str(e)}"}
@@ -131,7 +242,8 @@ def list_tasks(
 def complete_task(
     session: Session,
     user_id: UUID,
-    task_id: int
+    task_id: int,
+    commit: bool = True
 ) -> Dict[str, Any]:
     """
     Mark a task as completed.
@@ -140,6 +252,7 @@ def complete_task(
         session: Database session
         user_id: User UUID from JWT token
         task_id: ID of the task to complete
+        commit: Commit immediately (False: flush only, caller commits the batch)
         
     Returns:
         {"task_id": int, "status": "completed", "title": str}
@@ -160,16 +273,27 @@ def complete_task(
             return {"error": "Task not found or access denied"}
         
         task.completed = True
+        task.updated_at = datetime.utcnow()
         session.add(task)
-        session.commit()
+        if task.reminder_time:
+            notify_reminder_changed(session, task.id)
+        next_tasks = roll_completed_tasks(session, [task])
+        bump_data_version(session, user_id)
+        _finish(session, commit)
         session.refresh(task)
         
-        return {
+        result = {
             "task_id": task.id,
             "status": "completed",
             "title": task.title
         }
+        if next_tasks:
+            result["next_task_id"] = next_tasks[0].id
+            result["next_due_date"] = next_tasks[0].due_date.isoformat()
+        return result
     except Exception as e:
+        if not commit:
+            raise
         session.rollback()
         return {"error": f"Failed to complete task: {str(e)}"}
 
@@ -179,7 +303,8 @@ def update_task(
     user_id: UUID,
     task_id: int,
     title: Optional[str] = None,
-    description: Optional[str] = None
+    description: Optional[str] = None,
+    commit: bool = True
 ) -> Dict[str, Any]:
     """
     Update task title and/or description.
@@ -190,6 +315,7 @@ def update_task(
         task_id: ID of the task to update
         title: New task title (optional)
         description: New task description (optional)
+        commit: Commit immediately (False: flush only, caller commits the batch)
         
     Returns:
         {"task_id": int, "status": "updated", "title": str}
@@ -213,9 +339,11 @@ def update_task(
             task.title = title
         if description is not None:
             task.description = description
+        task.updated_at = datetime.utcnow()
         
         session.add(task)
-        session.commit()
+        bump_data_version(session, user_id)
+        _finish(session, commit)
         session.refresh(task)
         
         return {
@@ -224,6 +352,8 @@ def update_task(
             "title": task.title
         }
     except Exception as e:
+        if not commit:
+            raise
         session.rollback()
         return {"error": f"Failed to update task: {str(e)}"}
 
@@ -231,7 +361,8 @@ def update_task(
 def delete_task(
     session: Session,
     user_id: UUID,
-    task_id: int
+    task_id: int,
+    commit: bool = True
 ) -> Dict[str, Any]:
     """
     Permanently delete a task.
@@ -240,6 +371,7 @@ def delete_task(
         session: Database session
         user_id: User UUID from JWT token
         task_id: ID of the task to delete
+        commit: Commit immediately (False: flush only, caller commits the batch)
         
     Returns:
         {"task_id": int, "status": "deleted", "title": str}
@@ -260,8 +392,12 @@ def delete_task(
             return {"error": "Task not found or access denied"}
         
         title = task.title
+        if task.reminder_time:
+            notify_reminder_changed(session, task.id)
         session.delete(task)
-        session.commit()
+        record_deletions(session, user_id, [task_id])
+        bump_data_version(session, user_id)
+        _finish(session, commit)
         
         return {
             "task_id": task_id,
@@ -269,5 +405,7 @@ def delete_task(
             "title": title
         }
     except Exception as e:
+        if not commit:
+            raise
         session.rollback()
         return {"error": f"Failed to delete task: {str(e)}"}
@@ -1,11 +1,14 @@
 """
 Database models.
-[Task]: T-A-004, T-A-005, T-A-006 (Phase V Extensions)
+[Task]: T-A-004, T-A-005, T-A-006 (Phase V Extensions), T-028 (Delta Sync),
+        T-030 (Task Archive)
 """
 from src.models.user import User
 from src.models.task import Task, Priority, RecurrenceFrequency, RecurrencePattern
 from src.models.tag import Tag, TaskTag
 from src.models.event_log import EventLog
+from src.models.task_tombstone import TaskTombstone
+from src.models.archived_task import ArchivedTask
 
 __all__ = [
     "User",
@@ -16,4 +19,6 @@ __all__ = [
     "Tag",
     "TaskTag",
     "EventLog",
+    "TaskTombstone",
+    "ArchivedTask",
 ]
@@ -0,0 +1,67 @@
+"""
+Archive tier for long-completed tasks.
+[Task]: T-030 (Task Archive)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+"""
+
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from uuid import UUID
+from datetime import datetime
+from typing import Optional, List
+from src.models.task import Priority
+
+
+class ArchivedTask(SQLModel, table=True):
+    """
+    A completed task moved out of the hot tasks table.
+
+    [Task]: T-030
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1
+
+    Columns mirror Task so rows move with INSERT ... SELECT in both
+    directions and list_tasks can UNION the two tables. The task keeps its
+    id (unarchiving restores it as-is); tag links are kept as tag_ids,
+    since task_tags rows cascade away with the task.
+    """
+    __tablename__ = "archived_tasks"
+    __table_args__ = (
+        Index("ix_archived_tasks_user_created", "user_id", text("created_at DESC")),
+    )
+
+    id: int = Field(
+        primary_key=True,
+        nullable=False,
+        sa_column_kwargs={"autoincrement": False}
+    )
+
+    user_id: UUID = Field(
+        foreign_key="users.id",
+        nullable=False,
+        ondelete="CASCADE"
+    )
+
+    title: str = Field(nullable=False, max_length=200)
+    description: Optional[str] = Field(default=None, max_length=1000)
+    completed: bool = Field(default=True, nullable=False)
+    priority: Priority = Field(default=Priority.MEDIUM, nullable=False)
+    due_date: Optional[datetime] = Field(default=None, nullable=True)
+    reminder_time: Optional[datetime] = Field(default=None, nullable=True)
+    is_recurring: bool = Field(default=False, nullable=False)
+    recurrence_pattern: Optional[str] = Field(default=None, nullable=True, sa_type=JSONB)
+    next_occurrence_at: Optional[datetime] = Field(default=None, nullable=True)
+    created_at: datetime = Field(nullable=False)
+    updated_at: datetime = Field(nullable=False)
+    version: int = Field(default=1, nullable=False)
+
+    tag_ids: List[int] = Field(
+        default_factory=list,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'[]'")),
+        description="Tag ids the task carried when it was archived"
+    )
+
+    archived_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        nullable=False
+    )
@@ -5,6 +5,7 @@ Conversation model for storing chat sessions.
 """
 
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Text
 from datetime import datetime
 from uuid import UUID
 from typing import Optional, List, TYPE_CHECKING
@@ -17,6 +18,9 @@ class Conversation(SQLModel, table=True):
     """
     Represents a chat conversation between user and AI assistant.
     Each conversation contains multiple messages.
+    
+    Messages that fall out of the prompt window are folded into `summary`;
+    `summary_through_id` is the id of the newest message folded so far.
     """
     __tablename__ = "conversations"
     
@@ -24,6 +28,8 @@ class Conversation(SQLModel, table=True):
     user_id: UUID = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    summary: Optional[str] = Field(default=None, sa_type=Text)
+    summary_through_id: Optional[int] = Field(default=None)
     
     # Relationships
     messages: List["Message"] = Relationship(back_populates="conversation")
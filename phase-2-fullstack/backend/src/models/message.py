@@ -5,6 +5,7 @@ Message model for storing conversation messages.
 """
 
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, text
 from datetime import datetime
 from uuid import UUID
 from typing import Optional, TYPE_CHECKING
@@ -17,11 +18,17 @@ class Message(SQLModel, table=True):
     """
     Represents a single message in a conversation.
     Role can be 'user' or 'assistant'.
+    
+    History is read newest-first per conversation, served by
+    ix_messages_conversation_created (conversation_id, created_at DESC).
     """
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_conversation_created", "conversation_id", text("created_at DESC")),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
-    conversation_id: int = Field(foreign_key="conversations.id", index=True, ondelete="CASCADE")
+    conversation_id: int = Field(foreign_key="conversations.id", ondelete="CASCADE")
     user_id: UUID = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
     role: str = Field(max_length=20)  # 'user' or 'assistant'
     content: str
@@ -6,6 +6,7 @@ Tag model for task organization.
 """
 
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, text
 from uuid import UUID
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
@@ -24,8 +25,20 @@ class Tag(SQLModel, table=True):
     
     Tags are user-created labels that can be applied to multiple tasks.
     Each tag has a name and color for visual organization.
+    
+    Tag names are scoped per user: uniqueness is enforced case-insensitively
+    on (created_by, lower(name)), so every lookup is bounded by the user's
+    own tag count.
     """
     __tablename__ = "tags"
+    __table_args__ = (
+        Index(
+            "ux_tags_created_by_lower_name",
+            "created_by",
+            text("lower(name)"),
+            unique=True
+        ),
+    )
     
     id: Optional[int] = Field(
         default=None,
@@ -35,11 +48,9 @@ class Tag(SQLModel, table=True):
     
     name: str = Field(
         nullable=False,
-        unique=True,
-        index=True,
         min_length=1,
         max_length=50,
-        description="Tag name (unique across all users)"
+        description="Tag name (unique per user, case-insensitive)"
     )
     
     color: str = Field(
@@ -58,7 +69,8 @@ class Tag(SQLModel, table=True):
     created_by: UUID = Field(
         foreign_key="users.id",
         nullable=False,
-        description="User who created this tag"
+        ondelete="CASCADE",
+        description="User who created this tag (owner of the tag namespace)"
     )
     
     # Relationships
@@ -7,9 +7,10 @@ Task model for todo management.
 """
 
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import BigInteger, Column, Index, Integer, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, date
 from typing import Optional, TYPE_CHECKING, List
 from enum import Enum
 import json
@@ -51,13 +52,34 @@ class RecurrencePattern(SQLModel):
     """
     frequency: RecurrenceFrequency
     interval: int = 1
-    days_of_week: Optional[List[int]] = None  # 0=Sunday, 6=Saturday
+    days_of_week: Optional[List[int]] = None  # 0=Monday, 6=Sunday
     day_of_month: Optional[int] = None  # 1-31
     month: Optional[int] = None  # 1-12
-    end_date: Optional[datetime] = None
+    end_date: Optional[date] = None
     occurrences: Optional[int] = None
 
 
+# Row version for optimistic concurrency (see Task.__mapper_args__)
+_version_column = Column("version", Integer, nullable=False, server_default=text("1"))
+
+
+def sync_xid_column(on_update: bool = True) -> Column:
+    """
+    Id of the transaction that last wrote the row (delta sync, see services/task_sync.py).
+
+    Set by every ORM and Core INSERT (and UPDATE, if on_update) through the
+    model, so write paths need not stamp it themselves.
+    """
+    return Column(
+        "sync_xid",
+        BigInteger,
+        nullable=False,
+        default=func.txid_current(),
+        onupdate=func.txid_current() if on_update else None,
+        server_default=text("0")
+    )
+
+
 class Task(SQLModel, table=True):
     """
     Task/Todo item model with Phase V advanced features.
@@ -71,8 +93,56 @@ class Task(SQLModel, table=True):
     - Due dates and reminder times
     - Recurring task support with flexible patterns
     - Tag relationships for organization
+    
+    Indexes are composite and led by user_id, matching list_tasks: every
+    list query filters by user first and then sorts by one column, so each
+    supported sort field has its own (user_id, <field>) index and the
+    default "pending/completed, newest first" view has a dedicated one.
+    Cross-user scheduler scans use partial indexes over pending tasks.
+    Tasks completed long ago move to archived_tasks (services/archiver.py).
+    
+    version is SQLAlchemy's version counter: every ORM flush of a task is
+    UPDATE ... WHERE id = ? AND version = ? with version + 1, and raises
+    StaleDataError if another writer got there first. Bulk UPDATEs must
+    bump it themselves. sync_xid, by contrast, is stamped automatically on
+    every write and drives delta sync.
     """
     __tablename__ = "tasks"
+    __mapper_args__ = {"version_id_col": _version_column}
+    __table_args__ = (
+        Index("ix_tasks_user_created", "user_id", text("created_at DESC")),
+        Index("ix_tasks_user_completed_created", "user_id", "completed", text("created_at DESC")),
+        Index("ix_tasks_user_updated", "user_id", text("updated_at DESC")),
+        Index("ix_tasks_user_sync_xid", "user_id", "sync_xid"),
+        Index("ix_tasks_user_due", "user_id", "due_date"),
+        Index("ix_tasks_user_priority", "user_id", "priority"),
+        Index("ix_tasks_user_title", "user_id", "title"),
+        # Partial indexes for the reminder/overdue scheduler: only pending
+        # tasks with a timestamp set are indexed, so cron ticks touch just
+        # the rows that can actually fire.
+        Index(
+            "ix_tasks_pending_reminder",
+            "reminder_time",
+            postgresql_where=text("completed = false AND reminder_time IS NOT NULL")
+        ),
+        Index(
+            "ix_tasks_pending_due",
+            "due_date",
+            postgresql_where=text("completed = false AND due_date IS NOT NULL")
+        ),
+        # Recurring tasks waiting to be rolled into their next instance
+        Index(
+            "ix_tasks_next_occurrence",
+            "next_occurrence_at",
+            postgresql_where=text("next_occurrence_at IS NOT NULL")
+        ),
+        # Completed tasks in completion order, for the archiver
+        Index(
+            "ix_tasks_completed_updated",
+            "updated_at",
+            postgresql_where=text("completed = true")
+        ),
+    )
     
     id: Optional[int] = Field(
         default=None,
@@ -82,8 +152,7 @@ class Task(SQLModel, table=True):
     
     user_id: UUID = Field(
         foreign_key="users.id",
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     title: str = Field(
@@ -106,14 +175,12 @@ class Task(SQLModel, table=True):
     priority: Priority = Field(
         default=Priority.MEDIUM,
         nullable=False,
-        index=True,
         description="Task priority: low, medium, high, urgent"
     )
     
     due_date: Optional[datetime] = Field(
         default=None,
         nullable=True,
-        index=True,
         description="When the task is due"
     )
     
@@ -126,7 +193,6 @@ class Task(SQLModel, table=True):
     is_recurring: bool = Field(
         default=False,
         nullable=False,
-        index=True,
         description="Whether this task repeats on a schedule"
     )
     
@@ -137,10 +203,15 @@ class Task(SQLModel, table=True):
         description="JSONB: RecurrencePattern configuration"
     )
     
+    next_occurrence_at: Optional[datetime] = Field(
+        default=None,
+        nullable=True,
+        description="Precomputed next occurrence of a recurring task (cleared once rolled)"
+    )
+    
     created_at: datetime = Field(
         default_factory=datetime.utcnow,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     updated_at: datetime = Field(
@@ -148,6 +219,18 @@ class Task(SQLModel, table=True):
         nullable=False
     )
     
+    version: int = Field(
+        default=1,
+        sa_column=_version_column,
+        description="Incremented on every write; the ETag is task-<id>-<version>"
+    )
+    
+    sync_xid: Optional[int] = Field(
+        default=None,
+        sa_column=sync_xid_column(),
+        description="Transaction that last wrote the task (delta sync)"
+    )
+    
     # Relationships
     user: "User" = Relationship(back_populates="tasks")
     tags: List["Tag"] = Relationship(
@@ -164,7 +247,9 @@ class Task(SQLModel, table=True):
         """
         if self.recurrence_pattern:
             try:
-                data = json.loads(self.recurrence_pattern)
+                data = self.recurrence_pattern
+                if isinstance(data, str):
+                    data = json.loads(data)
                 return RecurrencePattern(**data)
             except (json.JSONDecodeError, TypeError, ValueError):
                 return None
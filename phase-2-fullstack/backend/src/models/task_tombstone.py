@@ -0,0 +1,56 @@
+"""
+Tombstones for deleted tasks (delta sync).
+[Task]: T-028 (Delta Sync)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+"""
+
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from uuid import UUID
+from datetime import datetime
+from typing import Optional
+from src.models.task import sync_xid_column
+
+
+class TaskTombstone(SQLModel, table=True):
+    """
+    Record of a deleted task, kept so sync clients can drop it locally.
+    
+    [Task]: T-028
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1
+    
+    task_id has no foreign key: the task row is gone. Tombstones older
+    than SYNC_TOMBSTONE_RETENTION_DAYS are pruned, and sync tokens older
+    than that are refused (the client refetches the full list).
+    """
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        Index("ix_task_tombstones_user_deleted", "user_id", "deleted_at"),
+        Index("ix_task_tombstones_user_sync_xid", "user_id", "sync_xid"),
+    )
+    
+    id: Optional[int] = Field(
+        default=None,
+        primary_key=True,
+        nullable=False
+    )
+    
+    task_id: int = Field(nullable=False)
+    
+    user_id: UUID = Field(
+        foreign_key="users.id",
+        nullable=False,
+        ondelete="CASCADE"
+    )
+    
+    deleted_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        nullable=False,
+        index=True
+    )
+    
+    sync_xid: Optional[int] = Field(
+        default=None,
+        sa_column=sync_xid_column(on_update=False),
+        description="Transaction that deleted the task (delta sync)"
+    )
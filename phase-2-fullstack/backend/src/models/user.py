@@ -1,10 +1,11 @@
 """
 User model for authentication.
-[Task]: T-005 (User Model)
+[Task]: T-005 (User Model), T-024 (Case-Insensitive Email), T-025 (Conditional GET)
 [From]: spec.md §7.1, plan.md §5
 """
 
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import BigInteger, Index, text
 from uuid import UUID, uuid4
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
@@ -18,8 +19,20 @@ class User(SQLModel, table=True):
     User account model.
     
     Primary entity for authentication and task ownership.
+    
+    Emails are unique case-insensitively via ux_users_lower_email on
+    lower(email); register and login look users up by lower(email), so
+    the index serves both and Foo@x.com cannot sign up next to foo@x.com.
+    The address is stored as entered.
+    
+    `data_version` is bumped in the same transaction as every change to
+    the user's tasks or tags (services/data_version.py); read endpoints
+    derive their ETags from it.
     """
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ux_users_lower_email", text("lower(email)"), unique=True),
+    )
     
     id: UUID = Field(
         default_factory=uuid4,
@@ -28,8 +41,6 @@ class User(SQLModel, table=True):
     )
     
     email: str = Field(
-        unique=True,
-        index=True,
         nullable=False,
         max_length=255
     )
@@ -49,5 +60,11 @@ class User(SQLModel, table=True):
         nullable=False
     )
     
+    data_version: int = Field(
+        default=0,
+        nullable=False,
+        sa_type=BigInteger
+    )
+    
     # Relationships
     tasks: List["Task"] = Relationship(back_populates="user", cascade_delete=True)
@@ -1,4 +1,4 @@
 """API routers."""
-from src.routers import auth, tasks, tags, stats, jobs, chat
+from src.routers import auth, tasks, tags, stats, jobs, chat, agenda
 
-__all__ = ["auth", "tasks", "tags", "stats", "jobs", "chat"]
+__all__ = ["auth", "tasks", "tags", "stats", "jobs", "chat", "agenda"]
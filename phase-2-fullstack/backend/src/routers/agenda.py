@@ -0,0 +1,153 @@
+"""
+Calendar/agenda endpoint.
+[Task]: T-B-014 (Agenda View), T-026 (Fast JSON Responses)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §2.1-2.2, §5.1
+
+Returns a user's tasks grouped into day or week buckets over a date range
+from a single bounded query. Recurring tasks are expanded in memory from
+their stored pattern, so a month view costs one query instead of paging
+through list_tasks.
+"""
+
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from sqlmodel import Session, select, and_, or_, func
+from uuid import UUID
+from datetime import datetime, date, timedelta
+from typing import Optional, Dict, List
+from src.database import get_session
+from src.models.task import Task
+from src.schemas.task import (
+    AgendaItem,
+    AgendaBucket,
+    AgendaResponse,
+    TaskResponse
+)
+from src.utils.deps import get_current_user_id
+from src.utils.responses import FastJSONResponse
+from src.services.task_tags import load_tags
+from src.services.recurrence import expand_occurrences, task_anchor, naive_utc
+
+router = APIRouter(prefix="/api/{user_id}/agenda", tags=["agenda"])
+
+# Longest range one request may cover
+MAX_RANGE_DAYS = 366
+
+# Cap on expanded occurrences per recurring task (daily tasks over a year)
+MAX_OCCURRENCES_PER_TASK = MAX_RANGE_DAYS
+
+
+def _bucket_start(value: datetime, bucket: str) -> date:
+    """First day of the bucket containing value (weeks start on Monday)."""
+    day = value.date()
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def _agenda_query(user_id: UUID, start: datetime, end: datetime):
+    """
+    Single bounded query for the agenda range.
+    
+    Matches tasks due in range (ix_tasks_user_due) plus pending recurring
+    series that started before the range end and still have occurrences
+    left (next_occurrence_at is set).
+    """
+    return select(Task).where(
+        Task.user_id == user_id,
+        or_(
+            and_(Task.due_date >= start, Task.due_date <= end),
+            and_(
+                Task.completed == False,
+                Task.next_occurrence_at.isnot(None),
+                func.coalesce(Task.due_date, Task.created_at) <= end
+            )
+        )
+    )
+
+
+@router.get("", response_model=AgendaResponse)
+def get_agenda(
+    user_id: UUID,
+    from_: datetime = Query(..., alias="from", description="Range start"),
+    to: datetime = Query(..., description="Range end (inclusive)"),
+    bucket: str = Query("day", pattern="^(day|week)$", description="Bucket size (day, week)"),
+    current_user_id: UUID = Depends(get_current_user_id),
+    session: Session = Depends(get_session)
+):
+    """
+    Get tasks grouped by day or week for a calendar view.
+    
+    A task appears at its due date. Pending recurring tasks also appear at
+    every occurrence of their pattern within the range (projected=true for
+    occurrences after the current instance). Buckets are in UTC and every
+    bucket in the range is returned, even when empty.
+    
+    [Task]: T-B-014
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §2.1-2.2
+    """
+    # CRITICAL: Verify path user_id matches authenticated user
+    if str(current_user_id) != str(user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not found"
+        )
+    
+    start, end = naive_utc(from_), naive_utc(to)
+    if end < start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'to' must not be before 'from'"
+        )
+    if end - start > timedelta(days=MAX_RANGE_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range cannot exceed {MAX_RANGE_DAYS} days"
+        )
+    
+    tasks = session.exec(_agenda_query(current_user_id, start, end)).all()
+    
+    tags_by_task = load_tags(session, [task.id for task in tasks])
+    
+    items: List[AgendaItem] = []
+    truncated = False
+    for task in tasks:
+        task_dict = task.model_dump()
+        task_dict["tags"] = tags_by_task[task.id]
+        task_response = TaskResponse.model_validate(task_dict)
+        
+        pattern = task.recurrence if task.is_recurring and not task.completed else None
+        if pattern:
+            anchor = task_anchor(task)
+            occurrences, capped = expand_occurrences(
+                pattern, anchor, start, end, MAX_OCCURRENCES_PER_TASK
+            )
+            truncated = truncated or capped
+            for occurrence in occurrences:
+                items.append(AgendaItem(
+                    occurs_at=occurrence,
+                    projected=occurrence != anchor,
+                    task=task_response
+                ))
+        elif task.due_date and start <= task.due_date <= end:
+            items.append(AgendaItem(occurs_at=task.due_date, task=task_response))
+    
+    items.sort(key=lambda item: (item.occurs_at, item.task.id))
+    
+    # Dense buckets: calendar grids need empty days/weeks too
+    buckets: Dict[date, List[AgendaItem]] = {}
+    day = _bucket_start(start, bucket)
+    step = timedelta(days=7 if bucket == "week" else 1)
+    while day <= end.date():
+        buckets[day] = []
+        day += step
+    for item in items:
+        buckets[_bucket_start(item.occurs_at, bucket)].append(item)
+    
+    return FastJSONResponse(AgendaResponse(
+        range_start=start,
+        range_end=end,
+        bucket=bucket,
+        buckets=[AgendaBucket(start=day, items=day_items) for day, day_items in buckets.items()],
+        count=len(items),
+        truncated=truncated
+    ))
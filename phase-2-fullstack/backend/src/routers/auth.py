@@ -1,10 +1,15 @@
 """
 Authentication endpoints (register, login).
-[Task]: T-009 (Auth Endpoints)
+[Task]: T-009 (Auth Endpoints), T-021 (Password Hashing Pool), T-022 (Password Hash Policy),
+        T-024 (Case-Insensitive Email)
 [From]: spec.md §6.1, plan.md §7
 """
 
+from datetime import datetime
+from uuid import uuid4
 from fastapi import APIRouter, HTTPException, status, Depends
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import Session, select
 from src.database import get_session
 from src.models.user import User
@@ -14,12 +19,30 @@ from src.schemas.auth import (
     LoginRequest,
     LoginResponse
 )
-from src.utils.security import hash_password, verify_password, create_access_token
+from src.utils.security import hash_password, verify_password, needs_rehash, create_access_token
+from src.utils.password_pool import PasswordPoolBusy
 from src.config import settings
 
 router = APIRouter(prefix="/api/auth", tags=["authentication"])
 
 
+def _hashing_busy() -> HTTPException:
+    """503 when the password hashing pool is saturated."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Server is busy. Please try again shortly.",
+        headers={"Retry-After": "1"}
+    )
+
+
+def _email_taken() -> HTTPException:
+    """409 for a registration with an address already in use."""
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="An account with this email already exists"
+    )
+
+
 @router.post("/register", response_model=RegisterResponse, status_code=status.HTTP_201_CREATED)
 def register(
     request: RegisterRequest,
@@ -28,36 +51,52 @@ def register(
     """
     Register new user account.
     
-    - Email must be unique
+    - Email must be unique (case-insensitive)
     - Password minimum 8 characters
     - Returns user information
+    
+    Duplicates are rejected before the password is hashed, so repeated
+    signups for a taken address cost one index lookup, not a hash.
     """
-    # Check if email already exists
-    existing_user = session.exec(
-        select(User).where(User.email == request.email)
+    # Existing account? (served by ux_users_lower_email). Register already
+    # answers 409 for a taken address, so checking first reveals nothing new.
+    exists = session.exec(
+        select(User.id).where(func.lower(User.email) == request.email.lower())
     ).first()
-    
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="An account with this email already exists"
-        )
+    if exists is not None:
+        raise _email_taken()
+    # End the read so no pooled connection is held while hashing
+    session.rollback()
     
     # Hash password
-    password_hash = hash_password(request.password)
+    try:
+        password_hash = hash_password(request.password)
+    except PasswordPoolBusy:
+        raise _hashing_busy()
     
-    # Create user
-    user = User(
-        email=request.email,
-        password_hash=password_hash
-    )
-    session.add(user)
+    # Create user; the unique index on lower(email) still decides duplicates,
+    # so concurrent signups for one address cannot both succeed
+    now = datetime.utcnow()
+    created = session.execute(
+        insert(User)
+        .values(
+            id=uuid4(),
+            email=request.email,
+            password_hash=password_hash,
+            created_at=now,
+            updated_at=now
+        )
+        .on_conflict_do_nothing(index_elements=[func.lower(User.email)])
+        .returning(User.id, User.email)
+    ).first()
     session.commit()
-    session.refresh(user)
+    
+    if created is None:
+        raise _email_taken()
     
     return RegisterResponse(
-        id=user.id,
-        email=user.email,
+        id=created.id,
+        email=created.email,
         message="Account created successfully"
     )
 
@@ -70,11 +109,12 @@ def login(
     """
     Login with email and password.
     
-    Returns JWT token valid for 7 days.
+    Returns JWT token valid for 7 days. A password hash made with an older
+    algorithm or cost is replaced with one matching the current policy.
     """
-    # Get user by email
+    # Get user by email (case-insensitive, served by ux_users_lower_email)
     user = session.exec(
-        select(User).where(User.email == request.email)
+        select(User).where(func.lower(User.email) == request.email.lower())
     ).first()
     
     # Verify user exists and password is correct
@@ -84,12 +124,29 @@ def login(
             detail="Invalid email or password"
         )
     
-    if not verify_password(request.password, user.password_hash):
+    try:
+        password_ok = verify_password(request.password, user.password_hash)
+    except PasswordPoolBusy:
+        raise _hashing_busy()
+    
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
     
+    # Upgrade the stored hash while the plain password is at hand
+    if needs_rehash(user.password_hash):
+        try:
+            user.password_hash = hash_password(request.password)
+        except PasswordPoolBusy:
+            pass  # Try again at the next login
+        else:
+            user.updated_at = datetime.utcnow()
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+    
     # Generate JWT token
     access_token = create_access_token(
         user_id=user.id,
@@ -1,21 +1,28 @@
 """
 Chat API endpoint for AI agent interaction.
-[Task]: T-007
+[Task]: T-007, T-012 (Streaming Chat), T-015 (History Window),
+        T-018 (Chat Turn Transactions), T-020 (Request Coalescing)
 [From]: specs/003-phase-iii-chatbot/spec.md §5.1, plan.md §2.1.4
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
-from sqlmodel import Session, select, col
+import json
+from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import insert, update
+from sqlmodel import Session, select
 from pydantic import BaseModel
 from uuid import UUID
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
-from src.database import get_session
-from src.models.user import User
+from src.database import get_session, engine
 from src.models.conversation import Conversation
 from src.models.message import Message
-from src.utils.deps import get_current_user
-from src.agent.runner import run_agent
+from src.utils.deps import get_current_user_id
+from src.agent.runner import run_agent, stream_agent
+from src.agent.history import load_history, fold_history
+from src.utils.singleflight import SingleFlight
 
 router = APIRouter(prefix="/api", tags=["chat"])
 
@@ -32,11 +39,152 @@ class ChatResponse(BaseModel):
     tool_calls: List[Dict[str, Any]]
 
 
+def _persist_messages(
+    session: Session,
+    user_id: UUID,
+    conversation_id: Optional[int],
+    messages: List[Tuple[str, str, datetime]]
+) -> int:
+    """
+    Store (role, content, created_at) messages in a single transaction.
+    
+    Creates the conversation if conversation_id is None. All messages go
+    in one multi-row INSERT; for an existing conversation the updated_at
+    bump rides along as a CTE of the same statement.
+    
+    Returns:
+        The conversation id
+    """
+    now = datetime.utcnow()
+    statement = insert(Message)
+    if conversation_id is None:
+        conversation = Conversation(user_id=user_id, created_at=messages[0][2], updated_at=now)
+        session.add(conversation)
+        session.flush()
+        conversation_id = conversation.id
+    else:
+        statement = statement.add_cte(
+            update(Conversation)
+            .where(Conversation.id == conversation_id)
+            .values(updated_at=now)
+            .cte("touch_conversation")
+        )
+    
+    session.execute(statement.values([
+        {
+            "conversation_id": conversation_id,
+            "user_id": user_id,
+            "role": role,
+            "content": content,
+            "created_at": created_at
+        }
+        for role, content, created_at in messages
+    ]))
+    session.commit()
+    return conversation_id
+
+
+def _persist_turn(
+    session: Session,
+    user_id: UUID,
+    conversation_id: Optional[int],
+    user_content: str,
+    sent_at: datetime,
+    response: str
+) -> int:
+    """
+    Store one chat turn (user and assistant messages) in a single transaction.
+    
+    Returns:
+        The conversation id
+    """
+    return _persist_messages(session, user_id, conversation_id, [
+        ("user", user_content, sent_at),
+        ("assistant", response, datetime.utcnow()),
+    ])
+
+
+def _run_turn(session: Session, user_id: UUID, request: ChatRequest) -> ChatResponse:
+    """
+    Load history, run the agent and store the turn (steps 3-6 of POST /chat).
+    
+    A successful turn is stored in one transaction; if the agent fails,
+    the user message is stored on its own before the 500 is raised.
+    """
+    # Get conversation (a new one is created when the turn is stored)
+    conversation_id = None
+    messages_array = []
+    if request.conversation_id:
+        conversation = session.exec(
+            select(Conversation).where(
+                Conversation.id == request.conversation_id,
+                Conversation.user_id == user_id  # Layer 3: Database filtering
+            )
+        ).first()
+        
+        if not conversation:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Conversation not found"
+            )
+        conversation_id = conversation.id
+        
+        # Load conversation history (rolling summary + recent messages within the token budget)
+        messages_array = load_history(session, conversation)
+    
+    # Add current user message
+    messages_array.append({"role": "user", "content": request.message})
+    sent_at = datetime.utcnow()
+    
+    # Run agent (tool side effects are committed by the MCP registry)
+    try:
+        agent_result = run_agent(
+            session=session,
+            user_id=user_id,
+            messages=messages_array
+        )
+    except Exception as e:
+        # Keep what the user sent (and a new conversation), as /chat/stream does;
+        # tools may already have committed changes for this turn
+        session.rollback()
+        try:
+            _persist_messages(session, user_id, conversation_id, [("user", request.message, sent_at)])
+        except Exception as persist_error:
+            session.rollback()
+            print(f"⚠️  Failed to store chat message after agent error: {persist_error}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process message: {str(e)}"
+        )
+    
+    # Store both messages and bump the conversation in one transaction
+    conversation_id = _persist_turn(
+        session,
+        user_id,
+        conversation_id,
+        request.message,
+        sent_at,
+        agent_result["response"]
+    )
+    
+    return ChatResponse(
+        conversation_id=conversation_id,
+        response=agent_result["response"],
+        tool_calls=agent_result["tool_calls"]
+    )
+
+
+# Concurrent identical POST /chat requests (same user, conversation and
+# message); /chat/stream is not coalesced
+_chat_flight = SingleFlight("chat")
+
+
 @router.post("/{user_id}/chat", response_model=ChatResponse)
 def chat(
     user_id: UUID,
     request: ChatRequest,
-    current_user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user_id: UUID = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
     """
@@ -45,17 +193,21 @@ def chat(
     Stateless request cycle:
     1. Validate auth (JWT)
     2. Verify user_id matches token
-    3. Fetch/create conversation
-    4. Load message history
-    5. Store user message
-    6. Run agent
-    7. Store assistant message
-    8. Return response
+    3. Fetch conversation
+    4. Load message history (summary + recent window, see agent/history.py)
+    5. Run agent
+    6. Store conversation (if new), user and assistant messages in one transaction
+    7. Return response (older turns are summarized afterwards)
+    
+    Steps 3-6 run once for identical requests that arrive while one is in
+    flight; the duplicates get the same response. Only this endpoint
+    coalesces; a retried POST /chat/stream runs its own turn.
     
     Args:
         user_id: User UUID from path parameter
         request: Chat request with optional conversation_id and message
-        current_user: Authenticated user from JWT token
+        background_tasks: Runs the history fold after the response is sent
+        current_user_id: Authenticated user id from JWT token
         session: Database session
         
     Returns:
@@ -63,7 +215,7 @@ def chat(
     """
     
     # CRITICAL: Verify path user_id matches authenticated user (Layer 2 security)
-    if str(current_user.id) != str(user_id):
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found"
@@ -82,84 +234,153 @@ def chat(
             detail="Message must be under 2000 characters"
         )
     
-    # Get or create conversation
-    if request.conversation_id:
-        conversation = session.exec(
-            select(Conversation).where(
-                Conversation.id == request.conversation_id,
-                Conversation.user_id == current_user.id  # Layer 3: Database filtering
-            )
-        ).first()
-        
-        if not conversation:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Conversation not found"
-            )
-    else:
-        # Create new conversation
-        conversation = Conversation(user_id=current_user.id)
-        session.add(conversation)
-        session.commit()
-        session.refresh(conversation)
+    # Identical requests already in flight (client retries) share one turn
+    response, shared = _chat_flight.do(
+        (current_user_id, request.conversation_id, request.message),
+        lambda: _run_turn(session, current_user_id, request)
+    )
+    
+    # Fold overflowing history into the summary once the response is sent
+    if not shared:
+        background_tasks.add_task(_fold_history_in_session, response.conversation_id)
+    
+    return response
+
+
+# ===== Streaming chat =====
+
+def _validate_message(message: str) -> None:
+    """Reject empty or oversized chat messages."""
+    if not message or len(message.strip()) == 0:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Message cannot be empty"
+        )
     
-    # Load conversation history (last 50 messages for token efficiency)
-    messages_query = select(Message).where(
-        Message.conversation_id == conversation.id
-    ).order_by(col(Message.created_at)).limit(50)
+    if len(message) > 2000:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Message must be under 2000 characters"
+        )
+
+
+def _begin_turn(user_id: UUID, request: ChatRequest) -> Tuple[int, List[Dict[str, str]]]:
+    """
+    Fetch the conversation, load history and store the user message.
     
-    message_history = session.exec(messages_query).all()
+    Runs in a worker thread with its own session, which is closed before
+    the model is called. The user message (and a new conversation) is
+    committed here, so the turn is kept even if the stream is aborted or
+    the model fails, and the conversation id can be streamed first.
     
-    # Build messages array for agent
-    messages_array = [
-        {"role": msg.role, "content": msg.content}
-        for msg in message_history
-    ]
+    Returns:
+        (conversation_id, messages array for the agent)
+    """
+    with Session(engine) as session:
+        conversation_id = None
+        messages_array = []
+        if request.conversation_id:
+            conversation = session.exec(
+                select(Conversation).where(
+                    Conversation.id == request.conversation_id,
+                    Conversation.user_id == user_id  # Layer 3: Database filtering
+                )
+            ).first()
+            
+            if not conversation:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Conversation not found"
+                )
+            messages_array = load_history(session, conversation)
+            conversation_id = conversation.id
+        
+        conversation_id = _persist_messages(
+            session,
+            user_id,
+            conversation_id,
+            [("user", request.message, datetime.utcnow())]
+        )
     
-    # Add current user message
     messages_array.append({"role": "user", "content": request.message})
+    return conversation_id, messages_array
+
+
+def _finish_turn(user_id: UUID, conversation_id: int, response: str) -> None:
+    """Store the assistant message and bump the conversation (one transaction)."""
+    with Session(engine) as session:
+        _persist_messages(session, user_id, conversation_id, [("assistant", response, datetime.utcnow())])
+
+
+def _fold_history_in_session(conversation_id: int) -> None:
+    """Update the conversation's rolling summary (runs after the response)."""
+    with Session(engine) as session:
+        fold_history(session, conversation_id)
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("/{user_id}/chat/stream")
+async def chat_stream(
+    user_id: UUID,
+    request: ChatRequest,
+    current_user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    Send message to AI agent and stream the response as server-sent events.
     
-    # Store user message
-    user_message = Message(
-        conversation_id=conversation.id,
-        user_id=current_user.id,
-        role="user",
-        content=request.message
-    )
-    session.add(user_message)
-    session.commit()
+    Same request cycle as POST /chat, but the event loop waits on the
+    model (async OpenAI client) and database sessions are only opened for
+    bookkeeping, so a slow completion holds neither a worker thread nor a
+    pooled connection. The user message is stored before streaming starts
+    and the assistant message once the model is done, so an aborted or
+    failed stream still keeps what the user sent. Unlike POST /chat,
+    identical concurrent streams are not coalesced.
     
-    # Run agent
-    try:
-        agent_result = run_agent(
-            session=session,
-            user_id=current_user.id,
-            messages=messages_array
-        )
-    except Exception as e:
+    Events:
+        conversation: {"conversation_id": int} (first)
+        token: {"content": str} (text deltas)
+        tool_call: {"tool": str, "arguments": {...}, "result": {...}}
+        done: {"conversation_id": int, "response": str, "tool_calls": [...]} (last)
+    
+    [Task]: T-012
+    """
+    
+    # CRITICAL: Verify path user_id matches authenticated user (Layer 2 security)
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process message: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not found"
         )
     
-    # Store assistant message
-    assistant_message = Message(
-        conversation_id=conversation.id if conversation.id else 0,
-        user_id=current_user.id,
-        role="assistant",
-        content=agent_result["response"]
-    )
-    session.add(assistant_message)
-    session.commit()
+    _validate_message(request.message)
     
-    # Update conversation timestamp
-    conversation.updated_at = datetime.utcnow()
-    session.add(conversation)
-    session.commit()
+    conversation_id, messages_array = await run_in_threadpool(_begin_turn, current_user_id, request)
     
-    # Return response
-    return ChatResponse(
-        conversation_id=conversation.id if conversation.id else 0,
-        response=agent_result["response"],
-        tool_calls=agent_result["tool_calls"]
+    async def event_stream():
+        yield _sse("conversation", {"conversation_id": conversation_id})
+        
+        async for event in stream_agent(current_user_id, messages_array):
+            event_type = event.pop("type")
+            if event_type == "done":
+                await run_in_threadpool(
+                    _finish_turn,
+                    current_user_id,
+                    conversation_id,
+                    event["response"]
+                )
+                event["conversation_id"] = conversation_id
+            yield _sse(event_type, event)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        background=BackgroundTask(_fold_history_in_session, conversation_id),
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Disable proxy buffering (nginx)
+        }
     )
@@ -9,8 +9,14 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session
 from typing import List, Dict, Any
 from src.database import get_session
+from src.utils.deps import require_job_token
 from src.services.reminder_scheduler import get_reminder_scheduler
 from src.services.event_publisher import get_event_publisher
+from src.services.reminder_timer import reminder_timer_enabled, get_reminder_timer
+from src.services.recurrence import roll_pending_batch
+from src.services.archiver import archive_batch
+from src.services.task_sync import prune_tombstones
+from src.services import tool_cache
 
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 
@@ -27,6 +33,9 @@ def check_reminders(
     - Kubernetes CronJob
     - External scheduler
     
+    Not needed when REMINDER_TIMER_ENABLED=true (reminders then fire
+    in-process at their exact time).
+    
     [Task]: T-C-007
     [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §3.2.1, §6.2.1
     """
@@ -110,10 +119,117 @@ def check_overdue(
         )
 
 
+@router.post("/roll-recurring", dependencies=[Depends(require_job_token)])
+def roll_recurring(
+    batch_size: int = 500,
+    max_batches: int = 20,
+    session: Session = Depends(get_session)
+) -> Dict[str, Any]:
+    """
+    Create next instances for completed recurring tasks not yet rolled.
+    
+    Completions through the API roll immediately; this sweeps up anything
+    completed another way (bulk updates, direct SQL). Served by
+    ix_tasks_next_occurrence. Requires JOBS_TOKEN as a bearer token.
+    
+    [Task]: T-C-013
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §2.1
+    """
+    try:
+        rolled = 0
+        for _ in range(max_batches):
+            new_tasks = roll_pending_batch(session, batch_size=batch_size)
+            rolled += len(new_tasks)
+            for user_id in {task.user_id for task in new_tasks}:
+                tool_cache.invalidate_user(user_id)
+            if len(new_tasks) < batch_size:
+                break
+        
+        return {
+            "status": "success",
+            "tasks_rolled": rolled
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to roll recurring tasks: {str(e)}"
+        )
+
+
+@router.post("/archive-completed", dependencies=[Depends(require_job_token)])
+def archive_completed(
+    batch_size: int = 500,
+    max_batches: int = 20,
+    session: Session = Depends(get_session)
+) -> Dict[str, Any]:
+    """
+    Move tasks completed more than ARCHIVE_COMPLETED_AFTER_DAYS ago to
+    archived_tasks, one batch per transaction.
+    
+    Keeps the tasks table (and every list, stats and scheduler query) down
+    to the working set. Run daily. Served by ix_tasks_completed_updated.
+    Requires JOBS_TOKEN as a bearer token.
+    
+    [Task]: T-030
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1
+    """
+    try:
+        archived = 0
+        for _ in range(max_batches):
+            by_user = archive_batch(session, batch_size=batch_size)
+            count = sum(len(task_ids) for task_ids in by_user.values())
+            archived += count
+            for user_id in by_user:
+                tool_cache.invalidate_user(user_id)
+            if count < batch_size:
+                break
+        
+        return {
+            "status": "success",
+            "tasks_archived": archived
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to archive tasks: {str(e)}"
+        )
+
+
+@router.post("/prune-tombstones", dependencies=[Depends(require_job_token)])
+def prune_task_tombstones(
+    session: Session = Depends(get_session)
+) -> Dict[str, Any]:
+    """
+    Delete task tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS.
+    
+    Sync tokens older than the retention window are already refused, so
+    these rows are no longer needed. Run daily. Requires JOBS_TOKEN as a
+    bearer token: pruning early would force every client into a resync.
+    
+    [Task]: T-028
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1
+    """
+    try:
+        return {
+            "status": "success",
+            "tombstones_pruned": prune_tombstones(session)
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to prune tombstones: {str(e)}"
+        )
+
+
 @router.get("/health")
 def jobs_health_check() -> Dict[str, str]:
     """Health check for job endpoints."""
+    reminder_timer = "disabled"
+    if reminder_timer_enabled():
+        reminder_timer = "leader" if get_reminder_timer().is_leader else "standby"
+    
     return {
         "status": "healthy",
-        "service": "jobs"
+        "service": "jobs",
+        "reminder_timer": reminder_timer
     }
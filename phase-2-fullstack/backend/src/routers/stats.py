@@ -1,27 +1,37 @@
 """
 Task statistics and analytics endpoints.
-[Task]: T-B-010 (Task Statistics)
+[Task]: T-B-010 (Task Statistics), T-025 (Conditional GET), T-026 (Fast JSON Responses),
+        T-030 (Task Archive)
 [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.3,
         specs/005-phase-v-cloud/phase5-cloud.plan.md §4.3
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
+import time
+from fastapi import APIRouter, HTTPException, status, Depends, Request
 from sqlmodel import Session, select, func
 from uuid import UUID
 from datetime import datetime, timedelta
 from typing import Dict, Any
 from src.database import get_session
 from src.models.task import Task, Priority
-from src.models.user import User
-from src.utils.deps import get_current_user
+from src.models.archived_task import ArchivedTask
+from src.utils.deps import get_current_user_id
+from src.utils.etag import make_etag, not_modified_response, validator_headers
+from src.utils.responses import FastJSONResponse
+from src.services.data_version import get_data_version
 
 router = APIRouter(prefix="/api/{user_id}/stats", tags=["statistics"])
 
+# overdue / due_today move with the clock, so the ETag also changes
+# once per window even when no task does
+STATS_ETAG_WINDOW_SECONDS = 60
+
 
 @router.get("/tasks", response_model=Dict[str, Any])
 def get_task_statistics(
     user_id: UUID,
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    current_user_id: UUID = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
     """
@@ -40,17 +50,28 @@ def get_task_statistics(
         - due_this_week: Tasks due this week
         - recurring: Number of recurring tasks
         - completion_rate: Percentage of completed tasks
+        - archived: Number of archived tasks (already counted in total,
+          completed, by_priority and recurring)
+    
+    Conditional: If-None-Match with the current ETag gets 304 (the ETag
+    follows the user's data version and a STATS_ETAG_WINDOW_SECONDS clock).
     """
     # CRITICAL: Verify path user_id matches authenticated user
-    if str(current_user.id) != str(user_id):
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found"
         )
     
+    window = int(time.time() // STATS_ETAG_WINDOW_SECONDS)
+    etag = make_etag("stats", get_data_version(session, current_user_id), window)
+    not_modified = not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
+    
     # Get all tasks for user
     all_tasks = session.exec(
-        select(Task).where(Task.user_id == current_user.id)
+        select(Task).where(Task.user_id == current_user_id)
     ).all()
     
     now = datetime.utcnow()
@@ -58,9 +79,17 @@ def get_task_statistics(
     today_end = today_start + timedelta(days=1)
     week_end = today_start + timedelta(days=7)
     
+    # Archived tasks (all completed) as counts only, without loading rows
+    archived_counts = session.exec(
+        select(ArchivedTask.priority, ArchivedTask.is_recurring, func.count())
+        .where(ArchivedTask.user_id == current_user_id)
+        .group_by(ArchivedTask.priority, ArchivedTask.is_recurring)
+    ).all()
+    archived = sum(count for _, _, count in archived_counts)
+    
     # Calculate statistics
-    total = len(all_tasks)
-    completed = sum(1 for t in all_tasks if t.completed)
+    total = len(all_tasks) + archived
+    completed = sum(1 for t in all_tasks if t.completed) + archived
     pending = total - completed
     
     # Count by priority
@@ -70,6 +99,8 @@ def get_task_statistics(
         "high": sum(1 for t in all_tasks if t.priority == Priority.HIGH),
         "urgent": sum(1 for t in all_tasks if t.priority == Priority.URGENT),
     }
+    for priority, _, count in archived_counts:
+        by_priority[Priority(priority).value] += count
     
     # Overdue tasks (not completed and due date passed)
     overdue = sum(
@@ -91,11 +122,12 @@ def get_task_statistics(
     
     # Recurring tasks
     recurring = sum(1 for t in all_tasks if t.is_recurring)
+    recurring += sum(count for _, is_recurring, count in archived_counts if is_recurring)
     
     # Completion rate
     completion_rate = round((completed / total * 100), 2) if total > 0 else 0.0
     
-    return {
+    return FastJSONResponse({
         "total": total,
         "completed": completed,
         "pending": pending,
@@ -105,5 +137,6 @@ def get_task_statistics(
         "due_this_week": due_this_week,
         "recurring": recurring,
         "completion_rate": completion_rate,
+        "archived": archived,
         "generated_at": now.isoformat()
-    }
+    }, headers=validator_headers(etag))
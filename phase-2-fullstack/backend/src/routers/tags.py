@@ -1,19 +1,23 @@
 """
 Tag CRUD endpoints for task organization.
-[Task]: T-B-005 (Tag Management)
+[Task]: T-B-005 (Tag Management), T-025 (Conditional GET), T-026 (Fast JSON Responses),
+        T-028 (Delta Sync)
 [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §2.4, §5.2,
         specs/005-phase-v-cloud/phase5-cloud.plan.md §3.1.2, §4.2
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
-from sqlmodel import Session, select
+from fastapi import APIRouter, HTTPException, status, Depends, Request
+from sqlmodel import Session, select, func
 from uuid import UUID
 from datetime import datetime
 from src.database import get_session
 from src.models.tag import Tag, TaskTag
-from src.models.user import User
 from src.schemas.tag import TagCreate, TagUpdate, TagResponse, TagListResponse
-from src.utils.deps import get_current_user
+from src.utils.deps import get_current_user_id
+from src.utils.etag import make_etag, not_modified_response, validator_headers
+from src.utils.responses import FastJSONResponse
+from src.services.data_version import bump_data_version, get_data_version
+from src.services.task_sync import touch_tasks_with_tag
 
 router = APIRouter(prefix="/api/{user_id}/tags", tags=["tags"])
 
@@ -21,7 +25,8 @@ router = APIRouter(prefix="/api/{user_id}/tags", tags=["tags"])
 @router.get("", response_model=TagListResponse)
 def list_tags(
     user_id: UUID,
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    current_user_id: UUID = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
     """
@@ -29,22 +34,34 @@ def list_tags(
     
     [Task]: T-B-005
     [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.2.1
+    
+    Conditional: If-None-Match with the current ETag gets 304.
     """
     # CRITICAL: Verify path user_id matches authenticated user
-    if str(current_user.id) != str(user_id):
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found"
         )
     
-    # Get tags created by user or used by user's tasks
+    etag = make_etag("tags", get_data_version(session, current_user_id))
+    not_modified = not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
+    
+    # Tags live in the user's own namespace
     tags = session.exec(
-        select(Tag).where(Tag.created_by == current_user.id)
+        select(Tag)
+        .where(Tag.created_by == current_user_id)
+        .order_by(func.lower(Tag.name))
     ).all()
     
-    return TagListResponse(
-        tags=[TagResponse.model_validate(tag) for tag in tags],
-        count=len(tags)
+    return FastJSONResponse(
+        TagListResponse(
+            tags=[TagResponse.model_validate(tag) for tag in tags],
+            count=len(tags)
+        ),
+        headers=validator_headers(etag)
     )
 
 
@@ -52,7 +69,7 @@ def list_tags(
 def create_tag(
     user_id: UUID,
     request: TagCreate,
-    current_user: User = Depends(get_current_user),
+    current_user_id: UUID = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
     """
@@ -62,15 +79,18 @@ def create_tag(
     [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.2.2
     """
     # CRITICAL: Verify path user_id matches authenticated user
-    if str(current_user.id) != str(user_id):
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found"
         )
     
-    # Check if tag name already exists
+    # Check if tag name already exists in the user's namespace
     existing_tag = session.exec(
-        select(Tag).where(Tag.name == request.name)
+        select(Tag).where(
+            Tag.created_by == current_user_id,
+            func.lower(Tag.name) == request.name.lower()
+        )
     ).first()
     
     if existing_tag:
@@ -83,9 +103,10 @@ def create_tag(
     tag = Tag(
         name=request.name,
         color=request.color if request.color else "#3B82F6",
-        created_by=current_user.id
+        created_by=current_user_id
     )
     session.add(tag)
+    bump_data_version(session, current_user_id)
     session.commit()
     session.refresh(tag)
     
@@ -96,7 +117,7 @@ def create_tag(
 def get_tag(
     user_id: UUID,
     tag_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user_id: UUID = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
     """
@@ -106,7 +127,7 @@ def get_tag(
     [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.2.1
     """
     # CRITICAL: Verify path user_id matches authenticated user
-    if str(current_user.id) != str(user_id):
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found"
@@ -115,7 +136,7 @@ def get_tag(
     tag = session.exec(
         select(Tag).where(
             Tag.id == tag_id,
-            Tag.created_by == current_user.id
+            Tag.created_by == current_user_id
         )
     ).first()
     
@@ -133,7 +154,7 @@ def update_tag(
     user_id: UUID,
     tag_id: int,
     request: TagUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user_id: UUID = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
     """
@@ -143,7 +164,7 @@ def update_tag(
     [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.2.3
     """
     # CRITICAL: Verify path user_id matches authenticated user
-    if str(current_user.id) != str(user_id):
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found"
@@ -152,7 +173,7 @@ def update_tag(
     tag = session.exec(
         select(Tag).where(
             Tag.id == tag_id,
-            Tag.created_by == current_user.id
+            Tag.created_by == current_user_id
         )
     ).first()
     
@@ -164,10 +185,11 @@ def update_tag(
     
     # Update fields
     if request.name is not None:
-        # Check if new name conflicts
+        # Check if new name conflicts within the user's namespace
         existing = session.exec(
             select(Tag).where(
-                Tag.name == request.name,
+                Tag.created_by == current_user_id,
+                func.lower(Tag.name) == request.name.lower(),
                 Tag.id != tag_id
             )
         ).first()
@@ -182,6 +204,9 @@ def update_tag(
         tag.color = request.color
     
     session.add(tag)
+    # Tasks embed their tags: mark them changed for delta sync
+    touch_tasks_with_tag(session, tag_id)
+    bump_data_version(session, current_user_id)
     session.commit()
     session.refresh(tag)
     
@@ -192,7 +217,7 @@ def update_tag(
 def delete_tag(
     user_id: UUID,
     tag_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user_id: UUID = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
     """
@@ -202,7 +227,7 @@ def delete_tag(
     [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.2.4
     """
     # CRITICAL: Verify path user_id matches authenticated user
-    if str(current_user.id) != str(user_id):
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found"
@@ -211,7 +236,7 @@ def delete_tag(
     tag = session.exec(
         select(Tag).where(
             Tag.id == tag_id,
-            Tag.created_by == current_user.id
+            Tag.created_by == current_user_id
         )
     ).first()
     
@@ -221,6 +246,9 @@ def delete_tag(
             detail="Tag not found"
         )
     
+    # Tasks embed their tags: mark them changed for delta sync
+    touch_tasks_with_tag(session, tag_id)
+    
     # Delete all task-tag associations first
     task_tags = session.exec(
         select(TaskTag).where(TaskTag.tag_id == tag_id)
@@ -230,6 +258,7 @@ def delete_tag(
     
     # Delete tag
     session.delete(tag)
+    bump_data_version(session, current_user_id)
     session.commit()
     
     return None
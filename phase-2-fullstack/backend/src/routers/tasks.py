@@ -1,21 +1,27 @@
 """
 Task CRUD endpoints with user isolation.
 [Task]: T-010 (Task Endpoints), T-B-001 through T-B-009 (Phase V Enhancements),
-        T-C-002, T-C-003, T-C-004 (Event Publishing)
+        T-C-002, T-C-003, T-C-004 (Event Publishing), T-025 (Conditional GET),
+        T-026 (Fast JSON Responses), T-027 (Sparse Fieldsets), T-028 (Delta Sync),
+        T-029 (Optimistic Concurrency), T-030 (Task Archive)
 [From]: specs/phase1-console-app.specify.md §6.2, plan.md §7,
         specs/005-phase-v-cloud/phase5-cloud.specify.md §2.1-2.5, §3.1, §5.1,
         specs/005-phase-v-cloud/phase5-cloud.plan.md §3.1, §4.1, §5.1-5.2
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query
-from sqlmodel import Session, select, or_, and_, col
+from contextlib import contextmanager
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
+from sqlalchemy import cast, literal, null, union_all, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm.exc import StaleDataError
+from sqlmodel import Session, select, or_, and_, col, func
 from uuid import UUID
-from datetime import datetime
-from typing import Optional, List
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict
 from src.database import get_session
-from src.models.task import Task
+from src.models.task import Task, Priority
 from src.models.tag import Tag, TaskTag
-from src.models.user import User
+from src.models.archived_task import ArchivedTask
 from src.schemas.task import (
     TaskCreateRequest,
     TaskUpdateRequest,
@@ -23,49 +29,326 @@ from src.schemas.task import (
     TaskResponse,
     TaskListResponse,
     TaskSearchFilters,
-    TagResponse
+    TagResponse,
+    TaskChangesResponse,
+    OccurrenceListResponse
 )
-from src.utils.deps import get_current_user
+from src.utils.deps import get_current_user_id
+from src.utils.etag import (
+    if_match_versions,
+    make_etag,
+    not_modified_response,
+    precondition_failed,
+    require_if_match,
+    validator_headers
+)
+from src.utils.responses import FastJSONResponse
 from src.utils.validators import validate_task_data
+from src.services.archiver import unarchive_task
+from src.services.data_version import bump_data_version, get_data_version
 from src.services.event_publisher import get_event_publisher
+from src.services.reminder_timer import notify_reminder_changed
+from src.services.task_tags import load_tags, load_task_with_tags
+from src.services.task_sync import (
+    SyncResyncRequired,
+    SyncTokenInvalid,
+    decode_sync_token,
+    encode_sync_token,
+    get_changes,
+    record_deletions
+)
+from src.services.recurrence import (
+    compute_next_occurrence,
+    expand_occurrences,
+    roll_completed_tasks,
+    task_anchor,
+    naive_utc,
+    MAX_EXPANSION
+)
 
 router = APIRouter(prefix="/api/{user_id}/tasks", tags=["tasks"])
 
 
 # ===== Helper Functions =====
 
-def _load_task_with_tags(task_id: int, session: Session) -> TaskResponse:
+def _task_etag(task) -> str:
+    """ETag of one task (Task or TaskResponse): changes with every write."""
+    return make_etag("task", task.id, task.version)
+
+
+@contextmanager
+def _conditional_write(session: Session):
     """
-    Load task with associated tags.
+    Turn a lost write race into 412.
     
-    [Task]: T-B-001, T-B-009
-    [From]: specs/005-phase-v-cloud/phase5-cloud.plan.md §4.1
+    Task flushes are UPDATE/DELETE ... WHERE id = ? AND version = ?; if
+    another request changed the row after it was read, nothing matches
+    and SQLAlchemy raises StaleDataError.
     """
-    task = session.exec(
-        select(Task).where(Task.id == task_id)
-    ).first()
+    try:
+        yield
+    except StaleDataError:
+        session.rollback()
+        raise precondition_failed()
+
+
+def _resolve_user_tags(
+    session: Session,
+    user_id: UUID,
+    tag_names: List[str],
+    create_missing: bool = False
+) -> Dict[str, Tag]:
+    """
+    Look up the user's tags by name in a single query.
     
-    if not task:
+    Tags are scoped per user, so the lookup is served by the
+    (created_by, lower(name)) unique index and is bounded by the user's
+    own tag count. Missing tags are created when create_missing is set.
+    
+    Returns:
+        Dict mapping lower-cased tag name to Tag
+    """
+    wanted = {name.strip().lower(): name.strip() for name in tag_names if name and name.strip()}
+    if not wanted:
+        return {}
+    
+    found = {
+        tag.name.lower(): tag
+        for tag in session.exec(
+            select(Tag).where(
+                Tag.created_by == user_id,
+                func.lower(Tag.name).in_(list(wanted.keys()))
+            )
+        ).all()
+    }
+    
+    if create_missing:
+        for key, name in wanted.items():
+            if key not in found:
+                tag = Tag(
+                    name=name,
+                    color="#3B82F6",  # Default blue
+                    created_by=user_id
+                )
+                session.add(tag)
+                found[key] = tag
+        session.flush()
+    
+    return found
+
+
+# Sort fields accepted by list_tasks. Each one is backed by a composite
+# (user_id, <field>) index on Task, so every supported sort path is an
+# ordered index scan rather than a filter + in-memory sort.
+SORT_FIELDS = {
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+    "due_date": Task.due_date,
+    "priority": Task.priority,
+    "title": Task.title,
+}
+
+
+def _build_list_query(
+    user_id: UUID,
+    completed: Optional[str] = "all",
+    search: Optional[str] = None,
+    priority: Optional[List[str]] = None,
+    due_before: Optional[datetime] = None,
+    due_after: Optional[datetime] = None,
+    is_recurring: Optional[bool] = None,
+    tag_ids: Optional[List[int]] = None,
+    model=Task
+):
+    """
+    Build the filtered (unsorted) task list query for a user.
+    
+    model=ArchivedTask builds the same filters over the archive.
+    
+    [Task]: T-B-002, T-B-003, T-B-009, T-030
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §2.5, §5.1.2-5.1.3
+    """
+    # Build base query with user_id filter
+    query = select(model).where(model.user_id == user_id)
+    
+    # Apply completion filter
+    if completed == "pending":
+        query = query.where(model.completed == False)
+    elif completed == "completed":
+        query = query.where(model.completed == True)
+    
+    # Apply search filter
+    if search:
+        search_pattern = f"%{search}%"
+        query = query.where(
+            or_(
+                model.title.ilike(search_pattern),
+                model.description.ilike(search_pattern)
+            )
+        )
+    
+    # Apply priority filter
+    if priority:
+        priority_values = [Priority(p) for p in priority]
+        query = query.where(model.priority.in_(priority_values))
+    
+    # Apply date range filters
+    if due_before:
+        query = query.where(model.due_date <= due_before)
+    if due_after:
+        query = query.where(model.due_date >= due_after)
+    
+    # Apply recurring filter
+    if is_recurring is not None:
+        query = query.where(model.is_recurring == is_recurring)
+    
+    # Apply tag filter (task must have every tag)
+    for tag_id in tag_ids or []:
+        if model is ArchivedTask:
+            query = query.where(ArchivedTask.tag_ids.contains([tag_id]))
+            continue
+        query = query.where(
+            Task.id.in_(
+                select(TaskTag.task_id).where(TaskTag.tag_id == tag_id)
+            )
+        )
+    
+    return query
+
+
+def _apply_sort(query, sort_by: str, sort_order: str):
+    """
+    Apply list_tasks sorting (defaults to created_at desc).
+    
+    [Task]: T-B-004
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1.4
+    """
+    sort_field = SORT_FIELDS.get(sort_by, Task.created_at)
+    if sort_order == "asc":
+        return query.order_by(sort_field.asc())
+    return query.order_by(sort_field.desc())
+
+
+# Fields a list_tasks `fields=` projection may name. Scalar fields are
+# selected as columns (only those are read from the table); "tags" adds
+# one batched tag query for the page.
+LIST_COLUMNS = {
+    "id": Task.id,
+    "user_id": Task.user_id,
+    "title": Task.title,
+    "description": Task.description,
+    "completed": Task.completed,
+    "priority": Task.priority,
+    "due_date": Task.due_date,
+    "reminder_time": Task.reminder_time,
+    "is_recurring": Task.is_recurring,
+    "recurrence_pattern": Task.recurrence_pattern,
+    "next_occurrence_at": Task.next_occurrence_at,
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+    "version": Task.version,
+}
+LIST_FIELDS = set(LIST_COLUMNS) | {"tags"}
+# fields=compact: what the list view renders (version for If-Match on toggles)
+COMPACT_LIST_FIELDS = ("id", "title", "completed", "priority", "due_date", "version")
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a `fields=` value into field names (None = full TaskResponse).
+    
+    Accepts a comma-separated list or the preset "compact". id is always
+    included so clients can address the rows.
+    """
+    if fields is None or not fields.strip():
         return None
+    if fields.strip() == "compact":
+        return list(COMPACT_LIST_FIELDS)
+    
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(names) - LIST_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(sorted(LIST_FIELDS))}"
+        )
+    return ["id"] + [name for name in dict.fromkeys(names) if name != "id"]
+
+
+def _list_with_archive(
+    session: Session,
+    user_id: UUID,
+    active_query,
+    archived_query,
+    sort_by: str,
+    sort_order: str,
+    offset: int,
+    limit: int,
+    selected_fields: Optional[List[str]]
+):
+    """
+    One page over tasks UNION ALL archived_tasks.
     
-    # Load tags
-    task_tags = session.exec(
-        select(TaskTag).where(TaskTag.task_id == task_id)
-    ).all()
+    Both sides select the same columns plus an archived flag and the
+    archive's tag_ids; tags of active rows come from task_tags as usual.
     
-    tags = []
-    for tt in task_tags:
-        tag = session.exec(
-            select(Tag).where(Tag.id == tt.tag_id)
-        ).first()
-        if tag:
-            tags.append(TagResponse.model_validate(tag))
+    [Task]: T-030
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1.2
+    
+    Returns:
+        (page items, total count): TaskResponse models, or dicts of the
+        selected fields (plus "archived") for a sparse fieldset
+    """
+    names = list(LIST_COLUMNS)
+    combined = union_all(
+        active_query.with_only_columns(
+            *[getattr(Task, name) for name in names],
+            literal(False).label("archived"),
+            cast(null(), JSONB).label("tag_ids")
+        ),
+        archived_query.with_only_columns(
+            *[getattr(ArchivedTask, name) for name in names],
+            literal(True).label("archived"),
+            ArchivedTask.tag_ids
+        )
+    ).subquery("listed")
+    
+    total_count = session.exec(select(func.count()).select_from(combined)).one()
     
-    # Build response
-    task_dict = task.model_dump()
-    task_dict['tags'] = tags
+    sort_column = combined.c[sort_by if sort_by in SORT_FIELDS else "created_at"]
+    rows = session.execute(
+        select(combined)
+        .order_by(sort_column.asc() if sort_order == "asc" else sort_column.desc())
+        .offset(offset)
+        .limit(limit)
+    ).mappings().all()
     
-    return TaskResponse.model_validate(task_dict)
+    wants_tags = selected_fields is None or "tags" in selected_fields
+    tags_by_task = load_tags(session, [row["id"] for row in rows if not row["archived"]]) if wants_tags else {}
+    archived_tag_ids = {tag_id for row in rows if row["archived"] for tag_id in row["tag_ids"] or []}
+    archived_tags = {}
+    if wants_tags and archived_tag_ids:
+        archived_tags = {
+            tag.id: TagResponse.model_validate(tag)
+            for tag in session.exec(
+                select(Tag).where(Tag.id.in_(archived_tag_ids), Tag.created_by == user_id)
+            ).all()
+        }
+    
+    items = []
+    for row in rows:
+        item = dict(row)
+        tag_ids = item.pop("tag_ids")
+        if wants_tags:
+            if item["archived"]:
+                item["tags"] = [archived_tags[tag_id] for tag_id in tag_ids or [] if tag_id in archived_tags]
+            else:
+                item["tags"] = tags_by_task[item["id"]]
+        if selected_fields is None:
+            items.append(TaskResponse.model_validate(item))
+        else:
+            items.append({name: item[name] for name in [*selected_fields, "archived"]})
+    return items, total_count
 
 
 # ===== Endpoints =====
@@ -74,6 +357,7 @@ def _load_task_with_tags(task_id: int, session: Session) -> TaskResponse:
 @router.get("", response_model=TaskListResponse)
 def list_tasks(
     user_id: UUID,
+    request: Request,
     completed: Optional[str] = Query("all", description="Filter: all, pending, completed"),
     search: Optional[str] = Query(None, description="Search in title and description"),
     priority: Optional[List[str]] = Query(None, description="Filter by priorities"),
@@ -85,13 +369,23 @@ def list_tasks(
     sort_order: str = Query("desc", description="Sort order: asc or desc"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    current_user: User = Depends(get_current_user),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return (id always included), or 'compact' "
+                    "for id,title,completed,priority,due_date,version. Default: full tasks"
+    ),
+    include_archived: bool = Query(
+        False,
+        description="Also list archived tasks (completed long ago); ignored with completed=pending"
+    ),
+    current_user_id: UUID = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
     """
     List all tasks for authenticated user with advanced search, filter, and sort.
     
-    [Task]: T-B-002 (Search), T-B-003 (Filter), T-B-004 (Sort), T-B-009 (Enhanced List)
+    [Task]: T-B-002 (Search), T-B-003 (Filter), T-B-004 (Sort), T-B-009 (Enhanced List),
+            T-027 (Sparse Fieldsets), T-030 (Task Archive)
     [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §2.5, §5.1.2-5.1.4
     
     Query params:
@@ -104,105 +398,170 @@ def list_tasks(
     - sort_by: Field to sort by (created_at, updated_at, due_date, priority, title)
     - sort_order: asc or desc
     - page, page_size: Pagination
+    - fields: Sparse fieldset; only those columns are selected, and tags are
+      loaded only if listed
+    - include_archived: Read across tasks and archived_tasks (rows carry
+      archived=true; POST /{task_id}/unarchive restores one)
+    
+    Responses carry an ETag from the user's data version; If-None-Match
+    with the current one is answered 304 before any list query runs.
     """
     # CRITICAL: Verify path user_id matches authenticated user
-    if str(current_user.id) != str(user_id):
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found"
         )
     
-    # Build base query with user_id filter
-    query = select(Task).where(Task.user_id == current_user.id)
+    selected_fields = _parse_fields(fields)
     
-    # Apply completion filter
-    if completed == "pending":
-        query = query.where(Task.completed == False)
-    elif completed == "completed":
-        query = query.where(Task.completed == True)
+    # Read the version before the list: the body is then at least this new
+    etag = make_etag("tasks", get_data_version(session, current_user_id))
+    not_modified = not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
     
-    # Apply search filter
-    if search:
-        search_pattern = f"%{search}%"
-        query = query.where(
-            or_(
-                Task.title.ilike(search_pattern),
-                Task.description.ilike(search_pattern)
-            )
-        )
+    # Resolve tag filter (AND logic - case insensitive, scoped to user's tags)
+    tag_ids = None
+    if tags:
+        user_tags = _resolve_user_tags(session, current_user_id, tags)
+        if len(user_tags) < len({t.strip().lower() for t in tags if t.strip()}):
+            # If a tag doesn't exist, no tasks will match
+            return FastJSONResponse(TaskListResponse(tasks=[], count=0), headers=validator_headers(etag))
+        tag_ids = [tag.id for tag in user_tags.values()]
     
-    # Apply priority filter
-    if priority:
-        from src.models.task import Priority
-        priority_values = [Priority(p) for p in priority]
-        query = query.where(Task.priority.in_(priority_values))
+    query = _build_list_query(
+        current_user_id,
+        completed=completed,
+        search=search,
+        priority=priority,
+        due_before=due_before,
+        due_after=due_after,
+        is_recurring=is_recurring,
+        tag_ids=tag_ids
+    )
     
-    # Apply date range filters
-    if due_before:
-        query = query.where(Task.due_date <= due_before)
-    if due_after:
-        query = query.where(Task.due_date >= due_after)
+    offset = (page - 1) * page_size
     
-    # Apply recurring filter
-    if is_recurring is not None:
-        query = query.where(Task.is_recurring == is_recurring)
+    if include_archived and completed != "pending":
+        archived_query = _build_list_query(
+            current_user_id,
+            completed=completed,
+            search=search,
+            priority=priority,
+            due_before=due_before,
+            due_after=due_after,
+            is_recurring=is_recurring,
+            tag_ids=tag_ids,
+            model=ArchivedTask
+        )
+        items, total_count = _list_with_archive(
+            session, current_user_id, query, archived_query,
+            sort_by, sort_order, offset, page_size, selected_fields
+        )
+        if selected_fields is not None:
+            return FastJSONResponse({"tasks": items, "count": total_count}, headers=validator_headers(etag))
+        return FastJSONResponse(TaskListResponse(tasks=items, count=total_count), headers=validator_headers(etag))
     
-    # Apply tag filter (AND logic - case insensitive)
-    if tags:
-        for tag_name in tags:
-            tag = session.exec(
-                select(Tag).where(Tag.name.ilike(tag_name))
-            ).first()
-            if tag:
-                # Subquery to check task has this tag
-                query = query.where(
-                    Task.id.in_(
-                        select(TaskTag.task_id).where(TaskTag.tag_id == tag.id)
-                    )
-                )
-            else:
-                # If tag doesn't exist, no tasks will match
-                # Return empty result by filtering to non-existent task
-                query = query.where(Task.id == -1)
-    
-    # Apply sorting
-    sort_field = Task.created_at  # Default
-    if sort_by == "updated_at":
-        sort_field = Task.updated_at
-    elif sort_by == "due_date":
-        sort_field = Task.due_date
-    elif sort_by == "priority":
-        sort_field = Task.priority
-    elif sort_by == "title":
-        sort_field = Task.title
+    # Count matches, then fetch only the requested page from the database
+    total_count = session.exec(
+        select(func.count()).select_from(query.subquery())
+    ).one()
     
-    if sort_order == "asc":
-        query = query.order_by(sort_field.asc())
-    else:
-        query = query.order_by(sort_field.desc())
+    page_query = _apply_sort(query, sort_by, sort_order).offset(offset).limit(page_size)
     
-    # Execute query and get total count
-    all_tasks = session.exec(query).all()
-    total_count = len(all_tasks)
+    if selected_fields is not None:
+        # Sparse: read only the requested columns, no ORM objects
+        columns = [LIST_COLUMNS[name] for name in selected_fields if name in LIST_COLUMNS]
+        rows = session.execute(page_query.with_only_columns(*columns)).mappings().all()
+        items = [dict(row) for row in rows]
+        if "tags" in selected_fields:
+            tags_by_task = load_tags(session, [item["id"] for item in items])
+            for item in items:
+                item["tags"] = tags_by_task[item["id"]]
+        return FastJSONResponse(
+            {"tasks": items, "count": total_count},
+            headers=validator_headers(etag)
+        )
     
-    # Apply pagination
-    offset = (page - 1) * page_size
-    tasks = all_tasks[offset:offset + page_size]
+    tasks = session.exec(page_query).all()
     
-    # Load tasks with tags
-    tasks_with_tags = [_load_task_with_tags(task.id, session) for task in tasks]
+    # Tags for the whole page in one query
+    tags_by_task = load_tags(session, [task.id for task in tasks])
+    tasks_with_tags = [
+        TaskResponse.model_validate({**task.model_dump(), "tags": tags_by_task[task.id]})
+        for task in tasks
+    ]
     
-    return TaskListResponse(
-        tasks=tasks_with_tags,
-        count=total_count
+    return FastJSONResponse(
+        TaskListResponse(tasks=tasks_with_tags, count=total_count),
+        headers=validator_headers(etag)
     )
 
 
+@router.get("/changes", response_model=TaskChangesResponse)
+def list_task_changes(
+    user_id: UUID,
+    since: Optional[str] = Query(None, description="Sync token from the previous call; omit for an initial sync"),
+    current_user_id: UUID = Depends(get_current_user_id),
+    session: Session = Depends(get_session)
+):
+    """
+    Tasks created, updated or deleted since a sync token.
+    
+    [Task]: T-028 (Delta Sync)
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+    
+    Clients store sync_token and pass it back as since=, so a sync costs
+    O(changes) instead of refetching the list. Changed tasks are full
+    TaskResponse objects and may repeat across syncs (apply as upserts);
+    deleted holds ids of tasks removed since the token.
+    
+    Without since, every task is returned (initial sync). A token older
+    than SYNC_TOMBSTONE_RETENTION_DAYS or from the old updated_at based
+    protocol, or more than SYNC_MAX_CHANGES pending changes, is answered
+    410: refetch the list and start over.
+    """
+    # CRITICAL: Verify path user_id matches authenticated user
+    if str(current_user_id) != str(user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not found"
+        )
+    
+    try:
+        since_point = decode_sync_token(since) if since else None
+        tasks, deleted_ids, next_point = get_changes(session, current_user_id, since_point)
+    except SyncTokenInvalid as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except SyncResyncRequired as e:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail=f"{e}; refetch the task list and sync without a token"
+        )
+    
+    tags_by_task = load_tags(session, [task.id for task in tasks])
+    changed = [
+        TaskResponse.model_validate({**task.model_dump(), "tags": tags_by_task[task.id]})
+        for task in tasks
+    ]
+    
+    return FastJSONResponse(TaskChangesResponse(
+        changed=changed,
+        deleted=deleted_ids,
+        sync_token=encode_sync_token(next_point)
+    ))
+
+
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 def create_task(
     user_id: UUID,
     request: TaskCreateRequest,
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    current_user_id: UUID = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
     """
@@ -212,7 +571,7 @@ def create_task(
     [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §2.1-2.5, §5.1.1
     """
     # CRITICAL: Verify path user_id matches authenticated user
-    if str(current_user.id) != str(user_id):
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found"
@@ -224,12 +583,12 @@ def create_task(
         due_date=request.due_date,
         reminder_time=request.reminder_time,
         is_recurring=request.is_recurring,
-        recurrence_pattern=request.recurrence_pattern.model_dump() if request.recurrence_pattern else None
+        recurrence_pattern=request.recurrence_pattern.model_dump(mode="json") if request.recurrence_pattern else None
     )
     
     # Create task with Phase V fields
     task = Task(
-        user_id=current_user.id,
+        user_id=current_user_id,
         title=request.title,
         description=request.description,
         completed=False,
@@ -241,32 +600,24 @@ def create_task(
     
     # Handle recurrence pattern
     if request.recurrence_pattern:
-        task.recurrence_pattern = request.recurrence_pattern.model_dump(exclude_none=True)
+        task.recurrence_pattern = request.recurrence_pattern.model_dump(mode="json", exclude_none=True)
+    task.next_occurrence_at = compute_next_occurrence(task)
     
     session.add(task)
     session.flush()  # Get task ID before adding tags
     
-    # Handle tags
+    # Handle tags (find or create within the user's namespace)
     if request.tags:
-        for tag_name in request.tags:
-            # Find or create tag
-            tag = session.exec(
-                select(Tag).where(Tag.name == tag_name)
-            ).first()
-            
-            if not tag:
-                tag = Tag(
-                    name=tag_name,
-                    color="#3B82F6",  # Default blue
-                    created_by=current_user.id
-                )
-                session.add(tag)
-                session.flush()
-            
+        user_tags = _resolve_user_tags(session, current_user_id, request.tags, create_missing=True)
+        for tag in user_tags.values():
             # Associate tag with task
             task_tag = TaskTag(task_id=task.id, tag_id=tag.id)
             session.add(task_tag)
     
+    if task.reminder_time:
+        notify_reminder_changed(session, task.id)
+    bump_data_version(session, current_user_id)
+    
     session.commit()
     session.refresh(task)
     
@@ -275,7 +626,7 @@ def create_task(
         event_publisher = get_event_publisher()
         event_publisher.publish_task_created(
             task_id=task.id,
-            user_id=str(current_user.id),
+            user_id=str(current_user_id),
             task_data={
                 "title": task.title,
                 "description": task.description,
@@ -297,7 +648,7 @@ def create_task(
         try:
             event_publisher.publish_reminder_scheduled(
                 task_id=task.id,
-                user_id=str(current_user.id),
+                user_id=str(current_user_id),
                 reminder_time=task.reminder_time.isoformat(),
                 session=session
             )
@@ -305,7 +656,8 @@ def create_task(
             print(f"⚠️  Reminder scheduling failed: {e}")
     
     # Load task with tags for response
-    task_with_tags = _load_task_with_tags(task.id, session)
+    task_with_tags = load_task_with_tags(task.id, session)
+    response.headers["ETag"] = _task_etag(task_with_tags)
     return task_with_tags
 
 
@@ -313,17 +665,22 @@ def create_task(
 def get_task(
     user_id: UUID,
     task_id: int,
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    response: Response,
+    current_user_id: UUID = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
     """
     Get single task by ID with tags.
     
-    [Task]: T-B-009
+    [Task]: T-B-009, T-029
     [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1.2
+    
+    The ETag ("task-<id>-<version>") is what PUT/PATCH/DELETE take as
+    If-Match; If-None-Match with it is answered 304.
     """
     # CRITICAL: Verify path user_id matches authenticated user
-    if str(current_user.id) != str(user_id):
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found"
@@ -333,7 +690,7 @@ def get_task(
     task = session.exec(
         select(Task).where(
             Task.id == task_id,
-            Task.user_id == current_user.id
+            Task.user_id == current_user_id
         )
     ).first()
     
@@ -343,7 +700,13 @@ def get_task(
             detail="Task not found"
         )
     
-    return _load_task_with_tags(task.id, session)
+    etag = _task_etag(task)
+    not_modified = not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
+    
+    response.headers.update(validator_headers(etag))
+    return load_task_with_tags(task.id, session)
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
@@ -351,17 +714,24 @@ def update_task(
     user_id: UUID,
     task_id: int,
     request: TaskUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    http_request: Request,
+    response: Response,
+    current_user_id: UUID = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
     """
     Update task (full update) with Phase V fields.
     
-    [Task]: T-B-001, T-B-007, T-B-008
+    [Task]: T-B-001, T-B-007, T-B-008, T-029
     [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1.1
+    
+    Send If-Match with the task's ETag to update only the version you
+    read: 412 if it has changed since. Without If-Match the write still
+    fails with 412, never overwrites, if another request commits between
+    this handler's read and write.
     """
     # CRITICAL: Verify path user_id matches authenticated user
-    if str(current_user.id) != str(user_id):
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found"
@@ -373,14 +743,14 @@ def update_task(
         due_date=request.due_date,
         reminder_time=request.reminder_time,
         is_recurring=request.is_recurring if request.is_recurring is not None else False,
-        recurrence_pattern=request.recurrence_pattern.model_dump() if request.recurrence_pattern else None
+        recurrence_pattern=request.recurrence_pattern.model_dump(mode="json") if request.recurrence_pattern else None
     )
     
     # Get task with user_id filter
     task = session.exec(
         select(Task).where(
             Task.id == task_id,
-            Task.user_id == current_user.id
+            Task.user_id == current_user_id
         )
     ).first()
     
@@ -390,54 +760,53 @@ def update_task(
             detail="Task not found"
         )
     
-    # Update basic fields
-    if request.title is not None:
-        task.title = request.title
-    if request.description is not None:
-        task.description = request.description
-    
-    # Update Phase V fields
-    if request.priority is not None:
-        task.priority = request.priority
-    if request.due_date is not None:
-        task.due_date = request.due_date
-    if request.reminder_time is not None:
-        task.reminder_time = request.reminder_time
-    if request.is_recurring is not None:
-        task.is_recurring = request.is_recurring
-    if request.recurrence_pattern is not None:
-        task.recurrence_pattern = request.recurrence_pattern.model_dump(exclude_none=True)
-    
-    # Update tags if provided
-    if request.tags is not None:
-        # Remove existing tags
-        session.exec(
-            select(TaskTag).where(TaskTag.task_id == task_id)
-        ).all()
-        for tt in session.exec(select(TaskTag).where(TaskTag.task_id == task_id)).all():
-            session.delete(tt)
-        
-        # Add new tags
-        for tag_name in request.tags:
-            tag = session.exec(
-                select(Tag).where(Tag.name == tag_name)
-            ).first()
-            
-            if not tag:
-                tag = Tag(
-                    name=tag_name,
-                    color="#3B82F6",
-                    created_by=current_user.id
-                )
-                session.add(tag)
-                session.flush()
-            
-            task_tag = TaskTag(task_id=task.id, tag_id=tag.id)
-            session.add(task_tag)
+    require_if_match(http_request, _task_etag(task))
+    had_reminder = task.reminder_time is not None
     
-    task.updated_at = datetime.utcnow()
-    session.add(task)
-    session.commit()
+    with _conditional_write(session):
+        # Update basic fields
+        if request.title is not None:
+            task.title = request.title
+        if request.description is not None:
+            task.description = request.description
+        
+        # Update Phase V fields
+        if request.priority is not None:
+            task.priority = request.priority
+        if request.due_date is not None:
+            task.due_date = request.due_date
+        if request.reminder_time is not None:
+            task.reminder_time = request.reminder_time
+        if request.is_recurring is not None:
+            task.is_recurring = request.is_recurring
+        if request.recurrence_pattern is not None:
+            task.recurrence_pattern = request.recurrence_pattern.model_dump(mode="json", exclude_none=True)
+        if not task.completed:
+            task.next_occurrence_at = compute_next_occurrence(task)
+        
+        # Update tags if provided
+        if request.tags is not None:
+            # Remove existing tags
+            session.exec(
+                select(TaskTag).where(TaskTag.task_id == task_id)
+            ).all()
+            for tt in session.exec(select(TaskTag).where(TaskTag.task_id == task_id)).all():
+                session.delete(tt)
+        
+            # Add new tags
+            user_tags = _resolve_user_tags(session, current_user_id, request.tags, create_missing=True)
+            for tag in user_tags.values():
+                task_tag = TaskTag(task_id=task.id, tag_id=tag.id)
+                session.add(task_tag)
+        
+        task.updated_at = datetime.utcnow()
+        session.add(task)
+        # Re-read by the reminder leader whenever the task had or has a
+        # reminder (a no-op if it did not change)
+        if had_reminder or task.reminder_time:
+            notify_reminder_changed(session, task.id)
+        bump_data_version(session, current_user_id)
+        session.commit()
     session.refresh(task)
     
     # Publish task.updated event (T-C-003)
@@ -457,20 +826,22 @@ def update_task(
         if request.is_recurring is not None:
             changes["is_recurring"] = request.is_recurring
         if request.recurrence_pattern is not None:
-            changes["recurrence_pattern"] = request.recurrence_pattern.model_dump(exclude_none=True)
+            changes["recurrence_pattern"] = request.recurrence_pattern.model_dump(mode="json", exclude_none=True)
         if request.tags is not None:
             changes["tags"] = request.tags
         
         event_publisher.publish_task_updated(
             task_id=task.id,
-            user_id=str(current_user.id),
+            user_id=str(current_user_id),
             changes=changes,
             session=session
         )
     except Exception as e:
         print(f"⚠️  Event publishing failed: {e}")
     
-    return _load_task_with_tags(task.id, session)
+    task_with_tags = load_task_with_tags(task.id, session)
+    response.headers["ETag"] = _task_etag(task_with_tags)
+    return task_with_tags
 
 
 @router.patch("/{task_id}", response_model=TaskResponse)
@@ -478,41 +849,67 @@ def patch_task(
     user_id: UUID,
     task_id: int,
     request: TaskPatchRequest,
-    current_user: User = Depends(get_current_user),
+    http_request: Request,
+    response: Response,
+    current_user_id: UUID = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
     """
     Toggle task completion status.
     
-    [Task]: T-B-006, T-C-004
+    [Task]: T-B-006, T-C-004, T-029
     [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §3.1.3
+    
+    One UPDATE ... WHERE id = ? AND user_id = ? [AND version IN (If-Match)]
+    RETURNING the row: no read first and no row lock. If nothing matched,
+    the answer is 404 (no such task) or 412 (If-Match is out of date).
     """
     # CRITICAL: Verify path user_id matches authenticated user
-    if str(current_user.id) != str(user_id):
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found"
         )
     
-    # Get task with user_id filter
-    task = session.exec(
-        select(Task).where(
-            Task.id == task_id,
-            Task.user_id == current_user.id
-        )
+    # Conditional update with user_id filter
+    query = update(Task).where(
+        Task.id == task_id,
+        Task.user_id == current_user_id
+    )
+    expected_versions = if_match_versions(http_request, "task", task_id)
+    if expected_versions is not None:
+        query = query.where(Task.version.in_(expected_versions))
+    task = session.scalars(
+        query.values(
+            completed=request.completed,
+            updated_at=datetime.utcnow(),
+            version=Task.version + 1
+        ).returning(Task)
     ).first()
     
     if not task:
+        session.rollback()
+        exists = session.exec(
+            select(Task.id).where(
+                Task.id == task_id,
+                Task.user_id == current_user_id
+            )
+        ).first()
+        if exists is not None:
+            raise precondition_failed()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
     
-    # Update completion status
-    task.completed = request.completed
-    task.updated_at = datetime.utcnow()
-    session.add(task)
-    session.commit()
+    if task.reminder_time:
+        notify_reminder_changed(session, task.id)
+    
+    # Completing a recurring task materializes its next occurrence (T-C-013)
+    with _conditional_write(session):
+        next_tasks = roll_completed_tasks(session, [task]) if request.completed else []
+        bump_data_version(session, current_user_id)
+        session.commit()
     session.refresh(task)
     
     # Publish task.completed event (T-C-004)
@@ -520,26 +917,143 @@ def patch_task(
         event_publisher = get_event_publisher()
         event_publisher.publish_task_completed(
             task_id=task.id,
-            user_id=str(current_user.id),
+            user_id=str(current_user_id),
             completed=request.completed,
             session=session
         )
+        for next_task in next_tasks:
+            event_publisher.publish_task_created(
+                task_id=next_task.id,
+                user_id=str(current_user_id),
+                task_data={
+                    "title": next_task.title,
+                    "description": next_task.description,
+                    "priority": next_task.priority.value,
+                    "due_date": next_task.due_date.isoformat() if next_task.due_date else None,
+                    "reminder_time": next_task.reminder_time.isoformat() if next_task.reminder_time else None,
+                    "is_recurring": next_task.is_recurring,
+                    "recurrence_pattern": next_task.recurrence_pattern,
+                    "recurs_from_task_id": task.id
+                },
+                session=session
+            )
     except Exception as e:
         print(f"⚠️  Event publishing failed: {e}")
     
-    return _load_task_with_tags(task.id, session)
+    task_with_tags = load_task_with_tags(task.id, session)
+    response.headers["ETag"] = _task_etag(task_with_tags)
+    return task_with_tags
+
+
+@router.post("/{task_id}/unarchive", response_model=TaskResponse)
+def unarchive(
+    user_id: UUID,
+    task_id: int,
+    response: Response,
+    current_user_id: UUID = Depends(get_current_user_id),
+    session: Session = Depends(get_session)
+):
+    """
+    Move an archived task back to the task list.
+    
+    [Task]: T-030
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1
+    
+    The task keeps its id and stays completed; 404 if it is not archived.
+    """
+    # CRITICAL: Verify path user_id matches authenticated user
+    if str(current_user_id) != str(user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not found"
+        )
+    
+    task = unarchive_task(session, current_user_id, task_id)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archived task not found"
+        )
+    
+    task_with_tags = load_task_with_tags(task.id, session)
+    response.headers["ETag"] = _task_etag(task_with_tags)
+    return task_with_tags
+
+
+@router.get("/{task_id}/occurrences", response_model=OccurrenceListResponse)
+def list_occurrences(
+    user_id: UUID,
+    task_id: int,
+    from_: Optional[datetime] = Query(None, alias="from", description="Range start (default: now)"),
+    to: Optional[datetime] = Query(None, description="Range end (default: 90 days after start)"),
+    limit: int = Query(MAX_EXPANSION, ge=1, le=MAX_EXPANSION, description="Maximum occurrences returned"),
+    current_user_id: UUID = Depends(get_current_user_id),
+    session: Session = Depends(get_session)
+):
+    """
+    Expand a recurring task's occurrences within a date range (calendar view).
+    
+    Occurrences are computed from the stored pattern in memory; the only
+    database access is loading the task itself.
+    
+    [Task]: T-C-013
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §2.1
+    """
+    # CRITICAL: Verify path user_id matches authenticated user
+    if str(current_user_id) != str(user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not found"
+        )
+    
+    task = session.exec(
+        select(Task).where(
+            Task.id == task_id,
+            Task.user_id == current_user_id
+        )
+    ).first()
+    
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+    
+    start = naive_utc(from_) if from_ else datetime.utcnow()
+    end = naive_utc(to) if to else start + timedelta(days=90)
+    if end < start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'to' must not be before 'from'"
+        )
+    
+    pattern = task.recurrence if task.is_recurring else None
+    if pattern:
+        occurrences, truncated = expand_occurrences(pattern, task_anchor(task), start, end, limit)
+    else:
+        anchor = task_anchor(task)
+        in_range = task.due_date is not None and start <= anchor <= end
+        occurrences, truncated = ([anchor] if in_range else []), False
+    
+    return OccurrenceListResponse(
+        task_id=task.id,
+        occurrences=occurrences,
+        count=len(occurrences),
+        truncated=truncated
+    )
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_task(
     user_id: UUID,
     task_id: int,
-    current_user: User = Depends(get_current_user),
+    http_request: Request,
+    current_user_id: UUID = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
-    """Delete task."""
+    """Delete task (If-Match with the task's ETag: only that version)."""
     # CRITICAL: Verify path user_id matches authenticated user
-    if str(current_user.id) != str(user_id):
+    if str(current_user_id) != str(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found"
@@ -549,7 +1063,7 @@ def delete_task(
     task = session.exec(
         select(Task).where(
             Task.id == task_id,
-            Task.user_id == current_user.id
+            Task.user_id == current_user_id
         )
     ).first()
     
@@ -559,19 +1073,26 @@ def delete_task(
             detail="Task not found"
         )
     
+    require_if_match(http_request, _task_etag(task))
+    
     # Publish task.deleted event
     try:
         event_publisher = get_event_publisher()
         event_publisher.publish_task_deleted(
             task_id=task.id,
-            user_id=str(current_user.id),
+            user_id=str(current_user_id),
             session=session
         )
     except Exception as e:
         print(f"⚠️  Event publishing failed: {e}")
     
     # Delete task
-    session.delete(task)
-    session.commit()
+    if task.reminder_time:
+        notify_reminder_changed(session, task.id)
+    with _conditional_write(session):
+        session.delete(task)
+        record_deletions(session, current_user_id, [task_id])
+        bump_data_version(session, current_user_id)
+        session.commit()
     
     return None
@@ -111,9 +111,12 @@ class TaskResponse(BaseModel):
     reminder_time: Optional[datetime]
     is_recurring: bool
     recurrence_pattern: Optional[RecurrencePatternResponse]
+    next_occurrence_at: Optional[datetime] = None
     tags: List[TagResponse]
     created_at: datetime
     updated_at: datetime
+    version: int = Field(1, description="Row version; If-Match takes the task's ETag \"task-<id>-<version>\"")
+    archived: bool = Field(False, description="True for archived tasks (list_tasks include_archived=true)")
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -124,6 +127,46 @@ class TaskListResponse(BaseModel):
     count: int
 
 
+class TaskChangesResponse(BaseModel):
+    """Tasks changed and deleted since a sync token."""
+    changed: List[TaskResponse]
+    deleted: List[int] = Field(default_factory=list, description="IDs of tasks deleted since the token")
+    sync_token: str = Field(..., description="Pass as ?since= on the next sync")
+
+
+class OccurrenceListResponse(BaseModel):
+    """Expanded occurrences of a task within a date range."""
+    task_id: int
+    occurrences: List[datetime]
+    count: int
+    truncated: bool = Field(False, description="True if the range held more occurrences than the limit")
+
+
+# ===== Agenda Schemas =====
+
+class AgendaItem(BaseModel):
+    """A task placed on the agenda at one of its occurrences."""
+    occurs_at: datetime
+    projected: bool = Field(False, description="True for future occurrences of a recurring task that are not yet materialized")
+    task: TaskResponse
+
+
+class AgendaBucket(BaseModel):
+    """Agenda items falling within one day or week."""
+    start: date
+    items: List[AgendaItem]
+
+
+class AgendaResponse(BaseModel):
+    """Tasks grouped by date bucket over a range."""
+    range_start: datetime
+    range_end: datetime
+    bucket: str
+    buckets: List[AgendaBucket]
+    count: int
+    truncated: bool = Field(False, description="True if a recurring task had more occurrences in range than were expanded")
+
+
 # ===== Search and Filter Schemas =====
 
 class TaskSearchFilters(BaseModel):
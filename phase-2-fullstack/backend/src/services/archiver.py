@@ -0,0 +1,155 @@
+"""
+Archive tier for completed tasks.
+[Task]: T-030 (Task Archive)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+
+Tasks completed more than ARCHIVE_COMPLETED_AFTER_DAYS ago (by
+updated_at, which completing a task sets) move from tasks to
+archived_tasks in batches, so list, stats and scheduler queries only
+touch the working set. A batch is three set-based statements in one
+transaction: INSERT ... SELECT into the archive (tag links folded into
+tag_ids), DELETE from tasks (task_tags cascade), plus tombstones so delta
+sync clients drop the tasks. Rows are claimed with FOR UPDATE SKIP LOCKED
+so several pods can run the job at once.
+
+Recurring tasks are only archived once rolled (next_occurrence_at is
+NULL). event_log rows keep their payload but their task_id is set to
+NULL by the foreign key.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import cast, delete, func, insert, literal
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Session, select
+from src.config import settings
+from src.models.archived_task import ArchivedTask
+from src.models.tag import Tag, TaskTag
+from src.models.task import Task
+from src.services.data_version import bump_data_version, bump_data_versions
+from src.services.task_sync import record_deletions
+
+# Columns shared by tasks and archived_tasks, in INSERT ... SELECT order
+TASK_COLUMNS = (
+    "id",
+    "user_id",
+    "title",
+    "description",
+    "completed",
+    "priority",
+    "due_date",
+    "reminder_time",
+    "is_recurring",
+    "recurrence_pattern",
+    "next_occurrence_at",
+    "created_at",
+    "updated_at",
+    "version",
+)
+
+
+def archive_batch(
+    session: Session,
+    batch_size: int = 500,
+    older_than_days: Optional[int] = None
+) -> Dict[UUID, List[int]]:
+    """
+    Move one batch of long-completed tasks to the archive and commit.
+
+    Served by ix_tasks_completed_updated.
+
+    Returns:
+        Archived task ids by user
+    """
+    days = settings.ARCHIVE_COMPLETED_AFTER_DAYS if older_than_days is None else older_than_days
+    cutoff = datetime.utcnow() - timedelta(days=days)
+
+    rows = session.exec(
+        select(Task.id, Task.user_id)
+        .where(
+            Task.completed == True,
+            Task.updated_at < cutoff,
+            Task.next_occurrence_at.is_(None)
+        )
+        .order_by(Task.updated_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).all()
+    if not rows:
+        session.rollback()
+        return {}
+
+    archived: Dict[UUID, List[int]] = defaultdict(list)
+    for task_id, user_id in rows:
+        archived[user_id].append(task_id)
+    task_ids = [task_id for task_id, _ in rows]
+
+    now = datetime.utcnow()
+    tag_ids = (
+        select(func.coalesce(func.jsonb_agg(TaskTag.tag_id), cast(literal("[]"), JSONB)))
+        .where(TaskTag.task_id == Task.id)
+        .scalar_subquery()
+    )
+    session.execute(
+        insert(ArchivedTask).from_select(
+            [*TASK_COLUMNS, "tag_ids", "archived_at"],
+            select(
+                *[getattr(Task, name) for name in TASK_COLUMNS],
+                tag_ids,
+                literal(now)
+            ).where(Task.id.in_(task_ids))
+        )
+    )
+    session.execute(
+        delete(Task)
+        .where(Task.id.in_(task_ids))
+        .execution_options(synchronize_session=False)
+    )
+    for user_id, ids in archived.items():
+        record_deletions(session, user_id, ids)
+    bump_data_versions(session, archived.keys())
+    session.commit()
+    return dict(archived)
+
+
+def unarchive_task(session: Session, user_id: UUID, task_id: int) -> Optional[Task]:
+    """
+    Move an archived task back to tasks and commit.
+
+    The task keeps its id and fields (it stays completed); updated_at and
+    version move on so delta sync and If-Match see a change. Tag links are
+    restored for tags the user still has.
+
+    Returns:
+        The restored Task, or None if the user has no such archived task
+    """
+    archived = session.exec(
+        select(ArchivedTask)
+        .where(ArchivedTask.id == task_id, ArchivedTask.user_id == user_id)
+        .with_for_update()
+    ).first()
+    if not archived:
+        return None
+
+    restored = {name: getattr(ArchivedTask, name) for name in TASK_COLUMNS}
+    restored["updated_at"] = literal(datetime.utcnow())
+    restored["version"] = ArchivedTask.version + 1
+    session.execute(
+        insert(Task).from_select(
+            list(TASK_COLUMNS),
+            select(*restored.values()).where(ArchivedTask.id == task_id)
+        )
+    )
+
+    if archived.tag_ids:
+        tag_ids = session.exec(
+            select(Tag.id).where(Tag.id.in_(archived.tag_ids), Tag.created_by == user_id)
+        ).all()
+        session.add_all([TaskTag(task_id=task_id, tag_id=tag_id) for tag_id in tag_ids])
+
+    session.delete(archived)
+    bump_data_version(session, user_id)
+    session.commit()
+    return session.get(Task, task_id)
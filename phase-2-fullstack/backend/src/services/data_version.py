@@ -0,0 +1,48 @@
+"""
+Per-user data version stamps.
+[Task]: T-025 (Conditional GET)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+
+users.data_version counts changes to a user's tasks and tags. Every
+write path calls bump_data_version() before committing, so the bump is
+part of the same transaction as the change:
+- REST task and tag routes
+- MCP tools (chat and the standalone MCP server)
+- the recurring-task sweep and the archive job
+
+Read endpoints turn the version into an ETag. A client that already has
+the current version gets 304 after a single primary-key lookup, without
+the list query running. The MCP tool cache (services/tool_cache) keys
+read-only results on it the same way.
+"""
+
+from typing import Iterable, Optional
+from uuid import UUID
+from sqlalchemy import update
+from sqlmodel import Session, select
+from src.models.user import User
+
+
+def bump_data_version(session: Session, user_id: UUID) -> None:
+    """Mark the user's tasks/tags as changed (call before session.commit())."""
+    bump_data_versions(session, [user_id])
+
+
+def bump_data_versions(session: Session, user_ids: Iterable[UUID]) -> None:
+    """Mark several users as changed with one UPDATE."""
+    user_ids = {UUID(str(user_id)) for user_id in user_ids}
+    if not user_ids:
+        return
+    session.execute(
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(data_version=User.data_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def get_data_version(session: Session, user_id: UUID) -> Optional[int]:
+    """Current data version (None if the user does not exist)."""
+    return session.exec(
+        select(User.data_version).where(User.id == user_id)
+    ).first()
@@ -15,6 +15,7 @@ from uuid import uuid4
 from sqlmodel import Session
 from src.models.event_log import EventLog
 from src.config import settings
+from src.services import tool_cache
 
 
 class EventPublisher:
@@ -125,6 +126,10 @@ class EventPublisher:
         """
         event_id = str(uuid4())
         
+        # Any change to a user's tasks makes their cached tool results stale
+        if event_type.startswith("task."):
+            tool_cache.invalidate_user(user_id)
+        
         # Enrich payload with metadata
         event_payload = {
             "event_id": event_id,
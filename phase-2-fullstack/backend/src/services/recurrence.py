@@ -0,0 +1,297 @@
+"""
+Recurrence engine for recurring tasks.
+[Task]: T-C-013 (Recurrence Engine)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §2.1,
+        specs/005-phase-v-cloud/phase5-cloud.plan.md §2.3
+
+Turns a stored RecurrencePattern into concrete occurrence datetimes.
+
+The series of a recurring task starts at its anchor (due_date, or
+created_at when there is no due date) and continues with every date the
+pattern produces strictly after it, at the anchor's time of day:
+- DAILY: every `interval` days
+- WEEKLY: on `days_of_week` (0=Monday) of every `interval`-th week,
+  defaulting to the anchor's weekday
+- MONTHLY: on `day_of_month` (clamped to the month length) every
+  `interval` months, defaulting to the anchor's day
+- YEARLY: on `month`/`day_of_month` every `interval` years
+`occurrences` caps the series length (the anchor counts as the first) and
+`end_date` is inclusive.
+
+Occurrences are computed arithmetically: expanding a range jumps straight
+to the first cycle that can intersect it instead of stepping from the
+anchor, so calendar expansion is O(result) with no DB access.
+"""
+
+import calendar
+from collections import defaultdict
+from datetime import datetime, timedelta, time, timezone
+from typing import Iterator, List, Optional, Tuple
+from sqlmodel import Session, select
+from src.models.task import Task, RecurrencePattern, RecurrenceFrequency
+from src.models.tag import TaskTag
+from src.services.reminder_timer import notify_reminder_changed
+from src.services.data_version import bump_data_versions
+
+
+# Hard cap for a single expansion request
+MAX_EXPANSION = 1000
+
+
+def naive_utc(value: datetime) -> datetime:
+    """Normalize aware datetimes to naive UTC (the storage convention)."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _add_months(year: int, month: int, months: int) -> Tuple[int, int]:
+    total = year * 12 + (month - 1) + months
+    return total // 12, total % 12 + 1
+
+
+def _on_day(year: int, month: int, day: int, anchor: datetime) -> datetime:
+    """Date in the given month (day clamped to month length) at anchor's time."""
+    day = min(day, calendar.monthrange(year, month)[1])
+    return anchor.replace(year=year, month=month, day=day)
+
+
+def _cycle_candidates(pattern: RecurrencePattern, anchor: datetime, cycle: int) -> List[datetime]:
+    """Sorted pattern dates in the given cycle (cycle 0 contains the anchor)."""
+    interval = max(pattern.interval or 1, 1)
+
+    if pattern.frequency == RecurrenceFrequency.DAILY:
+        return [anchor + timedelta(days=cycle * interval)]
+
+    if pattern.frequency == RecurrenceFrequency.WEEKLY:
+        days = sorted(set(pattern.days_of_week or [anchor.weekday()]))
+        week_start = anchor - timedelta(days=anchor.weekday()) + timedelta(weeks=cycle * interval)
+        return [week_start + timedelta(days=day) for day in days]
+
+    if pattern.frequency == RecurrenceFrequency.MONTHLY:
+        year, month = _add_months(anchor.year, anchor.month, cycle * interval)
+        return [_on_day(year, month, pattern.day_of_month or anchor.day, anchor)]
+
+    # YEARLY
+    return [_on_day(
+        anchor.year + cycle * interval,
+        pattern.month or anchor.month,
+        pattern.day_of_month or anchor.day,
+        anchor
+    )]
+
+
+def _cycle_at_or_before(pattern: RecurrencePattern, anchor: datetime, when: datetime) -> int:
+    """Index of a cycle with no occurrence >= when before it (jump target)."""
+    interval = max(pattern.interval or 1, 1)
+
+    if pattern.frequency == RecurrenceFrequency.DAILY:
+        cycle = (when - anchor).days // interval
+    elif pattern.frequency == RecurrenceFrequency.WEEKLY:
+        week_start = anchor - timedelta(days=anchor.weekday())
+        cycle = ((when - week_start).days // 7) // interval
+    elif pattern.frequency == RecurrenceFrequency.MONTHLY:
+        months = (when.year - anchor.year) * 12 + (when.month - anchor.month)
+        cycle = months // interval
+    else:
+        cycle = (when.year - anchor.year) // interval
+
+    return max(cycle, 0)
+
+
+def _end_limit(pattern: RecurrencePattern) -> Optional[datetime]:
+    if not pattern.end_date:
+        return None
+    return datetime.combine(pattern.end_date, time.max)
+
+
+def iter_occurrences(
+    pattern: RecurrencePattern,
+    anchor: datetime,
+    start: Optional[datetime] = None
+) -> Iterator[Tuple[int, datetime]]:
+    """
+    Yield (index, occurrence) pairs in chronological order.
+
+    Index 0 is the anchor itself. When start is given, iteration jumps
+    directly to the first occurrence at or after it.
+    """
+    anchor = naive_utc(anchor)
+    start = naive_utc(start) if start else None
+    limit = pattern.occurrences
+    end = _end_limit(pattern)
+
+    if end and anchor > end:
+        return
+    if start is None or anchor >= start:
+        yield 0, anchor
+
+    first_cycle = [dt for dt in _cycle_candidates(pattern, anchor, 0) if dt > anchor]
+    per_cycle = len(_cycle_candidates(pattern, anchor, 1))
+    cycle = _cycle_at_or_before(pattern, anchor, start) if start else 0
+
+    while True:
+        if cycle == 0:
+            candidates, base = first_cycle, 0
+        else:
+            candidates = _cycle_candidates(pattern, anchor, cycle)
+            base = len(first_cycle) + (cycle - 1) * per_cycle
+
+        for position, occurrence in enumerate(candidates):
+            index = base + position + 1
+            if limit and index >= limit:
+                return
+            if end and occurrence > end:
+                return
+            if start and occurrence < start:
+                continue
+            yield index, occurrence
+
+        cycle += 1
+
+
+def next_occurrence(pattern: RecurrencePattern, anchor: datetime) -> Optional[datetime]:
+    """The first occurrence strictly after the anchor, or None if the series ends."""
+    for index, occurrence in iter_occurrences(pattern, anchor):
+        if index >= 1:
+            return occurrence
+    return None
+
+
+def expand_occurrences(
+    pattern: RecurrencePattern,
+    anchor: datetime,
+    start: datetime,
+    end: datetime,
+    max_count: int = MAX_EXPANSION
+) -> Tuple[List[datetime], bool]:
+    """
+    All occurrences in [start, end].
+
+    Returns:
+        (occurrences, truncated) - truncated is True if max_count was hit
+    """
+    end = naive_utc(end)
+    occurrences = []
+    for _, occurrence in iter_occurrences(pattern, anchor, start):
+        if occurrence > end:
+            return occurrences, False
+        if len(occurrences) >= max_count:
+            return occurrences, True
+        occurrences.append(occurrence)
+    return occurrences, False
+
+
+def task_anchor(task: Task) -> datetime:
+    """The datetime a task's recurrence series is anchored on."""
+    return naive_utc(task.due_date or task.created_at)
+
+
+def compute_next_occurrence(task: Task) -> Optional[datetime]:
+    """
+    next_occurrence_at value for a task (None if not recurring).
+
+    [Task]: T-C-013
+    """
+    if not task.is_recurring:
+        return None
+    pattern = task.recurrence
+    if not pattern:
+        return None
+    return next_occurrence(pattern, task_anchor(task))
+
+
+def roll_completed_tasks(session: Session, tasks: List[Task]) -> List[Task]:
+    """
+    Materialize the next instance of each completed recurring task.
+
+    All new instances (and their tag links) are written with one flush;
+    the caller commits. A rolled task's next_occurrence_at is cleared so
+    it is never rolled twice.
+
+    [Task]: T-C-013
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §2.1
+
+    Returns:
+        The newly created Task instances
+    """
+    rolling = [
+        task for task in tasks
+        if task.completed and task.is_recurring and task.next_occurrence_at
+    ]
+    if not rolling:
+        return []
+
+    tags_by_task = defaultdict(list)
+    for task_tag in session.exec(
+        select(TaskTag).where(TaskTag.task_id.in_([task.id for task in rolling]))
+    ).all():
+        tags_by_task[task_tag.task_id].append(task_tag.tag_id)
+
+    pairs = []
+    for task in rolling:
+        pattern = task.recurrence
+        next_due = task.next_occurrence_at
+        task.next_occurrence_at = None
+        task.updated_at = datetime.utcnow()
+        session.add(task)
+        if not pattern:
+            continue
+
+        if pattern.occurrences:
+            pattern = pattern.model_copy(update={"occurrences": pattern.occurrences - 1})
+
+        reminder_time = None
+        if task.reminder_time:
+            reminder_time = naive_utc(task.reminder_time) + (next_due - task_anchor(task))
+
+        new_task = Task(
+            user_id=task.user_id,
+            title=task.title,
+            description=task.description,
+            completed=False,
+            priority=task.priority,
+            due_date=next_due,
+            reminder_time=reminder_time,
+            is_recurring=True,
+            recurrence_pattern=pattern.model_dump(mode="json", exclude_none=True),
+            next_occurrence_at=next_occurrence(pattern, next_due)
+        )
+        session.add(new_task)
+        pairs.append((task, new_task))
+
+    session.flush()
+
+    session.add_all([
+        TaskTag(task_id=new_task.id, tag_id=tag_id)
+        for task, new_task in pairs
+        for tag_id in tags_by_task[task.id]
+    ])
+    for _, new_task in pairs:
+        if new_task.reminder_time:
+            notify_reminder_changed(session, new_task.id)
+
+    return [new_task for _, new_task in pairs]
+
+
+def roll_pending_batch(session: Session, batch_size: int = 500) -> List[Task]:
+    """
+    Roll one batch of completed recurring tasks that have not been rolled yet.
+
+    Catches completions made outside patch_task (e.g. bulk updates).
+    Rows are locked with SKIP LOCKED so several pods can run it at once.
+    """
+    tasks = session.exec(
+        select(Task)
+        .where(
+            Task.next_occurrence_at.isnot(None),
+            Task.completed == True
+        )
+        .order_by(Task.next_occurrence_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).all()
+    new_tasks = roll_completed_tasks(session, list(tasks))
+    bump_data_versions(session, {task.user_id for task in tasks})
+    session.commit()
+    return new_tasks
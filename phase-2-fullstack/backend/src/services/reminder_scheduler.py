@@ -20,6 +20,45 @@ class ReminderScheduler:
     [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §3.2.1
     """
     
+    @staticmethod
+    def due_reminders_query(start: datetime, end: datetime):
+        """
+        Pending tasks (with owner email) whose reminder falls in (start, end].
+        
+        The predicate matches ix_tasks_pending_reminder, a partial index on
+        reminder_time WHERE completed = false AND reminder_time IS NOT NULL.
+        """
+        return (
+            select(Task, User.email)
+            .join(User, User.id == Task.user_id)
+            .where(
+                Task.completed == False,
+                Task.reminder_time.isnot(None),
+                Task.reminder_time > start,
+                Task.reminder_time <= end
+            )
+            .order_by(Task.reminder_time)
+        )
+    
+    @staticmethod
+    def overdue_tasks_query(now: datetime):
+        """
+        Pending tasks (with owner email) whose due date is before now.
+        
+        The predicate matches ix_tasks_pending_due, a partial index on
+        due_date WHERE completed = false AND due_date IS NOT NULL.
+        """
+        return (
+            select(Task, User.email)
+            .join(User, User.id == Task.user_id)
+            .where(
+                Task.completed == False,
+                Task.due_date.isnot(None),
+                Task.due_date < now
+            )
+            .order_by(Task.due_date)
+        )
+    
     def get_due_reminders(self, session: Session, lookahead_minutes: int = 60) -> List[Dict[str, Any]]:
         """
         Get tasks with reminders due within the specified lookahead window.
@@ -37,37 +76,32 @@ class ReminderScheduler:
         now = datetime.utcnow()
         lookahead_time = now + timedelta(minutes=lookahead_minutes)
         
-        # Query tasks with reminders in the lookahead window
-        tasks = session.exec(
-            select(Task).where(
-                Task.reminder_time.isnot(None),
-                Task.reminder_time <= lookahead_time,
-                Task.reminder_time > now,
-                Task.completed == False
-            )
-        ).all()
+        # Query pending tasks with reminders in the lookahead window (owner
+        # email is joined in rather than looked up per task)
+        rows = session.exec(self.due_reminders_query(now, lookahead_time)).all()
         
-        reminders = []
-        for task in tasks:
-            user = session.exec(
-                select(User).where(User.id == task.user_id)
-            ).first()
-            
-            if user:
-                reminders.append({
-                    "task_id": task.id,
-                    "user_id": str(task.user_id),
-                    "user_email": user.email,
-                    "user_name": user.full_name,
-                    "title": task.title,
-                    "description": task.description,
-                    "reminder_time": task.reminder_time.isoformat(),
-                    "due_date": task.due_date.isoformat() if task.due_date else None,
-                    "priority": task.priority.value,
-                    "minutes_until_reminder": int((task.reminder_time - now).total_seconds() / 60)
-                })
+        return [self.reminder_payload(task, user_email, now) for task, user_email in rows]
+    
+    @staticmethod
+    def reminder_payload(task: Task, user_email: str, now: datetime) -> Dict[str, Any]:
+        """
+        Build the reminder.due event payload for a task.
         
-        return reminders
+        [Task]: T-C-006
+        [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §3.2.1
+        """
+        return {
+            "task_id": task.id,
+            "user_id": str(task.user_id),
+            "user_email": user_email,
+            "user_name": None,  # User model has no display name
+            "title": task.title,
+            "description": task.description,
+            "reminder_time": task.reminder_time.isoformat(),
+            "due_date": task.due_date.isoformat() if task.due_date else None,
+            "priority": task.priority.value,
+            "minutes_until_reminder": int((task.reminder_time - now).total_seconds() / 60)
+        }
     
     def get_overdue_tasks(self, session: Session) -> List[Dict[str, Any]]:
         """
@@ -78,31 +112,20 @@ class ReminderScheduler:
         """
         now = datetime.utcnow()
         
-        tasks = session.exec(
-            select(Task).where(
-                Task.due_date.isnot(None),
-                Task.due_date < now,
-                Task.completed == False
-            )
-        ).all()
+        rows = session.exec(self.overdue_tasks_query(now)).all()
         
         overdue = []
-        for task in tasks:
-            user = session.exec(
-                select(User).where(User.id == task.user_id)
-            ).first()
-            
-            if user:
-                overdue.append({
-                    "task_id": task.id,
-                    "user_id": str(task.user_id),
-                    "user_email": user.email,
-                    "user_name": user.full_name,
-                    "title": task.title,
-                    "due_date": task.due_date.isoformat(),
-                    "priority": task.priority.value,
-                    "hours_overdue": int((now - task.due_date).total_seconds() / 3600)
-                })
+        for task, user_email in rows:
+            overdue.append({
+                "task_id": task.id,
+                "user_id": str(task.user_id),
+                "user_email": user_email,
+                "user_name": None,  # User model has no display name
+                "title": task.title,
+                "due_date": task.due_date.isoformat(),
+                "priority": task.priority.value,
+                "hours_overdue": int((now - task.due_date).total_seconds() / 3600)
+            })
         
         return overdue
 
@@ -0,0 +1,307 @@
+"""
+In-process reminder timer service.
+[Task]: T-C-012 (Reminder Timer)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §3.2,
+        specs/005-phase-v-cloud/phase5-cloud.plan.md §5.3
+
+Replaces cron polling of /api/jobs/check-reminders with a min-heap of
+upcoming reminder times held in memory and fired at their exact time.
+
+- The heap is loaded once when this pod becomes leader (one indexed scan
+  over ix_tasks_pending_reminder, reaching back REMINDER_TIMER_GRACE_SECONDS
+  so reminders that came due during a leader handover still fire; one
+  the old leader fired just before losing its lock may be sent twice,
+  i.e. reminder.due is at-least-once), then kept current through Postgres
+  LISTEN/NOTIFY: task create/update/complete/delete call
+  notify_reminder_changed(), which sends pg_notify inside the request's
+  transaction, so the leader only hears about committed changes.
+- Only one pod fires reminders: the leader holds a session-level Postgres
+  advisory lock on a dedicated connection. If that connection drops the
+  lock is released and another pod takes over.
+- There are no periodic scans; between reminders the leader thread just
+  waits on the LISTEN socket.
+
+Enable with REMINDER_TIMER_ENABLED=true (and stop the external cron).
+"""
+
+import heapq
+import select as select_module
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session, create_engine, select, text
+from src.config import settings
+from src.models.task import Task
+from src.models.user import User
+from src.services.reminder_scheduler import ReminderScheduler
+
+
+# pg_notify channel carrying task ids whose reminder may have changed
+NOTIFY_CHANNEL = "task_reminders"
+
+# Advisory lock key for leader election (arbitrary, fixed per application)
+LEADER_LOCK_KEY = 7_300_529
+
+# Upper bound on a single wait, so stop() and lost connections are noticed
+MAX_WAIT_SECONDS = 30.0
+
+
+def reminder_timer_enabled() -> bool:
+    """Whether the in-process reminder timer is configured."""
+    return settings.REMINDER_TIMER_ENABLED.lower() == "true"
+
+
+def notify_reminder_changed(session: Session, task_id: Optional[int]) -> None:
+    """
+    Tell the reminder leader that a task's reminder may have changed.
+
+    Must be called before session.commit(): Postgres delivers the
+    notification only when the surrounding transaction commits. The
+    notify runs in a savepoint, so if it fails only the savepoint is
+    rolled back and the caller's write still commits.
+
+    [Task]: T-C-012
+    """
+    if not task_id or not reminder_timer_enabled():
+        return
+    # Pending changes are flushed outside the savepoint: their errors belong to the caller
+    session.flush()
+    try:
+        with session.begin_nested():
+            session.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": NOTIFY_CHANNEL, "payload": str(task_id)}
+            )
+    except Exception as e:
+        print(f"⚠️  Reminder notify failed for task {task_id}: {e}")
+
+
+class ReminderHeap:
+    """
+    Min-heap of (fire_at, task_id) with lazy invalidation.
+
+    Rescheduling or cancelling a task only updates the index; stale heap
+    entries are discarded when they reach the top.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int]] = []
+        self._scheduled: Dict[int, datetime] = {}
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    def schedule(self, task_id: int, fire_at: Optional[datetime]) -> None:
+        """Schedule (or reschedule) a task; a None fire time cancels it."""
+        if fire_at is None:
+            self.cancel(task_id)
+            return
+        if self._scheduled.get(task_id) == fire_at:
+            return
+        self._scheduled[task_id] = fire_at
+        heapq.heappush(self._heap, (fire_at, task_id))
+
+    def cancel(self, task_id: int) -> None:
+        """Remove a task from the schedule."""
+        self._scheduled.pop(task_id, None)
+
+    def next_fire_time(self) -> Optional[datetime]:
+        """Earliest scheduled fire time, or None if nothing is scheduled."""
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[int]:
+        """Remove and return task ids whose fire time is at or before now."""
+        due = []
+        self._discard_stale()
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, task_id = heapq.heappop(self._heap)
+            del self._scheduled[task_id]
+            due.append(task_id)
+            self._discard_stale()
+        return due
+
+    def clear(self) -> None:
+        """Drop every scheduled reminder."""
+        self._heap.clear()
+        self._scheduled.clear()
+
+    def _discard_stale(self) -> None:
+        while self._heap:
+            fire_at, task_id = self._heap[0]
+            if self._scheduled.get(task_id) == fire_at:
+                return
+            heapq.heappop(self._heap)
+
+
+class ReminderTimerService:
+    """
+    Leader-elected background thread that fires reminder.due events.
+
+    [Task]: T-C-012
+    [From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §3.2.1
+    """
+
+    def __init__(self):
+        self.heap = ReminderHeap()
+        self.is_leader = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Dedicated engine: the LISTEN connection is held for the lifetime
+        # of the leadership and must not come from the request pool.
+        self._engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+
+    def start(self) -> None:
+        """Start the background leader loop."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="reminder-timer",
+            daemon=True
+        )
+        self._thread.start()
+        print("✅ Reminder timer started")
+
+    def stop(self) -> None:
+        """Stop the loop and release leadership."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=MAX_WAIT_SECONDS + 5)
+        print("✅ Reminder timer stopped")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._lead()
+            except Exception as e:
+                print(f"⚠️  Reminder timer error: {e}")
+            self.is_leader = False
+            self.heap.clear()
+            self._stop.wait(settings.REMINDER_TIMER_LEADER_RETRY_SECONDS)
+
+    def _lead(self) -> None:
+        """Try to become leader; if successful, serve reminders until stopped."""
+        raw_connection = self._engine.raw_connection()
+        try:
+            conn = raw_connection.driver_connection
+            conn.autocommit = True
+            cursor = conn.cursor()
+
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", (LEADER_LOCK_KEY,))
+            if not cursor.fetchone()[0]:
+                return
+
+            self.is_leader = True
+            print("👑 Reminder timer acquired leadership")
+            cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+            self._load_upcoming()
+
+            while not self._stop.is_set():
+                self._fire_due()
+
+                timeout = MAX_WAIT_SECONDS
+                next_fire = self.heap.next_fire_time()
+                if next_fire is not None:
+                    timeout = min(timeout, max(0.0, (next_fire - datetime.utcnow()).total_seconds()))
+
+                readable, _, _ = select_module.select([conn], [], [], timeout)
+                if readable:
+                    conn.poll()
+                    changed = {int(n.payload) for n in conn.notifies if n.payload.isdigit()}
+                    conn.notifies.clear()
+                    if changed:
+                        self._reload(changed)
+
+            cursor.execute("SELECT pg_advisory_unlock(%s)", (LEADER_LOCK_KEY,))
+        finally:
+            raw_connection.close()
+
+    def _load_upcoming(self) -> None:
+        """
+        Load every pending reminder from the grace window on (ix_tasks_pending_reminder).
+
+        Reminders already due fire on the next _fire_due(), which re-checks them.
+        """
+        since = datetime.utcnow() - timedelta(seconds=settings.REMINDER_TIMER_GRACE_SECONDS)
+        with Session(self._engine) as session:
+            rows = session.exec(
+                select(Task.id, Task.reminder_time).where(
+                    Task.completed == False,
+                    Task.reminder_time.isnot(None),
+                    Task.reminder_time > since
+                )
+            ).all()
+        self.heap.clear()
+        for task_id, reminder_time in rows:
+            self.heap.schedule(task_id, reminder_time)
+        print(f"⏰ Reminder timer loaded {len(self.heap)} pending reminder(s)")
+
+    def _reload(self, task_ids: set) -> None:
+        """Re-read changed tasks; deleted or completed ones are cancelled."""
+        now = datetime.utcnow()
+        with Session(self._engine) as session:
+            rows = dict(session.exec(
+                select(Task.id, Task.reminder_time).where(
+                    Task.id.in_(task_ids),
+                    Task.completed == False,
+                    Task.reminder_time.isnot(None)
+                )
+            ).all())
+        for task_id in task_ids:
+            reminder_time = rows.get(task_id)
+            if reminder_time is not None and reminder_time > now:
+                self.heap.schedule(task_id, reminder_time)
+            else:
+                self.heap.cancel(task_id)
+
+    def _fire_due(self) -> None:
+        """Publish reminder.due for every reminder whose time has come."""
+        now = datetime.utcnow()
+        due_ids = self.heap.pop_due(now)
+        if not due_ids:
+            return
+
+        # Local import: the event publisher pulls in httpx/kafka clients
+        from src.services.event_publisher import get_event_publisher
+        event_publisher = get_event_publisher()
+
+        with Session(self._engine) as session:
+            # Re-check state: a change may still be in flight on the notify channel
+            rows = session.exec(
+                select(Task, User.email)
+                .join(User, User.id == Task.user_id)
+                .where(
+                    Task.id.in_(due_ids),
+                    Task.completed == False,
+                    Task.reminder_time.isnot(None),
+                    Task.reminder_time <= now + timedelta(seconds=1)
+                )
+            ).all()
+
+            for task, user_email in rows:
+                try:
+                    event_publisher.publish(
+                        event_type="reminder.due",
+                        topic=event_publisher.TOPIC_REMINDERS,
+                        payload=ReminderScheduler.reminder_payload(task, user_email, now),
+                        task_id=task.id,
+                        user_id=str(task.user_id),
+                        session=session
+                    )
+                except Exception as e:
+                    print(f"⚠️  Failed to publish reminder for task {task.id}: {e}")
+
+
+# Global reminder timer instance
+_reminder_timer = None
+
+
+def get_reminder_timer() -> ReminderTimerService:
+    """Get singleton reminder timer instance."""
+    global _reminder_timer
+    if _reminder_timer is None:
+        _reminder_timer = ReminderTimerService()
+    return _reminder_timer
@@ -0,0 +1,182 @@
+"""
+Delta sync for offline-capable clients.
+[Task]: T-028 (Delta Sync)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+
+A client keeps an opaque sync token and asks for what changed since it:
+tasks written, plus tombstones of tasks deleted, by transactions the
+token's read could not see. Every task and tombstone row carries
+sync_xid, the id of the transaction that last wrote it, stamped by the
+model on each INSERT/UPDATE (including tag renames, which change the tags
+embedded in each task, and unarchiving). Every delete path calls
+record_deletions() before committing; archiving counts as a delete.
+
+The token holds the xmin of the database snapshot taken when the read
+started: every transaction with a lower id had already finished, so
+anything it wrote was visible to that read. The next sync returns rows
+with sync_xid >= xmin, which covers writes that were in flight however
+long they ran, and does not depend on application clocks (updated_at).
+Rows written just before a read may be sent again by the next one, so
+clients must apply changes as upserts. A long-running transaction
+anywhere in the database holds xmin back and widens that overlap.
+"""
+
+import base64
+import binascii
+from datetime import datetime, timedelta
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import delete, text, update
+from sqlmodel import Session, select
+from src.config import settings
+from src.models.tag import TaskTag
+from src.models.task import Task
+from src.models.task_tombstone import TaskTombstone
+
+TOKEN_PREFIX = "v2:"
+
+# Tokens of the updated_at based protocol; answered with a resync
+LEGACY_TOKEN_PREFIX = "v1:"
+
+
+class SyncTokenInvalid(ValueError):
+    """The sync token could not be parsed."""
+
+
+class SyncResyncRequired(Exception):
+    """The token is too old or too much changed; refetch the full list."""
+
+
+class SyncPoint(NamedTuple):
+    """Where a sync read started: snapshot xmin and time (naive UTC)."""
+    xmin: int
+    at: datetime
+
+
+def encode_sync_token(point: SyncPoint) -> str:
+    """Opaque token for a sync point."""
+    raw = f"{TOKEN_PREFIX}{point.xmin}:{point.at.isoformat()}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_sync_token(token: str) -> SyncPoint:
+    """
+    Sync point of a token from encode_sync_token().
+
+    Raises:
+        SyncTokenInvalid: the token could not be parsed
+        SyncResyncRequired: the token predates sync_xid (v1)
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+    except (ValueError, UnicodeError, binascii.Error) as e:
+        raise SyncTokenInvalid("Invalid sync token") from e
+
+    if raw.startswith(LEGACY_TOKEN_PREFIX):
+        raise SyncResyncRequired("Sync token format changed")
+
+    try:
+        if not raw.startswith(TOKEN_PREFIX):
+            raise ValueError(raw)
+        xmin, at = raw[len(TOKEN_PREFIX):].split(":", 1)
+        return SyncPoint(int(xmin), datetime.fromisoformat(at))
+    except ValueError as e:
+        raise SyncTokenInvalid("Invalid sync token") from e
+
+
+def record_deletions(session: Session, user_id: UUID, task_ids: Iterable[int]) -> None:
+    """Write tombstones for deleted tasks (call before session.commit())."""
+    user_id = UUID(str(user_id))
+    session.add_all([
+        TaskTombstone(task_id=task_id, user_id=user_id)
+        for task_id in task_ids
+    ])
+
+
+def touch_tasks_with_tag(session: Session, tag_id: int) -> None:
+    """Bump updated_at, version and sync_xid of every task carrying tag_id (its name/color changed)."""
+    session.execute(
+        update(Task)
+        .where(Task.id.in_(select(TaskTag.task_id).where(TaskTag.tag_id == tag_id)))
+        .values(updated_at=datetime.utcnow(), version=Task.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def current_sync_point(session: Session) -> SyncPoint:
+    """xmin of the current database snapshot, and the current time."""
+    xmin = session.execute(text("SELECT txid_snapshot_xmin(txid_current_snapshot())")).scalar_one()
+    return SyncPoint(xmin, datetime.utcnow())
+
+
+def get_changes(
+    session: Session,
+    user_id: UUID,
+    since: Optional[SyncPoint]
+) -> Tuple[List[Task], List[int], SyncPoint]:
+    """
+    Tasks changed and task ids deleted since a sync point.
+
+    since=None is an initial sync: every task, no deletions.
+
+    Returns:
+        (changed tasks, deleted task ids, sync point for the next token)
+
+    Raises:
+        SyncResyncRequired: since predates tombstone retention, or more than
+            SYNC_MAX_CHANGES changes are pending
+    """
+    if since is not None:
+        cutoff = datetime.utcnow() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        if since.at < cutoff:
+            raise SyncResyncRequired("Sync token expired")
+
+    # Taken before reading, so the rows read include everything below xmin
+    started = current_sync_point(session)
+
+    if since is None:
+        tasks = session.exec(
+            select(Task).where(Task.user_id == user_id).order_by(Task.id)
+        ).all()
+        return list(tasks), [], started
+
+    max_changes = settings.SYNC_MAX_CHANGES
+
+    # Served by ix_tasks_user_sync_xid
+    tasks = session.exec(
+        select(Task)
+        .where(Task.user_id == user_id, Task.sync_xid >= since.xmin)
+        .order_by(Task.sync_xid, Task.id)
+        .limit(max_changes + 1)
+    ).all()
+
+    # Served by ix_task_tombstones_user_sync_xid
+    deleted_ids = session.exec(
+        select(TaskTombstone.task_id)
+        .where(TaskTombstone.user_id == user_id, TaskTombstone.sync_xid >= since.xmin)
+        .order_by(TaskTombstone.sync_xid)
+        .limit(max_changes + 1)
+    ).all()
+
+    if len(tasks) + len(deleted_ids) > max_changes:
+        raise SyncResyncRequired("Too many changes")
+
+    # A task archived and then unarchived since the token exists again
+    changed_ids = {task.id for task in tasks}
+    deleted_ids = [task_id for task_id in dict.fromkeys(deleted_ids) if task_id not in changed_ids]
+
+    # Never move a client's token backwards
+    if started.xmin < since.xmin:
+        started = SyncPoint(since.xmin, started.at)
+    return list(tasks), deleted_ids, started
+
+
+def prune_tombstones(session: Session) -> int:
+    """Delete tombstones older than the retention window; returns the count."""
+    cutoff = datetime.utcnow() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    result = session.execute(
+        delete(TaskTombstone).where(TaskTombstone.deleted_at < cutoff)
+    )
+    session.commit()
+    return result.rowcount or 0
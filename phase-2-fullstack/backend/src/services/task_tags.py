@@ -0,0 +1,64 @@
+"""
+Tags embedded in task responses.
+[Task]: T-B-001, T-B-009 (Task Tags), T-B-014 (Agenda View)
+[From]: specs/005-phase-v-cloud/phase5-cloud.plan.md §4.1
+
+Shared by the task and agenda routers, which both return tasks with
+their tags.
+"""
+
+from typing import Dict, List, Optional
+from sqlmodel import Session, select
+from src.models.task import Task
+from src.models.tag import Tag, TaskTag
+from src.schemas.task import TagResponse, TaskResponse
+
+
+def load_task_with_tags(task_id: int, session: Session) -> Optional[TaskResponse]:
+    """
+    Load task with associated tags.
+    
+    [Task]: T-B-001, T-B-009
+    [From]: specs/005-phase-v-cloud/phase5-cloud.plan.md §4.1
+    """
+    task = session.exec(
+        select(Task).where(Task.id == task_id)
+    ).first()
+    
+    if not task:
+        return None
+    
+    # Load tags
+    task_tags = session.exec(
+        select(TaskTag).where(TaskTag.task_id == task_id)
+    ).all()
+    
+    tags = []
+    for tt in task_tags:
+        tag = session.exec(
+            select(Tag).where(Tag.id == tt.tag_id)
+        ).first()
+        if tag:
+            tags.append(TagResponse.model_validate(tag))
+    
+    # Build response
+    task_dict = task.model_dump()
+    task_dict['tags'] = tags
+    
+    return TaskResponse.model_validate(task_dict)
+
+
+def load_tags(session: Session, task_ids: List[int]) -> Dict[int, List[TagResponse]]:
+    """Tags for many tasks in one query."""
+    tags_by_task: Dict[int, List[TagResponse]] = {task_id: [] for task_id in task_ids}
+    if not task_ids:
+        return tags_by_task
+    
+    rows = session.exec(
+        select(TaskTag.task_id, Tag)
+        .join(Tag, Tag.id == TaskTag.tag_id)
+        .where(TaskTag.task_id.in_(task_ids))
+    ).all()
+    for task_id, tag in rows:
+        tags_by_task[task_id].append(TagResponse.model_validate(tag))
+    return tags_by_task
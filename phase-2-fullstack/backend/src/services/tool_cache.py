@@ -0,0 +1,157 @@
+"""
+Per-user cache of read-only MCP tool results.
+[Task]: T-016 (Tool Result Cache)
+[From]: specs/003-phase-iii-chatbot/plan.md §2.1.2-2.1.3
+
+"Show my tasks" is the most common chat turn. Its list_tasks result only
+changes when one of the user's tasks or tags changes, so results are
+cached per user under the user's data_version (services/data_version).
+Every write path bumps it in the write's transaction (REST task and tag
+routes, archive/unarchive, MCP tools, the recurring-task sweep), so a
+lookup with the current version never sees a result from before a
+committed write, on this pod or any other. The version is read with one
+primary-key lookup before the tool runs.
+
+Writes in this process also drop the user's results right away:
+- a task event is published for the user (REST routes, see event_publisher)
+- an MCP mutation commits for the user (see mcp/registry)
+- the archive and recurring-task jobs touch the user
+
+Invalidation bumps a per-user generation; a result computed while a
+write was in flight is never stored.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import UUID
+from src.config import settings
+from src.utils import metrics
+
+
+class ToolResultCache:
+    """LRU over users; each user holds results keyed by (tool, arguments) for one data_version."""
+
+    def __init__(self, ttl_seconds: float, max_users: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        self._lock = threading.Lock()
+        # user -> (data_version, {key: (expires at, result)})
+        self._users: "OrderedDict[str, Tuple[Optional[int], Dict[str, Tuple[float, Dict[str, Any]]]]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    @staticmethod
+    def _key(tool_name: str, tool_args: Dict[str, Any]) -> str:
+        return f"{tool_name}:{json.dumps(tool_args, sort_keys=True, default=str)}"
+
+    def generation(self, user_id: UUID) -> int:
+        with self._lock:
+            return self._generations.get(str(user_id), 0)
+
+    def get(
+        self,
+        user_id: UUID,
+        tool_name: str,
+        tool_args: Dict[str, Any],
+        data_version: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        user = str(user_id)
+        with self._lock:
+            cached = self._users.get(user)
+            if cached is None or cached[0] != data_version:
+                return None
+            entry = cached[1].get(self._key(tool_name, tool_args))
+            if entry is None or entry[0] < time.monotonic():
+                return None
+            self._users.move_to_end(user)
+            return entry[1]
+
+    def put(
+        self,
+        user_id: UUID,
+        tool_name: str,
+        tool_args: Dict[str, Any],
+        result: Dict[str, Any],
+        generation: int,
+        data_version: Optional[int] = None
+    ) -> None:
+        """Store a result unless the user was invalidated since `generation`."""
+        user = str(user_id)
+        with self._lock:
+            if self._generations.get(user, 0) != generation:
+                return
+            cached = self._users.get(user)
+            if cached is None or cached[0] != data_version:
+                # Results for an older version can never be served again
+                cached = (data_version, {})
+                self._users[user] = cached
+            cached[1][self._key(tool_name, tool_args)] = (time.monotonic() + self.ttl_seconds, result)
+            self._users.move_to_end(user)
+            while len(self._users) > self.max_users:
+                evicted, _ = self._users.popitem(last=False)
+                self._generations.pop(evicted, None)
+
+    def invalidate(self, user_id: UUID) -> None:
+        user = str(user_id)
+        with self._lock:
+            self._users.pop(user, None)
+            self._generations[user] = self._generations.get(user, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._users.clear()
+            self._generations.clear()
+
+
+_cache = ToolResultCache(
+    ttl_seconds=settings.TOOL_CACHE_TTL_SECONDS,
+    max_users=settings.TOOL_CACHE_MAX_USERS
+)
+
+
+def cache_enabled() -> bool:
+    """Whether read-only tool results are cached (TOOL_CACHE_ENABLED)."""
+    return settings.TOOL_CACHE_ENABLED.lower() == "true"
+
+
+def cached_call(
+    user_id: UUID,
+    tool_name: str,
+    tool_args: Dict[str, Any],
+    compute: Callable[[], Dict[str, Any]],
+    data_version: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Return the cached result for a read-only tool call, computing it on a miss.
+
+    data_version must be read before compute() runs, so a write committing
+    in between leaves the result stored under the version it replaced.
+    """
+    if not cache_enabled():
+        return compute()
+
+    result = _cache.get(user_id, tool_name, tool_args, data_version)
+    if result is not None:
+        metrics.inc("tool_cache_requests_total", tool=tool_name, hit="true")
+        return result
+
+    metrics.inc("tool_cache_requests_total", tool=tool_name, hit="false")
+    generation = _cache.generation(user_id)
+    result = compute()
+    if "error" not in result:
+        _cache.put(user_id, tool_name, tool_args, result, generation, data_version)
+    return result
+
+
+def invalidate_user(user_id: Optional[Any]) -> None:
+    """Drop a user's cached tool results after any change to their tasks."""
+    if not user_id:
+        return
+    _cache.invalidate(user_id)
+
+
+def clear() -> None:
+    """Drop all cached results (tests)."""
+    _cache.clear()
@@ -1,22 +1,50 @@
 """
 Dependency injection for FastAPI.
-[Task]: T-008 (Dependencies)
+[Task]: T-008 (Dependencies), T-023 (Verified Token Cache), T-C-013 (Job Token)
 [From]: spec.md §8, plan.md §6
 """
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel import Session, select
+from typing import Optional
 from uuid import UUID
-from src.database import get_session
+from src.database import get_session, engine
 from src.models.user import User
-from src.utils.security import verify_token
+from src.utils.security import verify_token, bearer_token_matches
+from src.utils.token_cache import get_token_cache, token_cache_enabled
 from src.config import settings
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
 
+def _decode_token(token: str) -> dict:
+    """Verify JWT token and return its normalized payload (401 if invalid)."""
+    payload = verify_token(token, settings.BETTER_AUTH_SECRET)
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    
+    if payload.get("user_id") is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload"
+        )
+    
+    return payload
+
+
+def _user_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="User not found"
+    )
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     session: Session = Depends(get_session)
@@ -24,34 +52,85 @@ def get_current_user(
     """
     Extract and verify JWT token, return authenticated user.
     
+    Use only when the route needs the user row; routes that just compare
+    or filter by the id should depend on get_current_user_id.
+    
     Raises:
         HTTPException: 401 if token invalid or user not found
     """
     token = credentials.credentials
+    cache = get_token_cache() if token_cache_enabled() else None
     
-    # Verify token
-    payload = verify_token(token, settings.BETTER_AUTH_SECRET)
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
-    
-    # Extract user_id from token
-    user_id = payload.get("user_id")
+    # A cached token was verified before; only the row is loaded
+    user_id = cache.get(token) if cache is not None else None
+    payload = None
     if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload"
-        )
+        payload = _decode_token(token)
+        user_id = UUID(payload["user_id"])
     
     # Get user from database
-    user = session.get(User, UUID(user_id))
+    user = session.get(User, user_id)
+    if user is None:
+        if cache is not None:
+            cache.forget(token)
+        raise _user_not_found()
+    
+    if cache is not None and payload is not None:
+        cache.put(token, user.id, payload.get("exp"))
+    return user
+
+
+def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> UUID:
+    """
+    Verify JWT token and return the authenticated user's id.
+    
+    Repeat requests with a token that was already verified are answered
+    from the verified-token cache, without decoding it or touching the
+    database. Otherwise the user lookup uses its own short-lived session,
+    so no connection is held for the rest of the request (safe for
+    long-running streaming endpoints).
+    
+    Raises:
+        HTTPException: 401 if token invalid or user not found
+    """
+    token = credentials.credentials
+    cache = get_token_cache() if token_cache_enabled() else None
+    if cache is not None:
+        user_id = cache.get(token)
+        if user_id is not None:
+            return user_id
+    
+    payload = _decode_token(token)
+    with Session(engine) as session:
+        user = session.get(User, UUID(payload["user_id"]))
     if user is None:
+        raise _user_not_found()
+    
+    if cache is not None:
+        cache.put(token, user.id, payload.get("exp"))
+    return user.id
+
+
+def require_job_token(authorization: Optional[str] = Header(default=None)) -> None:
+    """
+    Guard for state-changing maintenance jobs (cron / scheduler callers).
+    
+    The job is disabled (404) unless JOBS_TOKEN is set; callers send it
+    as a bearer token.
+    
+    Raises:
+        HTTPException: 404 if no job token is configured, 401 if it does not match
+    """
+    if not settings.JOBS_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not found"
+        )
+    if not bearer_token_matches(authorization, settings.JOBS_TOKEN):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
+            detail="Invalid job token",
+            headers={"WWW-Authenticate": "Bearer"}
         )
-    
-    return user
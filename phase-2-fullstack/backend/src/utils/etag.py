@@ -0,0 +1,100 @@
+"""
+ETag helpers for conditional GET and conditional writes.
+[Task]: T-025 (Conditional GET), T-029 (Optimistic Concurrency)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+
+ETags are built from the user's data version (services/data_version.py),
+so a match can be checked before any list query runs. Responses carry
+Cache-Control: private, no-cache: browsers keep the body but revalidate
+every time, which turns a repeat poll into a 304.
+
+Writes to a single task take If-Match with the task's ETag
+(task-<id>-<version>); require_if_match() answers 412 when the client's
+copy is out of date.
+"""
+
+from typing import Dict, List, Optional
+from fastapi import HTTPException, Request, Response, status
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag from version parts, e.g. make_etag("tasks", 17) -> "tasks-17"."""
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True if an If-None-Match header value matches etag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (value.strip() for value in if_none_match.split(","))
+    return any(
+        (candidate[2:] if candidate.startswith("W/") else candidate) == etag
+        for candidate in candidates
+    )
+
+
+def validator_headers(etag: str) -> Dict[str, str]:
+    """Headers every conditional response carries (200 and 304)."""
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified_response(request: Request, etag: str) -> Optional[Response]:
+    """
+    A 304 if the client already has etag, else None.
+
+    Routes return the 304 as-is, or carry on and build the full body
+    (sending validator_headers(etag) with it).
+    """
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=validator_headers(etag)
+        )
+    return None
+
+
+def if_match_satisfied(if_match: Optional[str], etag: str) -> bool:
+    """True if an If-Match header value allows a write to etag (strong comparison)."""
+    if not if_match or if_match.strip() == "*":
+        return True
+    # Weak validators never match for If-Match
+    return any(candidate.strip() == etag for candidate in if_match.split(","))
+
+
+def if_match_versions(request: Request, *parts) -> Optional[List[int]]:
+    """
+    Versions an If-Match header names for ETags make_etag(*parts, version).
+
+    None if any version is fine (no header, or "*"). An empty list means
+    the header only names other resources, so no version can match.
+    """
+    if_match = request.headers.get("if-match")
+    if not if_match or if_match.strip() == "*":
+        return None
+    prefix = make_etag(*parts, "")[:-1]
+    versions = []
+    for candidate in if_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith(prefix) and candidate.endswith('"'):
+            value = candidate[len(prefix):-1]
+            if value.isdigit():
+                versions.append(int(value))
+    return versions
+
+
+def require_if_match(request: Request, etag: str) -> None:
+    """Raise 412 if the request's If-Match names a different version than etag."""
+    if not if_match_satisfied(request.headers.get("if-match"), etag):
+        raise precondition_failed()
+
+
+def precondition_failed() -> HTTPException:
+    """412 for a write based on an outdated copy."""
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="Resource was modified by another request; refetch and retry"
+    )
@@ -0,0 +1,98 @@
+"""
+In-process application metrics.
+[Task]: T-013 (Agent Instrumentation)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §6.2.5
+
+A small thread-safe registry of counters, gauges and timing summaries,
+rendered in the Prometheus text format at GET /metrics. Values are per
+process. A timing summary `name` is exported as the summary family `name`
+(_count, _sum) plus a gauge family `name_max` with the slowest duration.
+"""
+
+import threading
+from typing import Dict, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+_lock = threading.Lock()
+_counters: Dict[str, Dict[LabelKey, float]] = {}
+_gauges: Dict[str, Dict[LabelKey, float]] = {}
+_timings: Dict[str, Dict[LabelKey, list]] = {}  # [count, sum, max]
+
+
+def _key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def inc(name: str, amount: float = 1, **labels) -> None:
+    """Increment a counter."""
+    key = _key(labels)
+    with _lock:
+        series = _counters.setdefault(name, {})
+        series[key] = series.get(key, 0) + amount
+
+
+def set_gauge(name: str, value: float, **labels) -> None:
+    """Set a gauge to its current value."""
+    key = _key(labels)
+    with _lock:
+        _gauges.setdefault(name, {})[key] = value
+
+
+def observe(name: str, seconds: float, **labels) -> None:
+    """Record one duration in a timing summary."""
+    key = _key(labels)
+    with _lock:
+        stats = _timings.setdefault(name, {}).setdefault(key, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2], seconds)
+
+
+def snapshot() -> Dict[str, Dict[LabelKey, object]]:
+    """Copy of all series (counters/gauges as values, timings as (count, sum, max))."""
+    with _lock:
+        data = {name: dict(series) for name, series in _counters.items()}
+        data.update({name: dict(series) for name, series in _gauges.items()})
+        for name, series in _timings.items():
+            data[name] = {key: tuple(stats) for key, stats in series.items()}
+    return data
+
+
+def reset() -> None:
+    """Drop all recorded values."""
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _timings.clear()
+
+
+def _format_labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in key) + "}"
+
+
+def render_prometheus() -> str:
+    """Render all metrics in the Prometheus text exposition format."""
+    lines = []
+    with _lock:
+        for name, series in sorted(_counters.items()):
+            lines.append(f"# TYPE {name} counter")
+            for key, value in series.items():
+                lines.append(f"{name}{_format_labels(key)} {value}")
+        for name, series in sorted(_gauges.items()):
+            lines.append(f"# TYPE {name} gauge")
+            for key, value in series.items():
+                lines.append(f"{name}{_format_labels(key)} {value}")
+        for name, series in sorted(_timings.items()):
+            lines.append(f"# TYPE {name} summary")
+            for key, (count, total, _) in series.items():
+                labels = _format_labels(key)
+                lines.append(f"{name}_count{labels} {count}")
+                lines.append(f"{name}_sum{labels} {total:.6f}")
+            # A summary has no _max sample; the peak is its own gauge family
+            lines.append(f"# TYPE {name}_max gauge")
+            for key, (_, _, peak) in series.items():
+                lines.append(f"{name}_max{_format_labels(key)} {peak:.6f}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,106 @@
+"""
+Bounded process pool for password hashing.
+[Task]: T-021 (Password Hashing Pool)
+[From]: spec.md §8, specs/005-phase-v-cloud/phase5-cloud.specify.md §6.2.5
+
+bcrypt at cost 12 takes ~250 ms of CPU per call. Run inline, a burst of
+logins occupies the request threadpool and the pod's CPU time, and task
+CRUD on the same pod stalls behind it. Hashing and verification run in
+PASSWORD_HASH_WORKERS worker processes instead:
+- CPU use for hashing is capped at the worker count
+- at most PASSWORD_HASH_MAX_PENDING calls may be queued or running;
+  beyond that the caller gets PasswordPoolBusy (the API answers 503)
+- password_hash_pending (gauge) shows the current queue depth
+
+Workers are spawned (not forked) so they do not inherit the server's
+threads or open connections, and only import bcrypt.
+PASSWORD_HASH_WORKERS=0 hashes inline (tests, single-user setups).
+"""
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+from src.config import settings
+from src.utils import metrics
+
+
+class PasswordPoolBusy(Exception):
+    """Too many password hashing calls are already queued."""
+
+
+class PasswordHashPool:
+    """Process pool that rejects work past a fixed number of pending calls."""
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def run(self, op: str, fn: Callable[..., Any], *args) -> Any:
+        """Run fn(*args) in a worker process and wait for the result."""
+        if self.workers <= 0:
+            started = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                metrics.observe("password_hash_seconds", time.perf_counter() - started, op=op)
+
+        with self._lock:
+            if self._pending >= self.max_pending:
+                metrics.inc("password_hash_rejected_total", op=op)
+                raise PasswordPoolBusy()
+            self._pending += 1
+            metrics.set_gauge("password_hash_pending", self._pending)
+            executor = self._get_executor()
+
+        started = time.perf_counter()
+        try:
+            return executor.submit(fn, *args).result()
+        finally:
+            metrics.observe("password_hash_seconds", time.perf_counter() - started, op=op)
+            with self._lock:
+                self._pending -= 1
+                metrics.set_gauge("password_hash_pending", self._pending)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+_pool: Optional[PasswordHashPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_password_pool() -> PasswordHashPool:
+    """Get singleton pool (worker processes start on first use)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PasswordHashPool(
+                workers=settings.PASSWORD_HASH_WORKERS,
+                max_pending=settings.PASSWORD_HASH_MAX_PENDING
+            )
+        return _pool
+
+
+def shutdown_password_pool() -> None:
+    """Stop the worker processes (application shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
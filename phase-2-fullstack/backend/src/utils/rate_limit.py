@@ -0,0 +1,283 @@
+"""
+Token-bucket rate limiting for expensive endpoints.
+[Task]: T-020 (Rate Limiting)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §6.2.5
+
+Chat (model calls) and login (bcrypt) are limited per caller with a token
+bucket: `burst` requests at once, refilled at `per_minute`. Requests over
+the limit get 429 with Retry-After before any route code runs.
+
+- Chat is keyed by the subject of a verified bearer token (JWT signature
+  and expiry, no database hit), never by the path user_id, so a caller
+  cannot spend another user's budget by putting their id in the URL.
+  Requests with no token or a bad one share a per-client-IP bucket; the
+  route rejects them with 401 afterwards.
+- Login/register are keyed by client IP.
+
+Backends:
+- memory (default): per process; with N replicas the effective limit is N x.
+- redis: shared across replicas (RATE_LIMIT_BACKEND=redis,
+  RATE_LIMIT_REDIS_URL); needs the optional `redis` package.
+Any object with a take() method like InMemoryBucketBackend's can be
+plugged in with set_backend().
+
+Every limited response carries X-RateLimit-Limit / -Remaining / -Reset.
+"""
+
+import json
+import math
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Pattern, Tuple
+from starlette.concurrency import run_in_threadpool
+from src.config import settings
+from src.utils import metrics
+from src.utils.security import verify_token
+from src.utils.token_cache import get_token_cache, token_cache_enabled
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """Bucket for requests matching method + path."""
+    name: str
+    method: str
+    path: Pattern[str]
+    burst: int
+    per_minute: float
+    key: str  # "user" (verified token subject, else client IP) or "ip"
+
+
+# (allowed, remaining tokens, seconds until one token is available)
+TakeResult = Tuple[bool, int, float]
+
+
+class InMemoryBucketBackend:
+    """Process-local buckets: key -> (tokens, last refill time)."""
+
+    # Past this many keys, buckets idle for IDLE_SECONDS (full again) are dropped
+    MAX_KEYS = 100_000
+    IDLE_SECONDS = 3600
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def take(self, key: str, burst: int, refill_per_second: float) -> TakeResult:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (float(burst), now))
+            tokens = min(float(burst), tokens + (now - updated) * refill_per_second)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.MAX_KEYS:
+                self._prune(now)
+        retry_after = 0.0 if tokens >= 1 else (1 - tokens) / refill_per_second
+        return allowed, int(tokens), retry_after
+
+    def _prune(self, now: float) -> None:
+        idle = [key for key, (_, updated) in self._buckets.items() if now - updated > self.IDLE_SECONDS]
+        for key in idle:
+            del self._buckets[key]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+# KEYS[1] = bucket key; ARGV = burst, refill/sec, now (seconds)
+_REDIS_TAKE = """
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local burst = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local tokens = tonumber(bucket[1]) or burst
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisBucketBackend:
+    """Buckets shared by all replicas, updated atomically by a Lua script."""
+
+    def __init__(self, url: str):
+        import redis  # optional dependency
+        self._client = redis.Redis.from_url(url)
+        self._take = self._client.register_script(_REDIS_TAKE)
+
+    def take(self, key: str, burst: int, refill_per_second: float) -> TakeResult:
+        allowed, tokens = self._take(keys=[f"ratelimit:{key}"], args=[burst, refill_per_second, time.time()])
+        tokens = float(tokens)
+        retry_after = 0.0 if tokens >= 1 else (1 - tokens) / refill_per_second
+        return bool(allowed), int(tokens), retry_after
+
+
+def _create_backend():
+    if settings.RATE_LIMIT_BACKEND.lower() == "redis":
+        try:
+            return RedisBucketBackend(settings.RATE_LIMIT_REDIS_URL)
+        except ImportError:
+            print("⚠️  redis not installed. Install with: pip install redis (using in-memory rate limits)")
+        except Exception as e:
+            print(f"⚠️  Redis rate limit backend unavailable: {e} (using in-memory rate limits)")
+    return InMemoryBucketBackend()
+
+
+_backend = None
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        _backend = _create_backend()
+    return _backend
+
+
+def set_backend(backend) -> None:
+    """Plug in a bucket backend (shared store, tests)."""
+    global _backend
+    _backend = backend
+
+
+def rate_limit_enabled() -> bool:
+    return settings.RATE_LIMIT_ENABLED.lower() == "true"
+
+
+def default_rules() -> List[RateLimitRule]:
+    chat_path = re.compile(r"^/api/(?P<user_id>[^/]+)/chat(?:/stream)?$")
+    auth_path = re.compile(r"^/api/auth/(?:login|register)$")
+    return [
+        RateLimitRule(
+            "chat", "POST", chat_path,
+            burst=settings.RATE_LIMIT_CHAT_BURST,
+            per_minute=settings.RATE_LIMIT_CHAT_PER_MINUTE,
+            key="user"
+        ),
+        RateLimitRule(
+            "auth", "POST", auth_path,
+            burst=settings.RATE_LIMIT_LOGIN_BURST,
+            per_minute=settings.RATE_LIMIT_LOGIN_PER_MINUTE,
+            key="ip"
+        ),
+    ]
+
+
+def _client_ip(scope) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED.lower() == "true":
+        for name, value in scope.get("headers", []):
+            if name == b"x-forwarded-for":
+                return value.decode("latin-1").split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _token_subject(scope) -> Optional[str]:
+    """User id of a valid bearer token, or None."""
+    for name, value in scope.get("headers", []):
+        if name != b"authorization":
+            continue
+        scheme, _, token = value.decode("latin-1").partition(" ")
+        token = token.strip()
+        if scheme.lower() != "bearer" or not token:
+            return None
+        if token_cache_enabled():
+            cached = get_token_cache().get(token)
+            if cached is not None:
+                return str(cached)
+        payload = verify_token(token, settings.BETTER_AUTH_SECRET)
+        return str(payload["user_id"]) if payload else None
+    return None
+
+
+def _subject(rule: RateLimitRule, scope) -> str:
+    if rule.key == "user":
+        user_id = _token_subject(scope)
+        if user_id is not None:
+            return f"user:{user_id}"
+    return f"ip:{_client_ip(scope)}"
+
+
+class RateLimitMiddleware:
+    """ASGI middleware applying the first matching rule to each request."""
+
+    def __init__(self, app, rules: Optional[List[RateLimitRule]] = None):
+        self.app = app
+        self.rules = rules if rules is not None else default_rules()
+
+    def _match(self, scope) -> Optional[Tuple[RateLimitRule, str]]:
+        for rule in self.rules:
+            if scope["method"] != rule.method:
+                continue
+            match = rule.path.match(scope["path"])
+            if match is None:
+                continue
+            return rule, f"{rule.name}:{_subject(rule, scope)}"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not rate_limit_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        matched = self._match(scope)
+        if matched is None:
+            await self.app(scope, receive, send)
+            return
+
+        rule, key = matched
+        refill_per_second = rule.per_minute / 60.0
+        backend = get_backend()
+        try:
+            if isinstance(backend, InMemoryBucketBackend):
+                allowed, remaining, retry_after = backend.take(key, rule.burst, refill_per_second)
+            else:
+                # Shared backends do network I/O; keep it off the event loop
+                allowed, remaining, retry_after = await run_in_threadpool(
+                    backend.take, key, rule.burst, refill_per_second
+                )
+        except Exception as e:
+            # Fail open: a limiter outage must not take the API down
+            print(f"⚠️  Rate limit backend error: {e}")
+            metrics.inc("rate_limit_backend_errors_total")
+            await self.app(scope, receive, send)
+            return
+        metrics.inc("rate_limit_requests_total", rule=rule.name, allowed=str(allowed).lower())
+
+        reset_seconds = math.ceil((rule.burst - remaining) / refill_per_second) if refill_per_second else 0
+        headers = [
+            (b"x-ratelimit-limit", str(rule.burst).encode()),
+            (b"x-ratelimit-remaining", str(remaining).encode()),
+            (b"x-ratelimit-reset", str(reset_seconds).encode()),
+        ]
+
+        if not allowed:
+            body = json.dumps({"detail": "Too many requests. Please slow down."}).encode()
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": headers + [
+                    (b"retry-after", str(max(math.ceil(retry_after), 1)).encode()),
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ]
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": list(message.get("headers", [])) + headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
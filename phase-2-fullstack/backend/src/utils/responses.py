@@ -0,0 +1,82 @@
+"""
+Fast JSON responses and response compression.
+[Task]: T-026 (Fast JSON Responses)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+
+A route that returns a Pydantic model goes through FastAPI's generic path:
+re-validate against response_model, jsonable_encoder, then json.dumps.
+List routes instead build their response model once and return
+FastJSONResponse(model), which is serialized in one step with orjson.
+response_model stays on the decorator for the OpenAPI schema.
+
+CompressionMiddleware compresses bodies of at least
+RESPONSE_COMPRESSION_MIN_SIZE bytes: brotli when the client accepts it
+and the optional `brotli-asgi` package is installed, gzip otherwise.
+Server-sent event streams are passed through untouched, since a
+compressor would buffer events.
+"""
+
+import orjson
+from typing import Any
+from pydantic import BaseModel
+from fastapi.responses import JSONResponse
+from starlette.middleware.gzip import GZipMiddleware
+from src.config import settings
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4  # brotli's default (11) is meant for static assets
+
+# Paths whose responses are never compressed (SSE)
+UNCOMPRESSED_SUFFIXES = ("/chat/stream",)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (Pydantic models are dumped first)."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            content = content.model_dump()
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _orjson_default(value: Any) -> Any:
+    """Models nested in plain dicts (e.g. sparse rows with tags)."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def compression_enabled() -> bool:
+    return settings.RESPONSE_COMPRESSION_ENABLED.lower() == "true"
+
+
+def _create_compressor(app):
+    minimum_size = settings.RESPONSE_COMPRESSION_MIN_SIZE
+    try:
+        from brotli_asgi import BrotliMiddleware  # optional dependency
+        return BrotliMiddleware(
+            app,
+            quality=BROTLI_QUALITY,
+            minimum_size=minimum_size,
+            gzip_fallback=True
+        )
+    except ImportError:
+        return GZipMiddleware(app, minimum_size=minimum_size, compresslevel=GZIP_LEVEL)
+
+
+class CompressionMiddleware:
+    """Compress large responses (brotli or gzip), except SSE streams."""
+
+    def __init__(self, app):
+        self.app = app
+        self.compressor = _create_compressor(app)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not compression_enabled()
+            or scope["path"].endswith(UNCOMPRESSED_SUFFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+        await self.compressor(scope, receive, send)
@@ -1,30 +1,119 @@
 """
 JWT and password hashing utilities.
-[Task]: T-007 (Security Utilities)
+[Task]: T-007 (Security Utilities), T-021 (Password Hashing Pool), T-022 (Password Hash Policy)
 [From]: spec.md §8, plan.md §6
+
+Password hashes are self-describing (modular crypt format), so each stored
+hash records its own algorithm and cost:
+- bcrypt:  $2b$<rounds>$...
+- argon2:  $argon2id$v=19$m=<KiB>,t=<passes>,p=<lanes>$...
+
+New hashes follow the current policy (PASSWORD_HASH_SCHEME, BCRYPT_ROUNDS,
+ARGON2_*). Verification accepts either algorithm, and needs_rehash() tells
+login when a stored hash is below policy so it can be upgraded in place.
+argon2 needs the optional `argon2-cffi` package; without it bcrypt is used.
 """
 
+import hmac
+import os
+import re
 import bcrypt
 import jwt
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 from uuid import UUID
+from src.config import settings
+from src.utils.password_pool import get_password_pool
+
+_BCRYPT_HASH = re.compile(r"^\$2[abxy]?\$(?P<rounds>\d{2})\$")
+_ARGON2_HASH = re.compile(r"^\$argon2id\$v=(?P<v>\d+)\$m=(?P<m>\d+),t=(?P<t>\d+),p=(?P<p>\d+)\$")
+ARGON2_SALT_BYTES = 16
+ARGON2_HASH_BYTES = 32
+
+_argon2_warned = False
+
+
+def _argon2_low_level():
+    """argon2.low_level, or None (with a one-time warning) if not installed."""
+    global _argon2_warned
+    try:
+        import argon2.low_level  # optional dependency
+        return argon2.low_level
+    except ImportError:
+        if not _argon2_warned:
+            print("⚠️  argon2-cffi not installed. Install with: pip install argon2-cffi (using bcrypt)")
+            _argon2_warned = True
+        return None
+
+
+def _policy_scheme() -> str:
+    if settings.PASSWORD_HASH_SCHEME.lower() == "argon2" and _argon2_low_level() is not None:
+        return "argon2"
+    return "bcrypt"
 
 
 def hash_password(password: str) -> str:
-    """Hash password using bcrypt."""
-    salt = bcrypt.gensalt(rounds=12)
-    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+    """Hash password with the current policy (in the password hashing pool)."""
+    # The hashing libraries' own functions are sent to the workers, so they
+    # only import bcrypt / argon2
+    if _policy_scheme() == "argon2":
+        low_level = _argon2_low_level()
+        hashed = get_password_pool().run(
+            "hash",
+            low_level.hash_secret,
+            password.encode('utf-8'),
+            os.urandom(ARGON2_SALT_BYTES),
+            settings.ARGON2_TIME_COST,
+            settings.ARGON2_MEMORY_COST,
+            settings.ARGON2_PARALLELISM,
+            ARGON2_HASH_BYTES,
+            low_level.Type.ID
+        )
+    else:
+        salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+        hashed = get_password_pool().run("hash", bcrypt.hashpw, password.encode('utf-8'), salt)
+    return hashed.decode('utf-8')
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify password against hash."""
-    return bcrypt.checkpw(
+    """Verify password against a bcrypt or argon2 hash (in the password hashing pool)."""
+    if hashed_password.startswith("$argon2"):
+        low_level = _argon2_low_level()
+        if low_level is None:
+            return False
+        from argon2.exceptions import VerificationError
+        try:
+            return get_password_pool().run(
+                "verify",
+                low_level.verify_secret,
+                hashed_password.encode('utf-8'),
+                plain_password.encode('utf-8'),
+                low_level.Type.ID
+            )
+        except (VerificationError, ValueError):
+            return False  # Mismatch or malformed hash
+
+    return get_password_pool().run(
+        "verify",
+        bcrypt.checkpw,
         plain_password.encode('utf-8'),
         hashed_password.encode('utf-8')
     )
 
 
+def needs_rehash(hashed_password: str) -> bool:
+    """True if the hash uses another algorithm or other parameters than the policy."""
+    if _policy_scheme() == "argon2":
+        match = _ARGON2_HASH.match(hashed_password)
+        return match is None or (
+            int(match["m"]) != settings.ARGON2_MEMORY_COST
+            or int(match["t"]) != settings.ARGON2_TIME_COST
+            or int(match["p"]) != settings.ARGON2_PARALLELISM
+        )
+    match = _BCRYPT_HASH.match(hashed_password)
+    return match is None or int(match["rounds"]) != settings.BCRYPT_ROUNDS
+
+
 def create_access_token(
     user_id: UUID,
     email: str,
@@ -69,3 +158,11 @@ def verify_token(token: str, secret_key: str) -> Optional[Dict]:
         return None  # Invalid token
     except Exception:
         return None  # Any other error
+
+
+def bearer_token_matches(authorization: Optional[str], expected: str) -> bool:
+    """Whether an Authorization header carries `Bearer <expected>` (constant-time compare)."""
+    scheme, _, token = (authorization or "").partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(
+        token.strip().encode("utf-8"), expected.encode("utf-8")
+    )
@@ -0,0 +1,62 @@
+"""
+Coalescing of duplicate in-flight calls.
+[Task]: T-020 (Rate Limiting)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §6.2.5
+
+When several threads ask for the same key at once, only the first runs
+the function; the others wait for it and receive the same result (or
+exception). Used to collapse client retries of an identical POST /chat
+turn into one model call and one stored turn. POST /chat/stream is not
+coalesced: each stream is tied to its own connection.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+from src.utils import metrics
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """Per-key deduplication of concurrent calls (thread-based)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run fn once for all concurrent callers with the same key.
+
+        Returns:
+            (result, shared) where shared is True for callers that waited
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            metrics.inc("singleflight_coalesced_total", flight=self.name)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -0,0 +1,87 @@
+"""
+Cache of already-verified access tokens.
+[Task]: T-023 (Verified Token Cache)
+[From]: spec.md §8, plan.md §6
+
+Every API request carries the same JWT for up to 7 days. Verifying it
+means an HS256 check, payload normalization, and a users lookup. Once a
+token has passed all three, get_current_user_id remembers token -> user id
+until the token's own `exp`, so repeat requests skip the decode and the
+database.
+
+- Bounded LRU (TOKEN_CACHE_MAX_ENTRIES); entries past `exp` are dropped on read
+- Only tokens whose user existed are stored; failures are never cached
+- Per process; there is no token revocation or account deletion in the
+  API, so a cached entry is exactly as valid as the token itself
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from uuid import UUID
+from src.config import settings
+from src.utils import metrics
+
+
+class VerifiedTokenCache:
+    """LRU of token -> (user id, exp as epoch seconds)."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[UUID, float]]" = OrderedDict()
+
+    def get(self, token: str) -> Optional[UUID]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                metrics.inc("token_cache_requests_total", result="miss")
+                return None
+            user_id, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[token]
+                metrics.inc("token_cache_requests_total", result="expired")
+                return None
+            self._entries.move_to_end(token)
+        metrics.inc("token_cache_requests_total", result="hit")
+        return user_id
+
+    def put(self, token: str, user_id: UUID, expires_at: Optional[float]) -> None:
+        """Remember a verified token (tokens without exp are not cached)."""
+        if expires_at is None or expires_at <= time.time():
+            return
+        with self._lock:
+            self._entries[token] = (user_id, float(expires_at))
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def forget(self, token: str) -> None:
+        with self._lock:
+            self._entries.pop(token, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_cache: Optional[VerifiedTokenCache] = None
+_cache_lock = threading.Lock()
+
+
+def token_cache_enabled() -> bool:
+    return settings.TOKEN_CACHE_ENABLED.lower() == "true"
+
+
+def get_token_cache() -> VerifiedTokenCache:
+    """Get singleton cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = VerifiedTokenCache(settings.TOKEN_CACHE_MAX_ENTRIES)
+        return _cache
@@ -0,0 +1,81 @@
+"""
+Shared test setup.
+[Task]: T-B-011 (Tag API Tests), T-028 (Delta Sync Tests), T-030 (Task Archive Tests)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.2
+
+Models use PostgreSQL JSONB columns and txid_current() defaults; the
+in-memory SQLite databases most tests run on store JSONB as plain JSON
+and get a txid_current() stand-in.
+
+Tests of PostgreSQL-only behaviour (ON CONFLICT, jsonb_agg, the planner)
+use the pg_engine / pg_session fixtures instead: point TEST_DATABASE_URL
+at a scratch database and each fixture works in its own throwaway
+schema. Without it those tests are skipped.
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+from itertools import count
+from uuid import uuid4
+import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlmodel import Session, SQLModel, create_engine, text
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "")
+
+# Increasing per call, like transaction ids across transactions
+_sqlite_txids = count(1)
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_sqlite_json(type_, compiler, **kw):
+    return "JSON"
+
+
+@event.listens_for(Engine, "connect")
+def _sqlite_txid_current(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.create_function("txid_current", 0, lambda: next(_sqlite_txids))
+
+
+@contextmanager
+def _throwaway_schema():
+    """Engine whose search_path is a new schema with every table; dropped on exit."""
+    if not TEST_DATABASE_URL.startswith("postgresql"):
+        pytest.skip("Requires PostgreSQL (set TEST_DATABASE_URL)")
+
+    schema = f"test_{uuid4().hex[:12]}"
+    admin_engine = create_engine(TEST_DATABASE_URL)
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        connect_args={"options": f"-csearch_path={schema}"}
+    )
+    try:
+        SQLModel.metadata.create_all(engine)
+        yield engine
+    finally:
+        engine.dispose()
+        with admin_engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        admin_engine.dispose()
+
+
+@pytest.fixture(name="pg_engine", scope="module")
+def pg_engine_fixture():
+    """PostgreSQL engine on a throwaway schema shared by a test module."""
+    with _throwaway_schema() as engine:
+        yield engine
+
+
+@pytest.fixture(name="pg_session")
+def pg_session_fixture():
+    """PostgreSQL session on a throwaway schema of its own."""
+    with _throwaway_schema() as engine:
+        with Session(engine) as session:
+            yield session
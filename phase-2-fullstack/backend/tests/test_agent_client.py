@@ -0,0 +1,187 @@
+"""
+Tests for the pooled OpenAI client against a local fake server.
+[Task]: T-013 (Agent Instrumentation Tests), T-014 (Agent Tool Loop Tests)
+[From]: specs/003-phase-iii-chatbot/plan.md §2.1.3
+"""
+
+import asyncio
+import json
+import threading
+import time
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import uuid4
+from src.agent import client, runner
+from src.config import settings
+from src.utils import metrics
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible /chat/completions endpoint (HTTP/1.1 keep-alive)."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(body)
+        last = body["messages"][-1]["content"]
+        message = {"role": "assistant", "content": f"echo: {last}"}
+        if self.server.replies:
+            message = self.server.replies.pop(0)
+        payload = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body["model"],
+            "choices": [{
+                "index": 0,
+                "finish_reason": "tool_calls" if message.get("tool_calls") else "stop",
+                "message": message
+            }]
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(name="fake_openai")
+def fake_openai_fixture(monkeypatch):
+    """Run a fake OpenAI server and point the shared client at it."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOpenAIHandler)
+    server.connections = 0
+    server.requests = []
+    server.replies = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setattr(settings, "OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1")
+    client.reset_clients()
+    metrics.reset()
+
+    yield server
+
+    client.reset_clients()
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_is_shared():
+    """Test get_client returns one instance per process."""
+    client.reset_clients()
+    try:
+        assert client.get_client() is client.get_client()
+        assert client.get_async_client() is client.get_async_client()
+    finally:
+        client.reset_clients()
+
+
+def test_concurrent_first_use_creates_one_client(monkeypatch):
+    """Test threads racing on first use all get the same client."""
+    client.reset_clients()
+    created = []
+    real_openai = client.openai.OpenAI
+
+    def slow_openai(**kwargs):
+        created.append(kwargs)
+        time.sleep(0.05)
+        return real_openai(**kwargs)
+
+    monkeypatch.setattr(client.openai, "OpenAI", slow_openai)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.get_client())) for _ in range(4)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(created) == 1
+        assert all(result is results[0] for result in results)
+    finally:
+        client.reset_clients()
+
+
+def test_close_clients_closes_async_client():
+    """Test shutdown closes the async client's connection pool, not just drops it."""
+    client.reset_clients()
+    async_client = client.get_async_client()
+
+    asyncio.run(client.close_clients())
+
+    assert async_client.is_closed()
+    assert client._async_client is None
+
+
+def test_run_agent_reuses_connection(fake_openai):
+    """Test consecutive chat turns share one keep-alive connection."""
+    user_id = uuid4()
+
+    first = runner.run_agent(None, user_id, [{"role": "user", "content": "one"}])
+    second = runner.run_agent(None, user_id, [{"role": "user", "content": "two"}])
+
+    assert first["response"] == "echo: one"
+    assert second["response"] == "echo: two"
+    assert fake_openai.connections == 1
+    # Precomputed prompt and tools are sent on every request
+    assert fake_openai.requests[0]["messages"][0] == runner._SYSTEM_MESSAGE
+    assert fake_openai.requests[1]["tools"] == runner._TOOLS
+
+
+def test_run_agent_records_connect_and_model_time(fake_openai):
+    """Test connect time is recorded once and model wait on every call."""
+    for text in ("one", "two", "three"):
+        runner.run_agent(None, uuid4(), [{"role": "user", "content": text}])
+
+    data = metrics.snapshot()
+
+    assert data["openai_connections_total"] == {
+        (("reused", "false"),): 1,
+        (("reused", "true"),): 2,
+    }
+    assert data["openai_connect_seconds"][()][0] == 1
+    assert data["openai_model_wait_seconds"][()][0] == 3
+    assert data["openai_request_seconds"][(("mode", "sync"),)][0] == 3
+    assert "openai_model_wait_seconds_count 3" in metrics.render_prometheus()
+
+
+def test_run_agent_feeds_tool_results_back(fake_openai, monkeypatch):
+    """Test the loop runs tools, sends results to the model, then answers."""
+    monkeypatch.setattr(
+        runner,
+        "run_tool_calls",
+        lambda session, user_id, calls: [{"ok": name} for name, _ in calls]
+    )
+    fake_openai.replies = [{
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [
+            {"id": "call_1", "type": "function",
+             "function": {"name": "complete_task", "arguments": '{"task_id": 1}'}},
+            {"id": "call_2", "type": "function",
+             "function": {"name": "list_tasks", "arguments": '{"status": "all"}'}},
+        ]
+    }]
+
+    result = runner.run_agent(None, uuid4(), [{"role": "user", "content": "done with 1, show list"}])
+
+    assert [call["tool"] for call in result["tool_calls"]] == ["complete_task", "list_tasks"]
+    followup = fake_openai.requests[1]["messages"]
+    assert followup[-3]["tool_calls"][0]["id"] == "call_1"
+    assert followup[-2] == {"role": "tool", "tool_call_id": "call_1", "content": '{"ok": "complete_task"}'}
+    assert followup[-1]["tool_call_id"] == "call_2"
+    assert result["response"].startswith("echo: ")
+
+
+def test_run_agent_last_step_cannot_call_tools(fake_openai):
+    """Test the final step forces a text answer."""
+    runner.run_agent(None, uuid4(), [{"role": "user", "content": "hi"}], max_steps=1)
+
+    assert fake_openai.requests[0]["tool_choice"] == "none"
@@ -0,0 +1,73 @@
+"""
+Tests for the archive tier.
+[Task]: T-030 (Task Archive Tests)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+
+The archiver moves rows with INSERT ... SELECT and jsonb_agg, so the
+round-trip tests need a real PostgreSQL database (pg_session, see
+conftest.py).
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, select
+from src.models.archived_task import ArchivedTask
+from src.models.tag import Tag, TaskTag
+from src.models.task import Task
+from src.models.task_tombstone import TaskTombstone
+from src.models.user import User
+from src.routers.tasks import _build_list_query
+from src.services.archiver import TASK_COLUMNS, archive_batch, unarchive_task
+
+
+def test_archive_mirrors_task_columns():
+    """Test that every moved column exists with the same type in both tables."""
+    for name in TASK_COLUMNS:
+        task_type = Task.__table__.c[name].type.compile(dialect=postgresql.dialect())
+        archived_type = ArchivedTask.__table__.c[name].type.compile(dialect=postgresql.dialect())
+        assert task_type == archived_type, name
+
+
+def test_archived_list_query_filters():
+    """Test that list filters apply to the archive, tags via tag_ids containment."""
+    query = _build_list_query(uuid4(), completed="completed", tag_ids=[3], model=ArchivedTask)
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "FROM archived_tasks" in sql
+    assert "archived_tasks.completed = true" in sql
+    assert "archived_tasks.tag_ids @>" in sql
+    assert "task_tags" not in sql
+
+
+def test_archive_and_unarchive_round_trip(pg_session: Session):
+    """Test that old completed tasks move out with their tags and come back."""
+    user = User(email="archive@example.com", password_hash="x")
+    pg_session.add(user)
+    pg_session.commit()
+    user_id = user.id
+
+    long_ago = datetime.utcnow() - timedelta(days=200)
+    old_done = Task(user_id=user_id, title="old done", completed=True, created_at=long_ago, updated_at=long_ago)
+    recent_done = Task(user_id=user_id, title="recent done", completed=True)
+    old_pending = Task(user_id=user_id, title="old pending", created_at=long_ago, updated_at=long_ago)
+    tag = Tag(name="work", created_by=user_id)
+    pg_session.add_all([old_done, recent_done, old_pending, tag])
+    pg_session.commit()
+    pg_session.add(TaskTag(task_id=old_done.id, tag_id=tag.id))
+    pg_session.commit()
+    old_id, tag_id = old_done.id, tag.id
+
+    assert archive_batch(pg_session, older_than_days=90) == {user_id: [old_id]}
+    assert pg_session.exec(select(Task.id).where(Task.id == old_id)).first() is None
+    archived = pg_session.exec(select(ArchivedTask).where(ArchivedTask.id == old_id)).one()
+    assert archived.title == "old done" and archived.tag_ids == [tag_id]
+    archived_version = archived.version
+    assert pg_session.exec(select(TaskTombstone.task_id)).all() == [old_id]
+    assert {t.title for t in pg_session.exec(select(Task)).all()} == {"recent done", "old pending"}
+
+    restored = unarchive_task(pg_session, user_id, old_id)
+    assert restored.id == old_id and restored.completed
+    assert restored.version == archived_version + 1
+    assert pg_session.exec(select(TaskTag.tag_id).where(TaskTag.task_id == old_id)).all() == [tag_id]
+    assert pg_session.exec(select(ArchivedTask.id)).all() == []
+    assert unarchive_task(pg_session, user_id, old_id) is None
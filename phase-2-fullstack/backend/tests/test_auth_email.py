@@ -0,0 +1,60 @@
+"""
+Tests for case-insensitive email registration and login.
+[Task]: T-024 (Case-Insensitive Email Tests)
+[From]: spec.md §6.1, §7.1
+
+Registration relies on INSERT ... ON CONFLICT against the lower(email)
+unique index, so these tests need a real PostgreSQL database
+(pg_session, see conftest.py).
+"""
+
+import pytest
+from fastapi import HTTPException
+from sqlmodel import Session
+from src.routers import auth
+from src.routers.auth import register, login
+from src.schemas.auth import RegisterRequest, LoginRequest
+from src.utils import password_pool, security
+
+
+@pytest.fixture(name="session")
+def session_fixture(pg_session: Session, monkeypatch):
+    """PostgreSQL session; hashing inline at low cost."""
+    monkeypatch.setattr(password_pool.settings, "PASSWORD_HASH_WORKERS", 0)
+    monkeypatch.setattr(security.settings, "BCRYPT_ROUNDS", 4)
+    password_pool.shutdown_password_pool()
+
+    yield pg_session
+
+    password_pool.shutdown_password_pool()
+
+
+def test_register_rejects_case_variant(session: Session):
+    """Test that Foo@ and foo@ cannot both register."""
+    created = register(RegisterRequest(email="Case.User@example.com", password="password123"), session)
+    assert created.email == "Case.User@example.com"
+
+    with pytest.raises(HTTPException) as exc:
+        register(RegisterRequest(email="case.user@example.com", password="password123"), session)
+    assert exc.value.status_code == 409
+
+
+def test_duplicate_register_skips_hashing(session: Session, monkeypatch):
+    """Test a taken address is rejected before the password is hashed."""
+    register(RegisterRequest(email="Taken@example.com", password="password123"), session)
+
+    hashed = []
+    monkeypatch.setattr(auth, "hash_password", lambda password: hashed.append(password) or "x")
+    with pytest.raises(HTTPException) as exc:
+        register(RegisterRequest(email="taken@example.com", password="password123"), session)
+    assert exc.value.status_code == 409
+    assert hashed == []
+
+
+def test_login_ignores_email_case(session: Session):
+    """Test that login finds the account regardless of email case."""
+    created = register(RegisterRequest(email="Mixed@example.com", password="password123"), session)
+
+    response = login(LoginRequest(email="mixed@EXAMPLE.com", password="password123"), session)
+    assert response.user["id"] == str(created.id)
+    assert response.user["email"] == "Mixed@example.com"
@@ -0,0 +1,142 @@
+"""
+Tests for the streaming chat path.
+[Task]: T-012 (Streaming Chat Tests)
+[From]: specs/003-phase-iii-chatbot/spec.md §5.1
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from uuid import uuid4
+from sqlmodel import Session, SQLModel, create_engine, select
+from sqlmodel.pool import StaticPool
+from src.agent import runner, client
+from src.models import User
+from src.models.conversation import Conversation
+from src.models.message import Message
+from src.routers import chat
+from src.routers.chat import ChatRequest, _sse
+
+
+class FakeStream:
+    """Async iterator over prepared chat.completions chunks."""
+
+    def __init__(self, deltas):
+        self._chunks = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=delta)]) for delta in deltas
+        ]
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._chunks:
+            raise StopAsyncIteration
+        return self._chunks.pop(0)
+
+
+class FakeAsyncClient:
+    """Stand-in for openai.AsyncOpenAI returning one prepared stream per call."""
+
+    def __init__(self, *streams):
+        self.requests = []
+        pending = list(streams)
+
+        async def create(**kwargs):
+            assert kwargs["stream"] is True
+            self.requests.append(kwargs)
+            return FakeStream(pending.pop(0))
+
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+
+def _delta(content=None, tool_calls=None):
+    return SimpleNamespace(content=content, tool_calls=tool_calls)
+
+
+def _collect(monkeypatch, *streams):
+    fake = FakeAsyncClient(*streams)
+    monkeypatch.setattr(client, "_async_client", fake)
+
+    async def run():
+        return [event async for event in runner.stream_agent(uuid4(), [{"role": "user", "content": "hi"}])]
+
+    return asyncio.run(run()), fake
+
+
+def test_stream_agent_yields_tokens_then_done(monkeypatch):
+    """Test text deltas are streamed and joined into the final response."""
+    events, _ = _collect(monkeypatch, [_delta("Hel"), _delta("lo!")])
+
+    assert [e["content"] for e in events if e["type"] == "token"] == ["Hel", "lo!"]
+    assert events[-1] == {"type": "done", "response": "Hello!", "tool_calls": []}
+
+
+def test_stream_agent_assembles_tool_call_fragments(monkeypatch):
+    """Test tool call fragments are reassembled and results fed back to the model."""
+    def fragment(call_id, name, arguments):
+        return SimpleNamespace(index=0, id=call_id, function=SimpleNamespace(name=name, arguments=arguments))
+
+    calls = []
+    monkeypatch.setattr(
+        runner,
+        "_run_tool_calls_in_session",
+        lambda user_id, step_calls: calls.append(step_calls) or [{"count": 0, "tasks": []}]
+    )
+    events, fake = _collect(
+        monkeypatch,
+        [
+            _delta(tool_calls=[fragment("call_1", "list_tasks", '{"sta')]),
+            _delta(tool_calls=[fragment(None, None, 'tus": "pending", "user_id": "spoofed"}')]),
+        ],
+        [_delta("Nothing pending.")],
+    )
+
+    assert calls == [[("list_tasks", {"status": "pending"})]]
+    assert [e["type"] for e in events] == ["tool_call", "token", "done"]
+    assert events[-1]["response"] == "Nothing pending."
+    tool_message = fake.requests[1]["messages"][-1]
+    assert tool_message["role"] == "tool"
+    assert tool_message["tool_call_id"] == "call_1"
+
+
+def test_sse_format():
+    """Test events are framed as server-sent events."""
+    frame = _sse("token", {"content": "hi"})
+
+    assert frame.startswith("event: token\ndata: ")
+    assert frame.endswith("\n\n")
+    assert json.loads(frame.split("data: ", 1)[1]) == {"content": "hi"}
+
+
+def test_aborted_stream_keeps_user_message(monkeypatch):
+    """Test the user message and new conversation survive a client disconnect mid-stream."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine, tables=[User.__table__, Conversation.__table__, Message.__table__])
+    monkeypatch.setattr(chat, "engine", engine)
+
+    async def endless_agent(user_id, messages):
+        while True:
+            yield {"type": "token", "content": "..."}
+
+    monkeypatch.setattr(chat, "stream_agent", endless_agent)
+    user_id = uuid4()
+
+    async def run():
+        response = await chat.chat_stream(user_id, ChatRequest(message="remind me"), current_user_id=user_id)
+        frames = response.body_iterator
+        first = [await frames.__anext__(), await frames.__anext__()]
+        await frames.aclose()  # client went away before "done"
+        return first
+
+    frames = asyncio.run(run())
+
+    assert frames[0].startswith("event: conversation")
+    with Session(engine) as session:
+        conversation = session.exec(select(Conversation)).one()
+        messages = session.exec(select(Message)).all()
+    assert [(m.role, m.content, m.conversation_id) for m in messages] == [("user", "remind me", conversation.id)]
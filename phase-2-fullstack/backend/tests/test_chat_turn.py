@@ -0,0 +1,94 @@
+"""
+Tests for chat turn persistence.
+[Task]: T-018 (Chat Turn Transaction Tests)
+[From]: specs/003-phase-iii-chatbot/spec.md §5.1
+"""
+
+from datetime import datetime
+from uuid import uuid4
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, SQLModel, create_engine, select
+from sqlmodel.pool import StaticPool
+from src.models import User
+from src.models.conversation import Conversation
+from src.models.message import Message
+from src.routers import chat
+from src.routers.chat import ChatRequest, _persist_turn
+
+
+class RecordingSession:
+    """Records writes; flush assigns ids to added objects."""
+
+    def __init__(self):
+        self.log = []
+        self.added = []
+
+    def add(self, obj):
+        self.added.append(obj)
+        self.log.append("add")
+
+    def flush(self):
+        for obj in self.added:
+            obj.id = 42
+        self.log.append("flush")
+
+    def execute(self, statement):
+        self.log.append(str(statement.compile(dialect=postgresql.dialect())))
+
+    def commit(self):
+        self.log.append("commit")
+
+
+def test_existing_conversation_is_one_statement_and_one_commit():
+    """Test both messages and the timestamp bump share one INSERT ... WITH UPDATE."""
+    session = RecordingSession()
+
+    conversation_id = _persist_turn(session, uuid4(), 7, "hi", datetime(2026, 1, 1), "hello")
+
+    assert conversation_id == 7
+    assert len(session.log) == 2 and session.log[1] == "commit"
+    sql = session.log[0]
+    assert sql.startswith("WITH touch_conversation AS")
+    assert "UPDATE conversations SET updated_at" in sql
+    assert "INSERT INTO messages" in sql
+    assert "content_m1" in sql  # multi-row VALUES
+
+
+def test_new_conversation_is_created_in_the_same_transaction():
+    """Test a new conversation is flushed, then messages inserted, then one commit."""
+    session = RecordingSession()
+
+    conversation_id = _persist_turn(session, uuid4(), None, "hi", datetime(2026, 1, 1), "hello")
+
+    assert conversation_id == 42
+    assert session.log[:2] == ["add", "flush"]
+    assert session.log[2].startswith("INSERT INTO messages")
+    assert session.log[3:] == ["commit"]
+
+
+def test_agent_failure_keeps_user_message(monkeypatch):
+    """Test POST /chat stores the user message and new conversation when the agent raises."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine, tables=[User.__table__, Conversation.__table__, Message.__table__])
+
+    def failing_agent(session, user_id, messages):
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(chat, "run_agent", failing_agent)
+    user_id = uuid4()
+
+    with Session(engine) as session:
+        with pytest.raises(HTTPException) as exc:
+            chat._run_turn(session, user_id, ChatRequest(message="remind me"))
+        assert exc.value.status_code == 500
+
+        conversation = session.exec(select(Conversation)).one()
+        messages = session.exec(select(Message)).all()
+    assert conversation.user_id == user_id
+    assert [(m.role, m.content, m.conversation_id) for m in messages] == [("user", "remind me", conversation.id)]
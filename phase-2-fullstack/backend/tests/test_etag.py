@@ -0,0 +1,76 @@
+"""
+Tests for data-version ETags and conditional GET.
+[Task]: T-025 (Conditional GET Tests)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+"""
+
+from uuid import uuid4
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlmodel import Session, create_engine
+from sqlmodel.pool import StaticPool
+from src.models.user import User
+from src.services.data_version import bump_data_version, bump_data_versions, get_data_version
+from src.utils.etag import etag_matches, make_etag, not_modified_response, validator_headers
+
+
+def test_etag_matching():
+    """Test If-None-Match parsing: lists, weak validators, and *."""
+    etag = make_etag("tasks", 7)
+    assert etag == '"tasks-7"'
+    assert etag_matches('"tasks-7"', etag)
+    assert etag_matches('"tasks-6", W/"tasks-7"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"tasks-6"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_bump_data_version():
+    """Test that bumps are per user and counted."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    User.__table__.create(engine)
+    with Session(engine) as session:
+        alice = User(email="alice@example.com", password_hash="x")
+        bob = User(email="bob@example.com", password_hash="x")
+        session.add_all([alice, bob])
+        session.commit()
+
+        bump_data_version(session, alice.id)
+        bump_data_versions(session, [alice.id, str(bob.id)])
+        session.commit()
+
+        assert get_data_version(session, alice.id) == 2
+        assert get_data_version(session, bob.id) == 1
+        assert get_data_version(session, uuid4()) is None
+
+
+def test_conditional_get_skips_body():
+    """Test 200 with ETag, then 304 without running the handler body."""
+    app = FastAPI()
+    state = {"version": 1, "built": 0}
+
+    @app.get("/items")
+    def items(request: Request):
+        etag = make_etag("items", state["version"])
+        not_modified = not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+        state["built"] += 1
+        return JSONResponse({"items": [1, 2, 3]}, headers=validator_headers(etag))
+
+    client = TestClient(app)
+    first = client.get("/items")
+    assert first.status_code == 200
+    assert first.headers["etag"] == '"items-1"'
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    second = client.get("/items", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert state["built"] == 1
+
+    state["version"] = 2
+    third = client.get("/items", headers={"If-None-Match": first.headers["etag"]})
+    assert third.status_code == 200
+    assert third.headers["etag"] == '"items-2"'
@@ -0,0 +1,81 @@
+"""
+Tests for the plain list-request fast path.
+[Task]: T-016 (Tool Result Cache Tests)
+[From]: specs/003-phase-iii-chatbot/spec.md §7
+"""
+
+import asyncio
+import pytest
+from uuid import uuid4
+from src.agent import runner
+from src.agent.fast_path import match_list_intent
+
+
+@pytest.mark.parametrize("message,status", [
+    ("show my tasks", "all"),
+    ("Show me all my tasks!", "all"),
+    ("list my todos please", "all"),
+    ("my tasks", "all"),
+    ("What's pending?", "pending"),
+    ("show me my open tasks", "pending"),
+    ("what do I have to do", "pending"),
+    ("show my completed tasks", "completed"),
+    ("what have I finished?", "completed"),
+])
+def test_list_intents_are_recognized(message, status):
+    """Test common list phrasings map to a list_tasks status."""
+    assert match_list_intent(message) == status
+
+
+@pytest.mark.parametrize("message", [
+    "show my tasks due tomorrow",
+    "list high priority tasks",
+    "add a task to buy milk",
+    "complete task 3",
+    "list",
+    "",
+])
+def test_other_messages_go_to_the_model(message):
+    """Test anything beyond a plain list request is not short-circuited."""
+    assert match_list_intent(message) is None
+
+
+def _no_model(*args, **kwargs):
+    pytest.fail("model should not be called")
+
+
+def test_run_agent_answers_list_request_without_model(monkeypatch):
+    """Test run_agent returns list_tasks output directly for a list intent."""
+    monkeypatch.setattr(runner, "get_client", _no_model)
+    calls = []
+
+    def fake_call_tool(session, user_id, name, args):
+        calls.append((name, args))
+        return {"tasks": [{"id": 7, "title": "Buy milk", "completed": False}], "count": 1}
+
+    monkeypatch.setattr(runner, "call_tool", fake_call_tool)
+
+    result = runner.run_agent(None, uuid4(), [{"role": "user", "content": "what's pending?"}])
+
+    assert calls == [("list_tasks", {"status": "pending"})]
+    assert "Task #7: Buy milk" in result["response"]
+    assert "pending task(s)" in result["response"]
+    assert result["tool_calls"][0]["tool"] == "list_tasks"
+
+
+def test_stream_agent_answers_list_request_without_model(monkeypatch):
+    """Test stream_agent emits tool_call, token and done for a list intent."""
+    monkeypatch.setattr(runner, "get_async_client", _no_model)
+    monkeypatch.setattr(
+        runner,
+        "_run_tool_calls_in_session",
+        lambda user_id, calls: [{"tasks": [], "count": 0}]
+    )
+
+    async def collect():
+        return [event async for event in runner.stream_agent(uuid4(), [{"role": "user", "content": "show my tasks"}])]
+
+    events = asyncio.run(collect())
+
+    assert [event["type"] for event in events] == ["tool_call", "token", "done"]
+    assert events[-1]["response"] == "You don't have any tasks yet. Would you like to add one?"
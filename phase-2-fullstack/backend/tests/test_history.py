@@ -0,0 +1,115 @@
+"""
+Tests for chat history windowing and rolling summaries.
+[Task]: T-015 (History Window Tests)
+[From]: specs/003-phase-iii-chatbot/spec.md §5.1
+"""
+
+import pytest
+from src.agent import history
+from src.models.conversation import Conversation
+from src.models.message import Message
+
+
+def _messages(count, size=400):
+    """count messages of ~size characters, newest first (ids descending)."""
+    return [
+        Message(id=i, conversation_id=1, role="user" if i % 2 else "assistant", content="x" * size)
+        for i in range(count, 0, -1)
+    ]
+
+
+class FakeSession:
+    """Session stand-in returning prepared rows (newest first)."""
+
+    def __init__(self, conversation, rows):
+        self.conversation = conversation
+        self.rows = rows
+        self.committed = False
+
+    def get(self, model, key):
+        return self.conversation
+
+    def exec(self, query):
+        return self
+
+    def all(self):
+        return self.rows
+
+    def add(self, obj):
+        pass
+
+    def commit(self):
+        self.committed = True
+
+
+def test_split_window_keeps_newest_within_budget():
+    """Test the window is the newest messages that fit, oldest first."""
+    newest_first = _messages(10)  # ~104 tokens each
+    window, overflow = history.split_window(newest_first, token_budget=350)
+
+    assert [m.id for m in window] == [8, 9, 10]
+    assert [m.id for m in overflow] == list(range(1, 8))
+
+
+def test_split_window_always_keeps_latest_message():
+    """Test an oversized latest message is still sent."""
+    window, overflow = history.split_window(_messages(3, size=10_000), token_budget=100)
+
+    assert [m.id for m in window] == [3]
+    assert [m.id for m in overflow] == [1, 2]
+
+
+def test_load_history_prepends_summary():
+    """Test the stored summary leads the messages array."""
+    conversation = Conversation(id=1, user_id=None, summary="User plans a trip.", summary_through_id=4)
+    session = FakeSession(conversation, _messages(2, size=40))
+
+    messages = history.load_history(session, conversation, token_budget=1000)
+
+    assert messages[0]["role"] == "system"
+    assert "User plans a trip." in messages[0]["content"]
+    assert [m["role"] for m in messages[1:]] == ["user", "assistant"]
+
+
+def test_fold_history_waits_for_enough_overflow(monkeypatch):
+    """Test no summary call is made until FOLD_MIN_TOKENS have overflowed."""
+    monkeypatch.setattr(history, "summarize", lambda *args: pytest.fail("summarize should not be called"))
+    conversation = Conversation(id=1, user_id=None)
+    session = FakeSession(conversation, _messages(4))
+
+    assert history.fold_history(session, 1, token_budget=300) is False
+    assert conversation.summary_through_id is None
+
+
+def test_fold_history_advances_summary(monkeypatch):
+    """Test overflowing messages are folded and marked summarized."""
+    folded = []
+
+    def fake_summarize(previous, messages):
+        folded.extend(m.id for m in messages)
+        return "merged summary"
+
+    monkeypatch.setattr(history, "summarize", fake_summarize)
+    conversation = Conversation(id=1, user_id=None, summary="old")
+    session = FakeSession(conversation, _messages(10))
+
+    assert history.fold_history(session, 1, token_budget=350) is True
+    assert folded == list(range(1, 8))
+    assert conversation.summary == "merged summary"
+    assert conversation.summary_through_id == 7
+    assert session.committed
+
+
+def test_fold_history_keeps_state_on_failure(monkeypatch):
+    """Test a failed summary call leaves the conversation untouched."""
+    def failing_summarize(previous, messages):
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(history, "summarize", failing_summarize)
+    conversation = Conversation(id=1, user_id=None, summary="old", summary_through_id=None)
+    session = FakeSession(conversation, _messages(10))
+
+    assert history.fold_history(session, 1, token_budget=350) is False
+    assert conversation.summary == "old"
+    assert conversation.summary_through_id is None
+    assert not session.committed
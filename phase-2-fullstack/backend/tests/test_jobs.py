@@ -0,0 +1,41 @@
+"""
+Tests for job endpoint access control.
+[Task]: T-C-013 (Job Token Tests)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §3.2, §6.2
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.config import settings
+from src.database import get_session
+from src.main import app
+from src.routers import jobs
+
+
+@pytest.fixture(name="client")
+def client_fixture(monkeypatch):
+    monkeypatch.setattr(jobs, "roll_pending_batch", lambda session, batch_size: [])
+    monkeypatch.setattr(jobs, "prune_tombstones", lambda session: 0)
+    monkeypatch.setattr(jobs, "archive_batch", lambda session, batch_size: {})
+    app.dependency_overrides[get_session] = lambda: None
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("path", [
+    "/api/jobs/roll-recurring",
+    "/api/jobs/archive-completed",
+    "/api/jobs/prune-tombstones",
+])
+def test_jobs_require_token(client: TestClient, monkeypatch, path: str):
+    """Test state-changing jobs are off without JOBS_TOKEN and need it as a bearer token."""
+    monkeypatch.setattr(settings, "JOBS_TOKEN", "")
+    assert client.post(path, headers={"Authorization": "Bearer "}).status_code == 404
+
+    monkeypatch.setattr(settings, "JOBS_TOKEN", "job-secret")
+    assert client.post(path).status_code == 401
+    assert client.post(path, headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    response = client.post(path, headers={"Authorization": "Bearer job-secret"})
+    assert response.status_code == 200
+    assert response.json()["status"] == "success"
@@ -0,0 +1,58 @@
+"""
+Tests for list_tasks sparse fieldsets.
+[Task]: T-027 (Sparse Fieldsets Tests)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1.2
+"""
+
+from uuid import uuid4
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from src.routers.tasks import (
+    COMPACT_LIST_FIELDS,
+    LIST_COLUMNS,
+    _apply_sort,
+    _build_list_query,
+    _parse_fields
+)
+
+
+def test_parse_fields():
+    """Test presets, id injection, de-duplication, and unknown names."""
+    assert _parse_fields(None) is None
+    assert _parse_fields(" ") is None
+    assert _parse_fields("compact") == list(COMPACT_LIST_FIELDS)
+    assert _parse_fields("title,tags,title") == ["id", "title", "tags"]
+    assert _parse_fields("id, completed") == ["id", "completed"]
+
+    with pytest.raises(HTTPException) as exc:
+        _parse_fields("title,password_hash")
+    assert exc.value.status_code == 400
+    assert "password_hash" in exc.value.detail
+
+
+def test_projection_selects_only_requested_columns():
+    """Test that the page query reads the chosen columns and no tag tables."""
+    query = _apply_sort(_build_list_query(uuid4(), completed="pending"), "due_date", "asc")
+    columns = [LIST_COLUMNS[name] for name in _parse_fields("compact")]
+    sql = str(query.with_only_columns(*columns).compile(dialect=postgresql.dialect()))
+    select_list = sql.split(" FROM ")[0]
+
+    assert "tasks.title" in select_list
+    assert "tasks.due_date" in select_list
+    assert "tasks.description" not in select_list
+    assert "tasks.recurrence_pattern" not in select_list
+    assert "task_tags" not in sql
+    assert "ORDER BY tasks.due_date ASC" in sql
+
+
+def test_sparse_rows_serialize_nested_tags():
+    """Test that plain-dict rows carrying tag models render as JSON."""
+    from datetime import datetime
+    from src.schemas.task import TagResponse
+    from src.utils.responses import FastJSONResponse
+
+    tag = TagResponse(id=1, name="work", color="#3B82F6", created_at=datetime(2026, 1, 1))
+    body = FastJSONResponse({"tasks": [{"id": 5, "tags": [tag]}], "count": 1}).body
+    assert b'"name":"work"' in body
+    assert b'"id":5' in body
@@ -0,0 +1,101 @@
+"""
+Tests for the paginated, projected list_tasks MCP tool.
+[Task]: T-017 (Paginated list_tasks Tests)
+[From]: specs/003-phase-iii-chatbot/spec.md §6
+"""
+
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy.dialects import postgresql
+from src.mcp.tools import list_tasks, MAX_LIST_LIMIT
+from src.models.task import Priority
+
+
+class CapturingSession:
+    """Records the statement and returns prepared rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statement = None
+
+    def exec(self, statement):
+        self.statement = statement
+        return self
+
+    def all(self):
+        return self.rows
+
+    def sql(self):
+        return str(self.statement.compile(dialect=postgresql.dialect()))
+
+
+def test_selects_only_requested_columns():
+    """Test the projection reaches the SELECT list."""
+    session = CapturingSession([])
+    list_tasks(session, uuid4(), fields=["due_date"])
+
+    select_list = session.sql().split("FROM")[0]
+    assert "tasks.id" in select_list and "tasks.title" in select_list
+    assert "tasks.due_date" in select_list
+    assert "tasks.description" not in select_list
+    assert "recurrence_pattern" not in select_list
+
+
+def test_reports_truncation_with_next_offset():
+    """Test one extra row is fetched to detect more results."""
+    rows = [(i, f"Task {i}", False, Priority.HIGH, datetime(2026, 1, i)) for i in range(1, 4)]
+    session = CapturingSession(rows)
+
+    result = list_tasks(session, uuid4(), limit=2, offset=4)
+
+    assert session.statement.compile().params["param_1"] == 3  # limit + 1
+    assert result["count"] == 2
+    assert result["truncated"] is True
+    assert result["next_offset"] == 6
+    assert result["tasks"][0] == {
+        "id": 1, "title": "Task 1", "completed": False, "priority": "high", "due_date": "2026-01-01T00:00:00"
+    }
+
+
+def test_last_page_is_not_truncated():
+    """Test a short page reports no more results."""
+    result = list_tasks(CapturingSession([(1, "Only", False, Priority.LOW, None)]), uuid4())
+
+    assert result["truncated"] is False
+    assert result["next_offset"] is None
+
+
+def test_limit_is_capped():
+    """Test the model cannot request an unbounded page."""
+    session = CapturingSession([])
+    list_tasks(session, uuid4(), limit=10_000)
+
+    assert session.statement.compile().params["param_1"] == MAX_LIST_LIMIT + 1
+
+
+def test_filters_are_applied():
+    """Test priority, due range, search and tag filters reach the WHERE clause."""
+    session = CapturingSession([])
+    list_tasks(
+        session,
+        uuid4(),
+        status="pending",
+        priority=["high", "urgent"],
+        due_after="2026-01-01T00:00:00",
+        due_before="2026-01-31T23:59:59Z",
+        tags=["Work", "work", "home"],
+        search="report"
+    )
+
+    where = session.sql().split("WHERE", 1)[1]
+    assert "tasks.completed = false" in where
+    assert "tasks.priority IN" in where
+    assert "tasks.due_date >=" in where and "tasks.due_date <=" in where
+    assert "ILIKE" in where
+    assert where.count("lower(tags.name)") == 2  # duplicate tag names collapse
+
+
+def test_invalid_arguments_return_an_error():
+    """Test bad dates or priorities produce a tool error, not an exception."""
+    assert "error" in list_tasks(CapturingSession([]), uuid4(), due_after="next tuesday")
+    assert "error" in list_tasks(CapturingSession([]), uuid4(), priority=["critical"])
@@ -0,0 +1,191 @@
+"""
+Tests for MCP tool registry dispatch.
+[Task]: T-014 (Agent Tool Loop Tests), T-016 (Tool Result Cache Tests)
+[From]: specs/003-phase-iii-chatbot/spec.md §6
+"""
+
+import threading
+from uuid import uuid4
+from src.mcp import registry
+from src.mcp.registry import ToolSpec, call_tool, run_tool_calls, is_read_only
+from src.services import tool_cache
+
+
+class FakeSavepoint:
+    def __init__(self, log):
+        self.log = log
+
+    def commit(self):
+        self.log.append("release")
+
+    def rollback(self):
+        self.log.append("rollback savepoint")
+
+
+class FakeSession:
+    """Records transaction calls made by the dispatcher."""
+
+    def __init__(self):
+        self.log = []
+
+    def begin_nested(self):
+        self.log.append("savepoint")
+        return FakeSavepoint(self.log)
+
+    def commit(self):
+        self.log.append("commit")
+
+    def rollback(self):
+        self.log.append("rollback")
+
+
+def _registry(monkeypatch, order, data_versions=None):
+    data_versions = {} if data_versions is None else data_versions
+    monkeypatch.setattr(registry, "get_data_version", lambda session, user_id: data_versions.get(user_id, 0))
+
+    def mutation(name, fail=False):
+        def handler(session, user_id, commit=True, **kwargs):
+            assert commit is False
+            order.append(name)
+            if fail:
+                raise RuntimeError("boom")
+            return {"status": name, **kwargs}
+        return handler
+
+    def read(session, user_id, **kwargs):
+        order.append(("read", threading.current_thread().name))
+        return {"tasks": [], "count": 0}
+
+    monkeypatch.setattr(registry, "TOOL_REGISTRY", {
+        "complete_task": ToolSpec(mutation("complete"), ("task_id",), read_only=False),
+        "delete_task": ToolSpec(mutation("delete", fail=True), ("task_id",), read_only=False),
+        "list_tasks": ToolSpec(read, ("status",), read_only=True),
+    })
+    monkeypatch.setattr(
+        registry,
+        "_call_in_new_session",
+        lambda user_id, name, args: call_tool(FakeSession(), user_id, name, args)
+    )
+
+
+def test_unknown_tool_is_an_error_without_side_effects():
+    """Test unknown tools return an error and count as read-only."""
+    assert call_tool(FakeSession(), uuid4(), "drop_tables", {}) == {"error": "Unknown tool: drop_tables"}
+    assert is_read_only("drop_tables")
+
+
+def test_mutations_commit_once_before_reads(monkeypatch):
+    """Test mutations share one commit and reads see them afterwards."""
+    order = []
+    _registry(monkeypatch, order)
+    session = FakeSession()
+
+    results = run_tool_calls(session, uuid4(), [
+        ("list_tasks", {"status": "all"}),
+        ("complete_task", {"task_id": 1, "user_id": "spoofed"}),
+        ("complete_task", {"task_id": 2}),
+    ])
+
+    assert order[:2] == ["complete", "complete"]
+    assert order[2][0] == "read"
+    assert session.log == ["savepoint", "release", "savepoint", "release", "commit"]
+    assert results[1] == {"status": "complete", "task_id": 1}
+    assert results[0] == {"tasks": [], "count": 0}
+
+
+def test_failed_mutation_rolls_back_only_its_savepoint(monkeypatch):
+    """Test one failing mutation does not undo the rest of the batch."""
+    order = []
+    _registry(monkeypatch, order)
+    session = FakeSession()
+
+    results = run_tool_calls(session, uuid4(), [
+        ("complete_task", {"task_id": 1}),
+        ("delete_task", {"task_id": 2}),
+    ])
+
+    assert session.log == ["savepoint", "release", "savepoint", "rollback savepoint", "commit"]
+    assert results[0]["status"] == "complete"
+    assert "boom" in results[1]["error"]
+
+
+def test_multiple_reads_run_on_worker_threads(monkeypatch):
+    """Test independent read-only tools are dispatched concurrently."""
+    order = []
+    _registry(monkeypatch, order)
+
+    results = run_tool_calls(FakeSession(), uuid4(), [
+        ("list_tasks", {"status": "pending"}),
+        ("list_tasks", {"status": "completed"}),
+    ])
+
+    assert len(results) == 2
+    assert all(thread.startswith("mcp-read") for _, thread in order)
+
+
+def test_read_results_are_cached_until_a_mutation(monkeypatch):
+    """Test repeated reads hit the cache and a committed mutation drops it."""
+    order = []
+    _registry(monkeypatch, order)
+    tool_cache.clear()
+    user_id = uuid4()
+
+    first = call_tool(FakeSession(), user_id, "list_tasks", {"status": "all"})
+    second = call_tool(FakeSession(), user_id, "list_tasks", {"status": "all"})
+    assert second is first
+    assert len(order) == 1
+
+    run_tool_calls(FakeSession(), user_id, [("complete_task", {"task_id": 1})])
+    call_tool(FakeSession(), user_id, "list_tasks", {"status": "all"})
+    assert sum(1 for entry in order if entry[0] == "read") == 2
+
+
+def test_data_version_bump_drops_cached_reads(monkeypatch):
+    """Test a write that only bumps data_version (tag rename, archive, another pod) is seen."""
+    order = []
+    data_versions = {}
+    _registry(monkeypatch, order, data_versions)
+    tool_cache.clear()
+    user_id = uuid4()
+
+    call_tool(FakeSession(), user_id, "list_tasks", {"status": "all"})
+    call_tool(FakeSession(), user_id, "list_tasks", {"status": "all"})
+    assert len(order) == 1
+
+    data_versions[user_id] = 1
+    call_tool(FakeSession(), user_id, "list_tasks", {"status": "all"})
+    call_tool(FakeSession(), user_id, "list_tasks", {"status": "all"})
+    assert len(order) == 2
+
+
+def test_cache_skips_results_computed_during_a_write():
+    """Test a read that raced an invalidation is not stored."""
+    tool_cache.clear()
+    user_id = uuid4()
+
+    def racing_read():
+        tool_cache.invalidate_user(user_id)  # a write commits mid-read
+        return {"tasks": [], "count": 0}
+
+    tool_cache.cached_call(user_id, "list_tasks", {}, racing_read)
+    calls = []
+    tool_cache.cached_call(user_id, "list_tasks", {}, lambda: calls.append(1) or {"count": 0})
+    assert calls == [1]
+
+
+def test_task_events_invalidate_the_cache(monkeypatch):
+    """Test publishing a task event drops the user's cached results."""
+    from src.services.event_publisher import EventPublisher
+
+    tool_cache.clear()
+    user_id = uuid4()
+    tool_cache.cached_call(user_id, "list_tasks", {}, lambda: {"count": 0})
+
+    publisher = EventPublisher.__new__(EventPublisher)
+    publisher.kafka_enabled = False
+    monkeypatch.setattr(publisher, "_log_to_database", lambda *args: None, raising=False)
+    publisher.publish("task.updated", "task-updates", {}, task_id=1, user_id=str(user_id))
+
+    calls = []
+    tool_cache.cached_call(user_id, "list_tasks", {}, lambda: calls.append(1) or {"count": 0})
+    assert calls == [1]
@@ -0,0 +1,131 @@
+"""
+Tests for the standalone MCP server (protocol, stdio and HTTP transports).
+[Task]: T-019 (Standalone MCP Server Tests)
+[From]: specs/003-phase-iii-chatbot/spec.md §6
+"""
+
+import io
+import json
+import threading
+import http.client
+import pytest
+from uuid import uuid4
+from src.mcp import protocol as protocol_module
+from src.mcp.protocol import MCPProtocol, METHOD_NOT_FOUND, INVALID_PARAMS
+from src.mcp.standalone import serve_stdio, make_http_server
+
+
+class NullSession:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture(name="mcp")
+def mcp_fixture(monkeypatch):
+    """Protocol handler whose tool calls are recorded instead of hitting the database."""
+    calls = []
+
+    def fake_call_tool(session, user_id, name, arguments):
+        calls.append((user_id, name, arguments))
+        return {"tasks": [], "count": 0}
+
+    monkeypatch.setattr(protocol_module, "call_tool", fake_call_tool)
+    handler = MCPProtocol(NullSession)
+    handler.calls = calls
+    return handler
+
+
+def _request(method, params=None, request_id=1):
+    message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+    if params is not None:
+        message["params"] = params
+    return message
+
+
+def test_initialize_and_list_tools(mcp):
+    """Test the handshake and tool descriptors."""
+    init = mcp.handle(_request("initialize", {"protocolVersion": "2025-03-26"}), None)
+    assert init["result"]["protocolVersion"] == "2025-03-26"
+    assert "tools" in init["result"]["capabilities"]
+
+    tools = {tool["name"]: tool for tool in mcp.handle(_request("tools/list"), None)["result"]["tools"]}
+    assert set(tools) == {"add_task", "list_tasks", "complete_task", "update_task", "delete_task"}
+    assert tools["list_tasks"]["inputSchema"]["properties"]["limit"]["maximum"] == 50
+    assert tools["list_tasks"]["annotations"]["readOnlyHint"] is True
+    assert tools["delete_task"]["annotations"]["readOnlyHint"] is False
+
+
+def test_tool_call_uses_authenticated_user(mcp):
+    """Test a user_id in the arguments is ignored."""
+    user_id = uuid4()
+    response = mcp.handle(_request("tools/call", {
+        "name": "list_tasks",
+        "arguments": {"status": "pending", "user_id": str(uuid4())}
+    }), user_id)
+
+    assert mcp.calls == [(user_id, "list_tasks", {"status": "pending"})]
+    result = response["result"]
+    assert result["isError"] is False
+    assert json.loads(result["content"][0]["text"]) == {"tasks": [], "count": 0}
+
+
+def test_errors_and_notifications(mcp):
+    """Test JSON-RPC errors, notifications and batches."""
+    assert mcp.handle(_request("resources/list"), None)["error"]["code"] == METHOD_NOT_FOUND
+    assert mcp.handle(_request("tools/call", {"name": "drop_tables"}), uuid4())["error"]["code"] == INVALID_PARAMS
+    assert mcp.handle(_request("tools/call", {"name": "list_tasks"}), None)["error"]["code"] == INVALID_PARAMS
+    assert mcp.handle({"jsonrpc": "2.0", "method": "notifications/initialized"}, None) is None
+
+    batch = mcp.handle([
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        _request("ping", request_id=7)
+    ], None)
+    assert batch == [{"jsonrpc": "2.0", "id": 7, "result": {}}]
+
+
+def test_stdio_transport(mcp):
+    """Test newline-delimited messages in, one response line per request out."""
+    stdin = io.StringIO(
+        json.dumps(_request("ping")) + "\n"
+        + json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}) + "\n"
+        + "not json\n"
+    )
+    stdout = io.StringIO()
+
+    serve_stdio(mcp, uuid4(), stdin, stdout)
+
+    lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert lines[0] == {"jsonrpc": "2.0", "id": 1, "result": {}}
+    assert lines[1]["error"]["code"] == -32700
+
+
+def test_http_transport_requires_token_and_keeps_connection(mcp):
+    """Test bearer auth and several calls over one keep-alive connection."""
+    user_id = uuid4()
+    server = make_http_server(mcp, lambda token: user_id if token == "good" else None, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        body = json.dumps(_request("tools/call", {"name": "list_tasks", "arguments": {}}))
+
+        connection.request("POST", "/mcp", body=body, headers={"Authorization": "Bearer bad"})
+        response = connection.getresponse()
+        response.read()
+        assert response.status == 401
+
+        for _ in range(3):
+            connection.request("POST", "/mcp", body=body, headers={"Authorization": "Bearer good"})
+            response = connection.getresponse()
+            assert response.status == 200
+            assert json.loads(response.read())["result"]["isError"] is False
+        connection.close()
+
+        assert len(mcp.calls) == 3
+        assert all(call[0] == user_id for call in mcp.calls)
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,51 @@
+"""
+Tests for the metrics registry and GET /metrics.
+[Task]: T-013 (Agent Instrumentation Tests)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §6.2.5
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.config import settings
+from src.main import app
+from src.utils import metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_timing_max_is_its_own_gauge_family():
+    """Test a summary only carries _count/_sum and the peak is typed as a gauge."""
+    metrics.observe("db_seconds", 0.5, op="read")
+    metrics.observe("db_seconds", 1.5, op="read")
+
+    lines = metrics.render_prometheus().splitlines()
+
+    summary = lines.index("# TYPE db_seconds summary")
+    gauge = lines.index("# TYPE db_seconds_max gauge")
+    assert lines[summary + 1:gauge] == [
+        'db_seconds_count{op="read"} 2',
+        'db_seconds_sum{op="read"} 2.000000',
+    ]
+    assert lines[gauge + 1] == 'db_seconds_max{op="read"} 1.500000'
+
+
+def test_metrics_endpoint_requires_token(monkeypatch):
+    """Test /metrics is off without METRICS_TOKEN and needs it as a bearer token."""
+    client = TestClient(app)
+    metrics.inc("requests_total")
+
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "")
+    assert client.get("/metrics", headers={"Authorization": "Bearer "}).status_code == 404
+
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert "requests_total 1" in response.text
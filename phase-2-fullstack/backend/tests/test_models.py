@@ -205,7 +205,7 @@ def test_task_with_recurrence_pattern(session: Session, test_user: User):
     assert task.recurrence_pattern is not None
     
     # Test property getter
-    loaded_pattern = task.recurrence_pattern_obj
+    loaded_pattern = task.recurrence
     assert loaded_pattern.frequency == RecurrenceFrequency.WEEKLY
     assert loaded_pattern.days_of_week == [0, 2, 4]
 
@@ -226,13 +226,13 @@ def test_task_recurrence_pattern_property_setter(session: Session, test_user: Us
         interval=2,
         occurrences=20
     )
-    task.recurrence_pattern_obj = pattern
+    task.recurrence = pattern
     
     session.commit()
     session.refresh(task)
     
     assert task.recurrence_pattern is not None
-    loaded_pattern = task.recurrence_pattern_obj
+    loaded_pattern = task.recurrence
     assert loaded_pattern.frequency == RecurrenceFrequency.DAILY
     assert loaded_pattern.interval == 2
     assert loaded_pattern.occurrences == 20
@@ -269,7 +269,7 @@ def test_task_with_all_phase5_fields(session: Session, test_user: User):
     assert task.due_date == due_date
     assert task.reminder_time == reminder_time
     assert task.is_recurring is True
-    assert task.recurrence_pattern_obj.frequency == RecurrenceFrequency.MONTHLY
+    assert task.recurrence.frequency == RecurrenceFrequency.MONTHLY
 
 
 # ===== Tag Model Tests =====
@@ -292,19 +292,38 @@ def test_create_tag(session: Session, test_user: User):
 
 
 def test_tag_unique_name(session: Session, test_user: User):
-    """Test that tag names must be unique."""
+    """Test that tag names must be unique per user (case-insensitive)."""
     tag1 = Tag(name="Unique", color="#FF0000", created_by=test_user.id)
     session.add(tag1)
     session.commit()
     
-    # Attempting to create duplicate should fail
-    tag2 = Tag(name="Unique", color="#00FF00", created_by=test_user.id)
+    # Attempting to create duplicate (differing only by case) should fail
+    tag2 = Tag(name="unique", color="#00FF00", created_by=test_user.id)
     session.add(tag2)
     
     with pytest.raises(Exception):  # IntegrityError expected
         session.commit()
 
 
+def test_tag_name_reusable_across_users(session: Session, test_user: User):
+    """Test that different users can each own a tag with the same name."""
+    other_user = User(
+        id=uuid4(),
+        email="other@example.com",
+        password_hash="$2b$12$test_hash",
+    )
+    session.add(other_user)
+    session.commit()
+    
+    session.add(Tag(name="Work", color="#FF0000", created_by=test_user.id))
+    session.add(Tag(name="Work", color="#00FF00", created_by=other_user.id))
+    session.commit()
+    
+    tags = session.exec(select(Tag).where(Tag.name == "Work")).all()
+    assert len(tags) == 2
+    assert {tag.created_by for tag in tags} == {test_user.id, other_user.id}
+
+
 # ===== Task-Tag Relationship Tests =====
 
 def test_task_tag_association(session: Session, test_user: User):
@@ -0,0 +1,56 @@
+"""
+Tests for the password hashing policy (algorithm/cost upgrades).
+[Task]: T-022 (Password Hash Policy Tests)
+[From]: spec.md §8
+"""
+
+import pytest
+from src.utils import password_pool, security
+from src.utils.security import hash_password, verify_password, needs_rehash
+
+
+@pytest.fixture(autouse=True)
+def inline_hashing(monkeypatch):
+    monkeypatch.setattr(password_pool.settings, "PASSWORD_HASH_WORKERS", 0)
+    monkeypatch.setattr(security.settings, "PASSWORD_HASH_SCHEME", "bcrypt")
+    monkeypatch.setattr(security.settings, "BCRYPT_ROUNDS", 4)
+    password_pool.shutdown_password_pool()
+    yield
+    password_pool.shutdown_password_pool()
+
+
+def test_bcrypt_hash_records_cost():
+    """Test that new hashes use the configured rounds and verify."""
+    hashed = hash_password("s3cret-pass")
+    assert hashed.startswith("$2b$04$")
+    assert verify_password("s3cret-pass", hashed)
+    assert not verify_password("wrong-pass", hashed)
+    assert not needs_rehash(hashed)
+
+
+def test_cost_change_requires_rehash(monkeypatch):
+    """Test that a hash made with other rounds is flagged for upgrade."""
+    hashed = hash_password("s3cret-pass")
+    monkeypatch.setattr(security.settings, "BCRYPT_ROUNDS", 5)
+    assert needs_rehash(hashed)
+    assert verify_password("s3cret-pass", hashed)  # old hashes still verify
+
+
+def test_argon2_policy_flags_bcrypt_hashes(monkeypatch):
+    """Test switching to argon2 (or falling back to bcrypt without argon2-cffi)."""
+    hashed = hash_password("s3cret-pass")
+    monkeypatch.setattr(security.settings, "PASSWORD_HASH_SCHEME", "argon2")
+    monkeypatch.setattr(security.settings, "ARGON2_MEMORY_COST", 1024)
+    monkeypatch.setattr(security.settings, "ARGON2_TIME_COST", 1)
+    monkeypatch.setattr(security.settings, "ARGON2_PARALLELISM", 1)
+
+    if security._argon2_low_level() is None:
+        assert not needs_rehash(hashed)
+        return
+
+    assert needs_rehash(hashed)
+    upgraded = hash_password("s3cret-pass")
+    assert upgraded.startswith("$argon2id$v=19$m=1024,t=1,p=1$")
+    assert verify_password("s3cret-pass", upgraded)
+    assert not verify_password("wrong-pass", upgraded)
+    assert not needs_rehash(upgraded)
@@ -0,0 +1,59 @@
+"""
+Tests for the password hashing pool.
+[Task]: T-021 (Password Hashing Pool Tests)
+[From]: spec.md §8, specs/005-phase-v-cloud/phase5-cloud.specify.md §6.2.5
+"""
+
+import threading
+import bcrypt
+import pytest
+from src.utils import metrics, password_pool
+from src.utils.password_pool import PasswordHashPool, PasswordPoolBusy
+from src.utils.security import hash_password, verify_password
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    metrics.reset()
+    password_pool.shutdown_password_pool()
+    yield
+    password_pool.shutdown_password_pool()
+
+
+def test_inline_pool_runs_in_process():
+    """Test that workers=0 calls the function directly and records timing."""
+    pool = PasswordHashPool(workers=0, max_pending=1)
+    assert pool.run("hash", lambda a, b: a + b, 1, 2) == 3
+    assert pool._executor is None
+    assert "password_hash_seconds" in metrics.render_prometheus()
+
+
+def test_pool_rejects_past_max_pending():
+    """Test that a saturated pool raises PasswordPoolBusy instead of queueing."""
+    pool = PasswordHashPool(workers=1, max_pending=1)
+    pool._pending = 1  # one call already in flight
+    with pytest.raises(PasswordPoolBusy):
+        pool.run("verify", bcrypt.checkpw, b"x", b"y")
+    assert metrics.snapshot()["password_hash_rejected_total"][(("op", "verify"),)] == 1
+    assert pool._executor is None
+
+
+def test_hash_and_verify_in_worker_processes(monkeypatch):
+    """Test bcrypt round trip through spawned workers; pending returns to 0."""
+    monkeypatch.setattr(password_pool.settings, "PASSWORD_HASH_WORKERS", 2)
+    monkeypatch.setattr(password_pool.settings, "PASSWORD_HASH_MAX_PENDING", 8)
+
+    hashed = hash_password("correct horse")
+    results = []
+    threads = [
+        threading.Thread(target=lambda p=p: results.append(verify_password(p, hashed)))
+        for p in ["correct horse", "wrong", "correct horse"]
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == [False, True, True]
+    assert password_pool.get_password_pool()._executor is not None
+    assert metrics.snapshot()["password_hash_pending"][()] == 0
@@ -0,0 +1,144 @@
+"""
+Tests for rate limiting and request coalescing.
+[Task]: T-020 (Rate Limiting Tests)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §6.2.5
+"""
+
+import re
+import threading
+import time
+from uuid import uuid4
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.utils import rate_limit
+from src.utils.rate_limit import InMemoryBucketBackend, RateLimitMiddleware, RateLimitRule
+from src.utils.security import create_access_token
+from src.utils.singleflight import SingleFlight
+
+
+def test_bucket_allows_burst_then_refills(monkeypatch):
+    """Test burst capacity, rejection, and refill over time."""
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    backend = InMemoryBucketBackend()
+
+    results = [backend.take("k", burst=3, refill_per_second=1.0) for _ in range(4)]
+    assert [allowed for allowed, _, _ in results] == [True, True, True, False]
+    assert results[2][1] == 0
+    assert results[3][2] == pytest.approx(1.0)
+
+    now[0] += 1.5
+    assert backend.take("k", burst=3, refill_per_second=1.0)[0] is True
+    assert backend.take("other", burst=3, refill_per_second=1.0)[1] == 2
+
+
+@pytest.fixture(name="client")
+def client_fixture(monkeypatch):
+    monkeypatch.setattr(rate_limit.settings, "RATE_LIMIT_ENABLED", "true")
+    rate_limit.set_backend(InMemoryBucketBackend())
+    app = FastAPI()
+
+    @app.post("/api/{user_id}/chat")
+    def chat(user_id: str):
+        return {"ok": True}
+
+    @app.get("/api/{user_id}/tasks")
+    def tasks(user_id: str):
+        return []
+
+    app.add_middleware(RateLimitMiddleware, rules=[
+        RateLimitRule("chat", "POST", re.compile(r"^/api/(?P<user_id>[^/]+)/chat$"), burst=2, per_minute=6, key="user")
+    ])
+    yield TestClient(app)
+    rate_limit.set_backend(None)
+
+
+def _auth(user_id) -> dict:
+    token = create_access_token(user_id, f"{user_id}@example.com", rate_limit.settings.BETTER_AUTH_SECRET)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_middleware_limits_per_user_with_headers(client):
+    """Test 429 after the burst, headers on every response, buckets per user."""
+    alice, bob = uuid4(), uuid4()
+    first = client.post(f"/api/{alice}/chat", headers=_auth(alice))
+    assert first.status_code == 200
+    assert first.headers["x-ratelimit-limit"] == "2"
+    assert first.headers["x-ratelimit-remaining"] == "1"
+
+    client.post(f"/api/{alice}/chat", headers=_auth(alice))
+    limited = client.post(f"/api/{alice}/chat", headers=_auth(alice))
+    assert limited.status_code == 429
+    assert limited.headers["x-ratelimit-remaining"] == "0"
+    assert int(limited.headers["retry-after"]) >= 1
+
+    assert client.post(f"/api/{bob}/chat", headers=_auth(bob)).status_code == 200
+    unlimited = client.get(f"/api/{alice}/tasks", headers=_auth(alice))
+    assert unlimited.status_code == 200
+    assert "x-ratelimit-limit" not in unlimited.headers
+
+
+def test_unverified_requests_do_not_drain_path_user_bucket(client):
+    """Test no token, a bad token or another user's token never spend the path user's bucket."""
+    victim, attacker = uuid4(), uuid4()
+    for headers in ({}, {"Authorization": "Bearer forged"}, _auth(attacker)):
+        for _ in range(3):
+            client.post(f"/api/{victim}/chat", headers=headers)
+
+    response = client.post(f"/api/{victim}/chat", headers=_auth(victim))
+    assert response.status_code == 200
+    assert response.headers["x-ratelimit-remaining"] == "1"
+
+    # Unauthenticated callers share one per-IP bucket
+    assert client.post(f"/api/{uuid4()}/chat").status_code == 429
+
+
+def test_backend_errors_fail_open(client):
+    """Test a broken shared backend does not block requests."""
+    class BrokenBackend:
+        def take(self, *args):
+            raise ConnectionError("redis down")
+
+    rate_limit.set_backend(BrokenBackend())
+    assert client.post("/api/alice/chat").status_code == 200
+
+
+def test_singleflight_coalesces_concurrent_calls():
+    """Test concurrent identical calls run once and share the result."""
+    flight = SingleFlight("test")
+    started = threading.Event()
+    release = threading.Event()
+    runs = []
+
+    def slow():
+        runs.append(1)
+        started.set()
+        release.wait(5)
+        return {"answer": 42}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("key", slow)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flight.do("key", slow))) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert runs == [1]
+    assert sorted(shared for _, shared in results) == [False, True, True, True]
+    assert all(result == {"answer": 42} for result, _ in results)
+
+    # Finished calls are not cached
+    assert flight.do("key", lambda: "fresh") == ("fresh", False)
+
+
+def test_singleflight_shares_exceptions():
+    """Test waiters see the leader's exception."""
+    flight = SingleFlight("test")
+    with pytest.raises(ValueError):
+        flight.do("key", lambda: (_ for _ in ()).throw(ValueError("boom")))
@@ -0,0 +1,150 @@
+"""
+Unit tests for the recurrence engine.
+[Task]: T-C-013 (Recurrence Engine Tests)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §2.1
+"""
+
+from datetime import datetime, date, timedelta
+from src.models.task import Task, RecurrencePattern
+from src.services.recurrence import (
+    iter_occurrences,
+    next_occurrence,
+    expand_occurrences,
+    compute_next_occurrence
+)
+
+
+def _take(iterator, count):
+    return [occurrence for _, occurrence in zip(range(count), iterator)]
+
+
+# ===== Pattern Tests =====
+
+def test_daily_interval():
+    """Test daily recurrence every N days keeps the anchor's time."""
+    pattern = RecurrencePattern(frequency="daily", interval=3)
+    anchor = datetime(2026, 1, 1, 9, 30)
+    
+    occurrences = [dt for _, dt in _take(iter_occurrences(pattern, anchor), 3)]
+    
+    assert occurrences == [anchor, datetime(2026, 1, 4, 9, 30), datetime(2026, 1, 7, 9, 30)]
+
+
+def test_weekly_days_of_week():
+    """Test weekly recurrence on several weekdays every other week."""
+    # 2026-01-07 is a Wednesday; 0=Monday, 3=Thursday
+    pattern = RecurrencePattern(frequency="weekly", interval=2, days_of_week=[0, 3])
+    anchor = datetime(2026, 1, 7, 9)
+    
+    occurrences = [dt for _, dt in _take(iter_occurrences(pattern, anchor), 4)]
+    
+    assert occurrences == [
+        anchor,
+        datetime(2026, 1, 8, 9),
+        datetime(2026, 1, 19, 9),
+        datetime(2026, 1, 22, 9),
+    ]
+
+
+def test_monthly_day_clamped_to_month_length():
+    """Test a day_of_month of 31 falls on the last day of shorter months."""
+    pattern = RecurrencePattern(frequency="monthly", day_of_month=31)
+    anchor = datetime(2026, 1, 31, 8)
+    
+    occurrences = [dt for _, dt in _take(iter_occurrences(pattern, anchor), 4)]
+    
+    assert occurrences == [
+        anchor,
+        datetime(2026, 2, 28, 8),
+        datetime(2026, 3, 31, 8),
+        datetime(2026, 4, 30, 8),
+    ]
+
+
+def test_yearly_leap_day():
+    """Test a Feb 29 yearly task recurs on Feb 28 in non-leap years."""
+    pattern = RecurrencePattern(frequency="yearly")
+    
+    assert next_occurrence(pattern, datetime(2024, 2, 29)) == datetime(2025, 2, 28)
+
+
+# ===== Series Bounds Tests =====
+
+def test_occurrences_caps_series_length():
+    """Test occurrences counts the anchor as the first instance."""
+    pattern = RecurrencePattern(frequency="daily", occurrences=3)
+    anchor = datetime(2026, 1, 1)
+    
+    assert len(list(iter_occurrences(pattern, anchor))) == 3
+    assert next_occurrence(RecurrencePattern(frequency="daily", occurrences=1), anchor) is None
+
+
+def test_end_date_is_inclusive():
+    """Test the series stops after end_date, including that day."""
+    pattern = RecurrencePattern(frequency="daily", end_date=date(2026, 1, 3))
+    anchor = datetime(2026, 1, 1, 18)
+    
+    occurrences = [dt for _, dt in iter_occurrences(pattern, anchor)]
+    
+    assert occurrences[-1] == datetime(2026, 1, 3, 18)
+    assert len(occurrences) == 3
+
+
+# ===== Expansion Tests =====
+
+def test_expand_jumps_to_range_start():
+    """Test expansion far from the anchor matches stepping from the anchor."""
+    pattern = RecurrencePattern(frequency="weekly", days_of_week=[1, 4])
+    anchor = datetime(2020, 1, 1, 12)
+    start, end = datetime(2026, 3, 1), datetime(2026, 3, 31, 23, 59)
+    
+    expanded, truncated = expand_occurrences(pattern, anchor, start, end)
+    stepped = [dt for _, dt in _take(iter_occurrences(pattern, anchor), 1000) if start <= dt <= end]
+    
+    assert expanded == stepped
+    assert len(expanded) == 9
+    assert truncated is False
+
+
+def test_expand_keeps_series_index_after_jump():
+    """Test occurrences limits still apply when expansion starts mid-series."""
+    pattern = RecurrencePattern(frequency="daily", occurrences=10)
+    anchor = datetime(2026, 1, 1)
+    
+    expanded, _ = expand_occurrences(pattern, anchor, datetime(2026, 1, 8), datetime(2026, 12, 31))
+    
+    assert expanded == [datetime(2026, 1, 8), datetime(2026, 1, 9), datetime(2026, 1, 10)]
+
+
+def test_expand_reports_truncation():
+    """Test the max_count cap is reported."""
+    pattern = RecurrencePattern(frequency="daily")
+    anchor = datetime(2026, 1, 1)
+    
+    expanded, truncated = expand_occurrences(
+        pattern, anchor, anchor, anchor + timedelta(days=30), max_count=5
+    )
+    
+    assert len(expanded) == 5
+    assert truncated is True
+
+
+# ===== Task Tests =====
+
+def test_compute_next_occurrence_for_task():
+    """Test next_occurrence_at is anchored on the due date."""
+    task = Task(
+        title="Standup",
+        due_date=datetime(2026, 1, 5, 10),
+        is_recurring=True,
+        recurrence_pattern={"frequency": "weekly", "interval": 1}
+    )
+    
+    assert compute_next_occurrence(task) == datetime(2026, 1, 12, 10)
+
+
+def test_compute_next_occurrence_non_recurring():
+    """Test non-recurring tasks have no next occurrence."""
+    task = Task(title="Once", due_date=datetime(2026, 1, 5, 10))
+    
+    assert compute_next_occurrence(task) is None
@@ -0,0 +1,98 @@
+"""
+Unit tests for the in-process reminder timer.
+[Task]: T-C-012 (Reminder Timer Tests)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §3.2
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from src.services import reminder_timer
+from src.services.reminder_timer import ReminderHeap, notify_reminder_changed
+
+
+# ===== ReminderHeap Tests =====
+
+def test_heap_pops_in_fire_time_order():
+    """Test due reminders come out earliest first."""
+    now = datetime.utcnow()
+    heap = ReminderHeap()
+    heap.schedule(1, now - timedelta(seconds=5))
+    heap.schedule(2, now - timedelta(seconds=30))
+    heap.schedule(3, now + timedelta(minutes=5))
+    
+    assert heap.pop_due(now) == [2, 1]
+    assert len(heap) == 1
+    assert heap.next_fire_time() == now + timedelta(minutes=5)
+
+
+def test_heap_reschedule_replaces_previous_time():
+    """Test rescheduling a task does not fire it at the old time."""
+    now = datetime.utcnow()
+    heap = ReminderHeap()
+    heap.schedule(1, now - timedelta(seconds=1))
+    heap.schedule(1, now + timedelta(hours=1))
+    
+    assert heap.pop_due(now) == []
+    assert heap.next_fire_time() == now + timedelta(hours=1)
+    assert len(heap) == 1
+
+
+def test_heap_cancel_and_none_remove_task():
+    """Test cancelled tasks (completed, deleted, reminder cleared) never fire."""
+    now = datetime.utcnow()
+    heap = ReminderHeap()
+    heap.schedule(1, now - timedelta(seconds=1))
+    heap.schedule(2, now - timedelta(seconds=1))
+    
+    heap.cancel(1)
+    heap.schedule(2, None)
+    
+    assert heap.pop_due(now) == []
+    assert heap.next_fire_time() is None
+    assert len(heap) == 0
+
+
+def test_heap_fires_each_task_once():
+    """Test a popped reminder is no longer scheduled."""
+    now = datetime.utcnow()
+    heap = ReminderHeap()
+    heap.schedule(1, now)
+    
+    assert heap.pop_due(now) == [1]
+    assert heap.pop_due(now + timedelta(days=1)) == []
+
+
+# ===== notify_reminder_changed Tests =====
+
+class FailingNotifySession:
+    """Session whose pg_notify fails; records savepoint use."""
+
+    def __init__(self):
+        self.log = []
+
+    def flush(self):
+        self.log.append("flush")
+
+    @contextmanager
+    def begin_nested(self):
+        self.log.append("savepoint")
+        try:
+            yield
+        except Exception:
+            self.log.append("rollback savepoint")
+            raise
+        self.log.append("release")
+
+    def execute(self, statement, params=None):
+        self.log.append("notify")
+        raise RuntimeError("notify failed")
+
+
+def test_failed_notify_only_rolls_back_its_savepoint(monkeypatch):
+    """Test a pg_notify error is contained in a savepoint and not raised."""
+    monkeypatch.setattr(reminder_timer.settings, "REMINDER_TIMER_ENABLED", "true")
+    session = FailingNotifySession()
+
+    notify_reminder_changed(session, 42)
+
+    assert session.log == ["flush", "savepoint", "notify", "rollback savepoint"]
@@ -0,0 +1,82 @@
+"""
+Tests for fast JSON responses and response compression.
+[Task]: T-026 (Fast JSON Responses Tests)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1
+"""
+
+import json
+from datetime import datetime, date
+from uuid import uuid4
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from src.models.task import Priority, RecurrenceFrequency
+from src.schemas.task import TaskListResponse, TaskResponse, TagResponse, RecurrencePatternResponse
+from src.utils import responses
+from src.utils.responses import CompressionMiddleware, FastJSONResponse
+
+
+def _task_list(count: int) -> TaskListResponse:
+    now = datetime(2026, 3, 1, 8, 30, 0, 250000)
+    return TaskListResponse(
+        tasks=[
+            TaskResponse(
+                id=i,
+                user_id=uuid4(),
+                title=f"Task {i} — ünïcode",
+                description=None,
+                completed=False,
+                priority=Priority.HIGH,
+                due_date=now,
+                reminder_time=None,
+                is_recurring=True,
+                recurrence_pattern=RecurrencePatternResponse(
+                    frequency=RecurrenceFrequency.MONTHLY,
+                    end_date=date(2026, 12, 31)
+                ),
+                tags=[TagResponse(id=1, name="work", color="#3B82F6", created_at=now)],
+                created_at=now,
+                updated_at=now
+            )
+            for i in range(count)
+        ],
+        count=count
+    )
+
+
+def test_fast_json_matches_default_encoding():
+    """Test that FastJSONResponse renders the same JSON as the default path."""
+    model = _task_list(3)
+    body = FastJSONResponse(model).body
+    assert json.loads(body) == jsonable_encoder(model)
+
+
+def test_compression_threshold_and_sse_passthrough(monkeypatch):
+    """Test gzip above the size threshold only, and never for SSE streams."""
+    monkeypatch.setattr(responses.settings, "RESPONSE_COMPRESSION_ENABLED", "true")
+    monkeypatch.setattr(responses.settings, "RESPONSE_COMPRESSION_MIN_SIZE", 1024)
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/big")
+    def big():
+        return FastJSONResponse(_task_list(20))
+
+    @app.get("/small")
+    def small():
+        return FastJSONResponse({"ok": True})
+
+    @app.post("/api/{user_id}/chat/stream")
+    def stream(user_id: str):
+        return StreamingResponse(iter([b"data: " + b"x" * 2000 + b"\n\n"]), media_type="text/event-stream")
+
+    client = TestClient(app)
+    headers = {"Accept-Encoding": "gzip"}
+
+    response = client.get("/big", headers=headers)
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["count"] == 20
+
+    assert "content-encoding" not in client.get("/small", headers=headers).headers
+    assert "content-encoding" not in client.post("/api/u/chat/stream", headers=headers).headers
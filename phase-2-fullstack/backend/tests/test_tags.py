@@ -12,8 +12,10 @@ from sqlmodel import Session, create_engine, SQLModel
 from sqlmodel.pool import StaticPool
 from src.main import app
 from src.database import get_session
-from src.models import User, Tag
-from src.utils.auth import create_access_token
+from src.config import settings
+from src.models import User, Tag, Task, TaskTag
+from src.utils import deps
+from src.utils.security import create_access_token
 
 
 # Test database setup
@@ -31,11 +33,13 @@ def session_fixture():
 
 
 @pytest.fixture(name="client")
-def client_fixture(session: Session):
+def client_fixture(session: Session, monkeypatch):
     """Create test client with dependency override."""
     def get_session_override():
         return session
     
+    # The auth dependency looks users up in its own session
+    monkeypatch.setattr(deps, "engine", session.get_bind())
     app.dependency_overrides[get_session] = get_session_override
     client = TestClient(app)
     yield client
@@ -60,7 +64,7 @@ def test_user_fixture(session: Session):
 @pytest.fixture(name="auth_headers")
 def auth_headers_fixture(test_user: User):
     """Create authentication headers."""
-    token = create_access_token({"sub": str(test_user.id)})
+    token = create_access_token(test_user.id, test_user.email, settings.BETTER_AUTH_SECRET)
     return {"Authorization": f"Bearer {token}"}
 
 
@@ -116,6 +120,42 @@ def test_create_tag_duplicate_name_fails(client: TestClient, test_user: User, au
     assert "already exists" in response.json()["detail"]
 
 
+def test_create_tag_duplicate_name_case_insensitive_fails(client: TestClient, test_user: User, auth_headers: dict):
+    """Test that tag names differing only by case are rejected for the same user."""
+    client.post(
+        f"/api/{test_user.id}/tags",
+        json={"name": "Work"},
+        headers=auth_headers
+    )
+    
+    response = client.post(
+        f"/api/{test_user.id}/tags",
+        json={"name": "WORK"},
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+    assert "already exists" in response.json()["detail"]
+
+
+def test_create_tag_same_name_as_other_user(client: TestClient, test_user: User, auth_headers: dict, session: Session):
+    """Test that tag names are scoped per user and may repeat across users."""
+    other_user = User(id=uuid4(), email="other@example.com", password_hash="hash")
+    session.add(other_user)
+    session.commit()
+    session.add(Tag(name="Work", color="#EF4444", created_by=other_user.id))
+    session.commit()
+    
+    response = client.post(
+        f"/api/{test_user.id}/tags",
+        json={"name": "Work"},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    
+    list_response = client.get(f"/api/{test_user.id}/tags", headers=auth_headers)
+    assert list_response.json()["count"] == 1
+
+
 def test_create_tag_invalid_color_fails(client: TestClient, test_user: User, auth_headers: dict):
     """Test that invalid hex color is rejected."""
     response = client.post(
@@ -216,6 +256,26 @@ def test_update_tag_name(client: TestClient, test_user: User, auth_headers: dict
     assert data["color"] == "#3B82F6"  # Color unchanged
 
 
+def test_update_tag_marks_tagged_tasks_changed(client: TestClient, test_user: User, auth_headers: dict, session: Session):
+    """Test renaming a tag bumps its tasks' version so delta sync resends them."""
+    tag = Tag(name="Errands", color="#3B82F6", created_by=test_user.id)
+    task = Task(user_id=test_user.id, title="Buy milk")
+    session.add_all([tag, task])
+    session.commit()
+    session.add(TaskTag(task_id=task.id, tag_id=tag.id))
+    session.commit()
+    version = task.version
+    
+    response = client.put(
+        f"/api/{test_user.id}/tags/{tag.id}",
+        json={"name": "Chores"},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    session.expire_all()
+    assert session.get(Task, task.id).version == version + 1
+
+
 def test_update_tag_color(client: TestClient, test_user: User, auth_headers: dict, session: Session):
     """Test updating tag color."""
     tag = Tag(name="ColorTag", color="#3B82F6", created_by=test_user.id)
@@ -309,7 +369,7 @@ def test_cannot_access_other_user_tags(client: TestClient, session: Session):
     session.refresh(tag)
     
     # User2 tries to access User1's tag
-    user2_token = create_access_token({"sub": str(user2.id)})
+    user2_token = create_access_token(user2.id, user2.email, settings.BETTER_AUTH_SECRET)
     user2_headers = {"Authorization": f"Bearer {user2_token}"}
     
     response = client.get(
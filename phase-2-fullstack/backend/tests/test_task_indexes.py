@@ -0,0 +1,148 @@
+"""
+EXPLAIN-based regression tests for task index coverage.
+[Task]: T-B-013 (Composite List Indexes), T-C-011 (Scheduler Partial Indexes),
+        T-B-014 (Agenda View)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1.2-5.1.4,
+        specs/005-phase-v-cloud/phase5-cloud.plan.md §4.1
+
+These tests need a real PostgreSQL database (the planner is what is under
+test): pg_engine, see conftest.py.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+from sqlmodel import text
+from src.models import User, Task, Priority
+from src.routers.tasks import SORT_FIELDS, _build_list_query, _apply_sort
+from src.routers.agenda import _agenda_query
+from src.services.reminder_scheduler import ReminderScheduler
+
+USERS = 20
+TASKS_PER_USER = 200
+
+
+@pytest.fixture(name="seeded", scope="module")
+def seeded_fixture(pg_engine):
+    """Seeded, analyzed task data in a throwaway schema."""
+    engine = pg_engine
+    now = datetime.utcnow()
+    priorities = list(Priority)
+    with engine.begin() as conn:
+        user_ids = [uuid4() for _ in range(USERS)]
+        conn.execute(User.__table__.insert(), [
+            {"id": uid, "email": f"{uid}@example.com", "password_hash": "hash",
+             "created_at": now, "updated_at": now}
+            for uid in user_ids
+        ])
+        conn.execute(Task.__table__.insert(), [
+            {
+                "user_id": uid,
+                "title": f"Task {i}",
+                "completed": i % 3 == 0,
+                "priority": priorities[i % len(priorities)],
+                "due_date": now + timedelta(hours=i - 50) if i % 2 else None,
+                "reminder_time": now + timedelta(minutes=i) if i % 5 == 0 else None,
+                "is_recurring": False,
+                "created_at": now - timedelta(minutes=i),
+                "updated_at": now - timedelta(minutes=i),
+            }
+            for uid in user_ids
+            for i in range(TASKS_PER_USER)
+        ])
+        conn.execute(text("ANALYZE"))
+
+    return engine, user_ids[0]
+
+
+def _plan_nodes(plan: dict) -> list:
+    """Flatten an EXPLAIN (FORMAT JSON) plan tree into a list of nodes."""
+    nodes = [plan]
+    for child in plan.get("Plans", []):
+        nodes.extend(_plan_nodes(child))
+    return nodes
+
+
+def _explain(engine, query) -> list:
+    """Return the plan nodes Postgres picks for a SQLModel query."""
+    compiled = query.compile(dialect=engine.dialect)
+    params = {
+        key: str(value) if isinstance(value, UUID) else value
+        for key, value in compiled.params.items()
+    }
+    with engine.connect() as conn:
+        # Rule out plans that only win because the table is small: if no
+        # index can serve the ORDER BY, the planner still has to Sort.
+        conn.execute(text("SET enable_seqscan = off"))
+        conn.execute(text("SET enable_sort = off"))
+        result = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+        plan = result.scalar()[0]["Plan"]
+    return _plan_nodes(plan)
+
+
+@pytest.mark.parametrize("completed", ["all", "pending", "completed"])
+@pytest.mark.parametrize("sort_by", sorted(SORT_FIELDS))
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+def test_list_tasks_sort_paths_use_composite_index(seeded, completed, sort_by, sort_order):
+    """Every supported filter/sort combination is an ordered index scan."""
+    engine, user_id = seeded
+    query = _build_list_query(user_id, completed=completed)
+    query = _apply_sort(query, sort_by, sort_order).limit(20)
+
+    nodes = _explain(engine, query)
+    node_types = [node["Node Type"] for node in nodes]
+
+    assert "Seq Scan" not in node_types, node_types
+    assert "Sort" not in node_types, node_types
+    assert "Incremental Sort" not in node_types, node_types
+
+    index_names = [node.get("Index Name") for node in nodes if node.get("Index Name")]
+    assert index_names, node_types
+    assert all(name.startswith("ix_tasks_user_") for name in index_names), index_names
+
+
+def test_due_reminders_use_partial_index(seeded):
+    """The reminder cron query reads only ix_tasks_pending_reminder."""
+    engine, _ = seeded
+    now = datetime.utcnow()
+    query = ReminderScheduler.due_reminders_query(now, now + timedelta(minutes=60))
+
+    nodes = _explain(engine, query)
+    index_names = {node["Index Name"] for node in nodes if node.get("Index Name")}
+
+    assert "ix_tasks_pending_reminder" in index_names, index_names
+    assert not any(
+        node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "tasks"
+        for node in nodes
+    )
+
+
+def test_overdue_tasks_use_partial_index(seeded):
+    """The overdue cron query reads only ix_tasks_pending_due."""
+    engine, _ = seeded
+    query = ReminderScheduler.overdue_tasks_query(datetime.utcnow())
+
+    nodes = _explain(engine, query)
+    index_names = {node["Index Name"] for node in nodes if node.get("Index Name")}
+
+    assert "ix_tasks_pending_due" in index_names, index_names
+    assert not any(
+        node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "tasks"
+        for node in nodes
+    )
+
+
+def test_agenda_range_query_avoids_seq_scan(seeded):
+    """The agenda range query is served from user-scoped indexes."""
+    engine, user_id = seeded
+    now = datetime.utcnow()
+    query = _agenda_query(user_id, now - timedelta(days=3), now + timedelta(days=31))
+
+    nodes = _explain(engine, query)
+    index_names = {node["Index Name"] for node in nodes if node.get("Index Name")}
+
+    assert "ix_tasks_user_due" in index_names, index_names
+    assert not any(
+        node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "tasks"
+        for node in nodes
+    )
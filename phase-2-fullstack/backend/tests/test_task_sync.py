@@ -0,0 +1,104 @@
+"""
+Tests for delta sync tokens and task tombstones.
+[Task]: T-028 (Delta Sync Tests)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1, §5.3
+"""
+
+import base64
+from datetime import datetime, timedelta
+import pytest
+from sqlmodel import Session, create_engine, select
+from sqlmodel.pool import StaticPool
+from src.models.user import User
+from src.models.task import Task
+from src.models.task_tombstone import TaskTombstone
+from src.services import task_sync
+
+
+def _token(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def test_sync_token_round_trip():
+    """Test that tokens are opaque, URL-safe and decode to the same sync point."""
+    point = task_sync.SyncPoint(987654321, datetime(2026, 3, 1, 12, 30, 15, 123456))
+    token = task_sync.encode_sync_token(point)
+    assert "=" not in token and "/" not in token and "+" not in token
+    assert task_sync.decode_sync_token(token) == point
+
+
+@pytest.mark.parametrize("token", [
+    "garbage!",
+    "",
+    _token("v3:1:2026-03-01"),
+    _token("v2:2026-03-01"),
+    _token("v2:x:2026-03-01"),
+    _token("v2:1:not-a-date"),
+])
+def test_invalid_sync_token(token):
+    """Test that malformed, foreign-version and incomplete tokens are rejected."""
+    with pytest.raises(task_sync.SyncTokenInvalid):
+        task_sync.decode_sync_token(token)
+
+
+def test_updated_at_token_requires_resync():
+    """Test that a token from the updated_at based protocol forces a full refetch."""
+    with pytest.raises(task_sync.SyncResyncRequired):
+        task_sync.decode_sync_token(_token("v1:2026-03-01T12:30:15"))
+
+
+def test_expired_token_requires_resync():
+    """Test that a token older than tombstone retention forces a full refetch."""
+    old = datetime.utcnow() - timedelta(days=task_sync.settings.SYNC_TOMBSTONE_RETENTION_DAYS + 1)
+    with pytest.raises(task_sync.SyncResyncRequired):
+        task_sync.get_changes(None, None, task_sync.SyncPoint(1, old))
+
+
+def test_record_and_prune_tombstones():
+    """Test that deletions leave tombstones and only expired ones are pruned."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    User.__table__.create(engine)
+    TaskTombstone.__table__.create(engine)
+    with Session(engine) as session:
+        user = User(email="sync@example.com", password_hash="x")
+        session.add(user)
+        session.commit()
+
+        task_sync.record_deletions(session, str(user.id), [11, 12])
+        session.commit()
+        expired = session.exec(select(TaskTombstone).where(TaskTombstone.task_id == 11)).one()
+        expired.deleted_at -= timedelta(days=task_sync.settings.SYNC_TOMBSTONE_RETENTION_DAYS + 1)
+        session.add(expired)
+        session.commit()
+
+        assert task_sync.prune_tombstones(session) == 1
+        remaining = session.exec(select(TaskTombstone.task_id)).all()
+        assert remaining == [12]
+
+
+def test_changes_follow_writing_transaction(monkeypatch):
+    """Test that inserts and updates stamp sync_xid and changes are read from the token's xmin."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    for model in (User, Task, TaskTombstone):
+        model.__table__.create(engine)
+    with Session(engine) as session:
+        user = User(email="xid@example.com", password_hash="x")
+        session.add(user)
+        session.commit()
+        old, edited = Task(user_id=user.id, title="old"), Task(user_id=user.id, title="edited")
+        session.add_all([old, edited])
+        session.commit()
+        assert old.sync_xid and edited.sync_xid
+
+        since = task_sync.SyncPoint(max(old.sync_xid, edited.sync_xid) + 1, datetime.utcnow())
+        edited.title = "edited again"
+        session.add(edited)
+        task_sync.record_deletions(session, user.id, [99])
+        session.commit()
+        assert edited.sync_xid >= since.xmin
+
+        monkeypatch.setattr(task_sync, "current_sync_point", lambda session: task_sync.SyncPoint(0, datetime.utcnow()))
+        tasks, deleted_ids, next_point = task_sync.get_changes(session, user.id, since)
+        assert [task.id for task in tasks] == [edited.id]
+        assert deleted_ids == [99]
+        assert next_point.xmin == since.xmin
@@ -0,0 +1,76 @@
+"""
+Tests for task row versions and If-Match.
+[Task]: T-029 (Optimistic Concurrency Tests)
+[From]: specs/005-phase-v-cloud/phase5-cloud.specify.md §5.1
+"""
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+from src.models.task import Task
+from src.utils.etag import if_match_satisfied, if_match_versions, make_etag, require_if_match
+
+
+def test_task_is_versioned():
+    """Test that ORM flushes of a task are guarded by its version column."""
+    assert Task.__mapper__.version_id_col is Task.__table__.c.version
+    assert Task(title="t", user_id="00000000-0000-0000-0000-000000000000").version == 1
+
+
+def test_if_match_strong_comparison():
+    """Test If-Match: absent and * allow any version, weak validators never match."""
+    etag = make_etag("task", 5, 3)
+    assert if_match_satisfied(None, etag)
+    assert if_match_satisfied("*", etag)
+    assert if_match_satisfied('"task-5-2", "task-5-3"', etag)
+    assert not if_match_satisfied('"task-5-2"', etag)
+    assert not if_match_satisfied('W/"task-5-3"', etag)
+
+
+def test_if_match_versions():
+    """Test extracting versions of one task from If-Match."""
+    app = FastAPI()
+
+    @app.get("/tasks/{task_id}")
+    def versions(task_id: int, request: Request):
+        return {"versions": if_match_versions(request, "task", task_id)}
+
+    client = TestClient(app)
+    assert client.get("/tasks/5").json() == {"versions": None}
+    assert client.get("/tasks/5", headers={"If-Match": "*"}).json() == {"versions": None}
+    assert client.get("/tasks/5", headers={"If-Match": '"task-5-3", "task-5-4"'}).json() == {"versions": [3, 4]}
+    # Another task's ETag, a weak validator, or garbage names no version of task 5
+    assert client.get("/tasks/5", headers={"If-Match": '"task-50-3", W/"task-5-3", "x"'}).json() == {"versions": []}
+
+
+def test_require_if_match_raises_412():
+    """Test that an outdated If-Match is answered 412."""
+    app = FastAPI()
+
+    @app.put("/tasks/5")
+    def write(request: Request):
+        require_if_match(request, make_etag("task", 5, 4))
+        return {"ok": True}
+
+    client = TestClient(app)
+    assert client.put("/tasks/5", headers={"If-Match": '"task-5-4"'}).status_code == 200
+    assert client.put("/tasks/5").status_code == 200
+    stale = client.put("/tasks/5", headers={"If-Match": '"task-5-3"'})
+    assert stale.status_code == 412
+
+
+def test_patch_is_one_conditional_update():
+    """Test the PATCH statement: version predicate, bump, and RETURNING."""
+    query = (
+        update(Task)
+        .where(Task.id == 5, Task.version.in_([3]))
+        .values(completed=True, version=Task.version + 1)
+        .returning(Task.id)
+    )
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE tasks SET")
+    assert "version=(tasks.version + " in sql
+    assert "tasks.version IN" in sql
+    assert "RETURNING tasks.id" in sql
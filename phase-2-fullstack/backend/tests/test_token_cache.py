@@ -0,0 +1,77 @@
+"""
+Tests for the verified-token cache.
+[Task]: T-023 (Verified Token Cache Tests)
+[From]: spec.md §8, plan.md §6
+"""
+
+import time
+from uuid import uuid4
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from src.utils import deps, token_cache
+from src.utils.token_cache import VerifiedTokenCache
+
+
+def test_cache_expires_at_token_exp(monkeypatch):
+    """Test that entries are served until exp and dropped after it."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(token_cache.time, "time", lambda: now[0])
+    cache = VerifiedTokenCache(max_entries=10)
+    user_id = uuid4()
+
+    cache.put("token", user_id, expires_at=now[0] + 60)
+    cache.put("no-exp", user_id, expires_at=None)
+    cache.put("stale", user_id, expires_at=now[0] - 1)
+    assert cache.get("token") == user_id
+    assert cache.get("no-exp") is None
+    assert cache.get("stale") is None
+
+    now[0] += 61
+    assert cache.get("token") is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    """Test the size bound."""
+    cache = VerifiedTokenCache(max_entries=2)
+    expires_at = time.time() + 60
+    ids = [uuid4() for _ in range(3)]
+
+    cache.put("a", ids[0], expires_at)
+    cache.put("b", ids[1], expires_at)
+    cache.get("a")
+    cache.put("c", ids[2], expires_at)
+
+    assert cache.get("a") == ids[0]
+    assert cache.get("b") is None
+    assert cache.get("c") == ids[2]
+
+
+def test_current_user_id_skips_decode_on_hit(monkeypatch):
+    """Test that a cached token needs neither JWT decode nor a user lookup."""
+    cache = VerifiedTokenCache(max_entries=10)
+    monkeypatch.setattr(deps, "get_token_cache", lambda: cache)
+    monkeypatch.setattr(deps.settings, "TOKEN_CACHE_ENABLED", "true")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("token should not be decoded")
+    monkeypatch.setattr(deps, "verify_token", fail)
+
+    user_id = uuid4()
+    cache.put("good-token", user_id, time.time() + 60)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="good-token")
+    assert deps.get_current_user_id(credentials) == user_id
+
+
+def test_invalid_token_is_not_cached(monkeypatch):
+    """Test that failed verification is rejected and leaves the cache empty."""
+    cache = VerifiedTokenCache(max_entries=10)
+    monkeypatch.setattr(deps, "get_token_cache", lambda: cache)
+    monkeypatch.setattr(deps.settings, "TOKEN_CACHE_ENABLED", "true")
+
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="not-a-jwt")
+    with pytest.raises(HTTPException) as exc:
+        deps.get_current_user_id(credentials)
+    assert exc.value.status_code == 401
+    assert len(cache) == 0
@@ -0,0 +1,63 @@
+import { NextRequest, NextResponse } from 'next/server'
+
+const API_URL = process.env.API_URL || process.env.NEXT_PUBLIC_API_URL || 'http://todo-backend:8000'
+
+export async function POST(
+  request: NextRequest,
+  { params }: { params: Promise<{ userId: string }> }
+) {
+  try {
+    const { userId } = await params
+    const body = await request.json()
+    const { conversation_id, message } = body
+
+    // Get JWT token from cookies
+    const { cookies } = await import('next/headers')
+    const cookieStore = await cookies()
+    const token = cookieStore.get('token')?.value
+
+    if (!token) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      )
+    }
+
+    // Forward request to backend streaming endpoint
+    const backendResponse = await fetch(`${API_URL}/api/${userId}/chat/stream`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'Authorization': `Bearer ${token}`
+      },
+      body: JSON.stringify({
+        conversation_id,
+        message
+      })
+    })
+
+    if (!backendResponse.ok || !backendResponse.body) {
+      const errorData = await backendResponse.json().catch(() => ({ detail: 'Chat request failed' }))
+      return NextResponse.json(
+        { error: errorData.detail || 'Chat request failed' },
+        { status: backendResponse.status }
+      )
+    }
+
+    // Pipe server-sent events through unbuffered
+    return new Response(backendResponse.body, {
+      headers: {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+      }
+    })
+
+  } catch (error: any) {
+    console.error('Chat stream API error:', error)
+    return NextResponse.json(
+      { error: error.message || 'Internal server error' },
+      { status: 500 }
+    )
+  }
+}
@@ -69,8 +69,8 @@ What would you like to do?`
     setIsLoading(true);
 
     try {
-      // Call Next.js API route which proxies to backend
-      const response = await fetch(`/api/chat/${userId}`, {
+      // Call Next.js API route which proxies the backend's SSE stream
+      const response = await fetch(`/api/chat/${userId}/stream`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json'
@@ -82,22 +82,48 @@ What would you like to do?`
         })
       });
 
-      if (!response.ok) {
+      if (!response.ok || !response.body) {
         throw new Error(`HTTP ${response.status}`);
       }
 
-      const data = await response.json();
-      
-      // Store conversation ID for subsequent messages
-      if (!conversationId) {
-        setConversationId(data.conversation_id);
+      // Placeholder assistant message, filled in as tokens arrive
+      setMessages(prev => [...prev, { role: 'assistant', content: '' }]);
+      const appendToken = (token: string) => {
+        setMessages(prev => {
+          const next = [...prev];
+          const last = next[next.length - 1];
+          next[next.length - 1] = { ...last, content: last.content + token };
+          return next;
+        });
+      };
+
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        // Server-sent events are separated by a blank line
+        const frames = buffer.split('\n\n');
+        buffer = frames.pop() ?? '';
+
+        for (const frame of frames) {
+          const event = frame.match(/^event: (.*)$/m)?.[1];
+          const data = frame.match(/^data: (.*)$/m)?.[1];
+          if (!event || !data) continue;
+          const payload = JSON.parse(data);
+
+          if (event === 'conversation' && !conversationId) {
+            // Store conversation ID for subsequent messages
+            setConversationId(payload.conversation_id);
+          } else if (event === 'token') {
+            appendToken(payload.content);
+          }
+        }
       }
-
-      // Add assistant response to UI
-      setMessages(prev => [...prev, { 
-        role: 'assistant', 
-        content: data.response 
-      }]);
     } catch (error) {
       console.error('Chat error:', error);
       setMessages(prev => [...prev, { 